@@ -12,6 +12,7 @@ from MiravejaCore.Shared.Configuration import AppConfig
 from MiravejaCore.Shared.DatabaseManager.Infrastructure.Factories import SqlDatabaseManagerFactory
 from MiravejaCore.Shared.DI import container
 from MiravejaCore.Shared.DI.Models import Container
+from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Events.Domain.Services import EventRegistry, eventRegistry  # pylint: disable=W0611
 from MiravejaCore.Shared.Keycloak.Domain.Models import KeycloakUser
 from MiravejaCore.Shared.Keycloak.Infrastructure.Http.DependencyProvider import KeycloakDependencyProvider
@@ -53,11 +54,20 @@ container.RegisterSingletons(
         ILogger.__name__: lambda container: LoggerFactory.CreateLogger(
             **appConfig.loggerConfig.model_dump()  # pylint: disable=no-member
         ),
-        # Database Engine
+        # Database Engine - single instance for connection pooling
         DatabaseEngine.__name__: lambda container: create_engine(
             str(
                 appConfig.databaseConfig.connectionUrl  # pylint: disable=no-member
-            )  # enclosed in str() to satisfy linter
+            ),  # enclosed in str() to satisfy linter
+            pool_size=appConfig.databaseConfig.maxConnections,  # pylint: disable=no-member
+            max_overflow=appConfig.databaseConfig.maxConnections // 2,  # pylint: disable=no-member
+            pool_pre_ping=True,
+        ),
+        # Session factory bound to the pooled engine, built once
+        sessionmaker.__name__: lambda container: sessionmaker(bind=container.Get(DatabaseEngine.__name__)),
+        # Unit of Work factory - stateless, every manager it creates draws from the engine's pool
+        SqlDatabaseManagerFactory.__name__: lambda container: SqlDatabaseManagerFactory(
+            resourceFactory=lambda: container.Get(DatabaseSession.__name__),
         ),
         # Boto3 S3 Client
         Boto3Session.client.__name__: lambda container: Boto3Session().client(
@@ -81,11 +91,7 @@ container.RegisterFactories(
         # Database Connection
         DatabaseConnection.__name__: lambda container: container.Get(DatabaseEngine.__name__).connect(),
         # Database Session
-        DatabaseSession.__name__: lambda container: sessionmaker(bind=container.Get(DatabaseEngine.__name__))(),
-        # Unit of Work
-        SqlDatabaseManagerFactory.__name__: lambda container: SqlDatabaseManagerFactory(
-            resourceFactory=lambda: container.Get(DatabaseSession.__name__),
-        ),
+        DatabaseSession.__name__: lambda container: container.Get(sessionmaker.__name__)(),
     }
 )
 
@@ -99,6 +105,9 @@ VectorDependencies.RegisterDependencies(container)
 # Initialize FastAPI app
 app: FastAPI = FastAPI(title=f"{appConfig.appName} API", version=appConfig.appVersion, redirect_slashes=False)
 
+# Let events dispatched in the background finish publishing before the process exits
+app.add_event_handler("shutdown", EventDispatcher.WaitForBackgroundDispatches)
+
 # Setup routers for API versioning
 apiV1Router: APIRouter = APIRouter(prefix=f"/{appConfig.appName.lower()}/api/v1")  # pylint: disable=E1101
 
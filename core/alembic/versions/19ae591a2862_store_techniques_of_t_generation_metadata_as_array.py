@@ -0,0 +1,46 @@
+"""Store techniques column of t_generation_metadata table as a varchar array instead of a comma-separated string
+
+Revision ID: 19ae591a2862
+Revises: e595925f59b8
+Create Date: 2026-10-18 10:41:07.318254
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "19ae591a2862"
+down_revision: Union[str, Sequence[str], None] = "e595925f59b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Convert techniques to an array in place; string_to_array keeps NULL as NULL
+    op.alter_column(
+        "t_generation_metadata",
+        "techniques",
+        existing_type=sa.String(length=255),
+        type_=postgresql.ARRAY(sa.String(length=64)),
+        existing_nullable=True,
+        postgresql_using="string_to_array(\"techniques\", ',')",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Convert techniques back to a comma-separated string in place
+    op.alter_column(
+        "t_generation_metadata",
+        "techniques",
+        existing_type=postgresql.ARRAY(sa.String(length=64)),
+        type_=sa.String(length=255),
+        existing_nullable=True,
+        postgresql_using="array_to_string(\"techniques\", ',')",
+    )
@@ -25,14 +25,23 @@ def upgrade() -> None:
     # Add thumbnailUri column to t_image_metadata table
     op.add_column("t_image_metadata", sa.Column("thumbnailUri", sa.String(length=500), nullable=True))
 
-    # Create index for better query performance
-    op.create_index("ix_t_image_metadata_thumbnailUri", "t_image_metadata", ["thumbnailUri"])
+    # Partial index: most rows have no thumbnailUri yet, so NULLs are kept out of the B-tree to keep it small
+    # CONCURRENTLY keeps t_image_metadata writable during the build, but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_t_image_metadata_thumbnailUri",
+            "t_image_metadata",
+            ["thumbnailUri"],
+            postgresql_where=sa.text('"thumbnailUri" IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # Drop the index
-    op.drop_index("ix_t_image_metadata_thumbnailUri", table_name="t_image_metadata")
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_t_image_metadata_thumbnailUri", table_name="t_image_metadata", postgresql_concurrently=True)
 
     # Drop the thumbnailUri column
     op.drop_column("t_image_metadata", "thumbnailUri")
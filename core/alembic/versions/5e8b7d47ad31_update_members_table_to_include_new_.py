@@ -10,7 +10,6 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
 
 
 # revision identifiers, used by Alembic.
@@ -22,37 +21,29 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema to include enriched member data structure."""
-    # Profile fields
-    op.add_column(
-        "t_member",
-        sa.Column(
-            "username",
-            sa.String(length=41),
-            nullable=False,
-            server_default=sa.text("'user_' || gen_random_uuid()::text"),
-        ),
+    # All new columns are added in one ALTER TABLE so Postgres takes the exclusive lock and rewrites the
+    # table once; the volatile username default would otherwise force a rewrite on its own statement.
+    op.execute(
+        sa.text(
+            """
+            ALTER TABLE t_member
+                -- Profile fields
+                ADD COLUMN username VARCHAR(41) NOT NULL DEFAULT ('user_' || gen_random_uuid()::text),
+                ADD COLUMN bio VARCHAR(500) NOT NULL DEFAULT '',
+                ADD COLUMN avatar_id INTEGER,
+                ADD COLUMN cover_id INTEGER,
+                -- Identity fields (first_name and last_name already exist)
+                ADD COLUMN gender VARCHAR(50),
+                ADD COLUMN date_of_birth TIMESTAMP WITH TIME ZONE,
+                -- Social fields (stored as JSONB arrays)
+                ADD COLUMN friends JSONB NOT NULL DEFAULT '[]',
+                ADD COLUMN followers JSONB NOT NULL DEFAULT '[]',
+                ADD COLUMN following JSONB NOT NULL DEFAULT '[]',
+                -- Member state
+                ADD COLUMN is_active BOOLEAN NOT NULL DEFAULT true
+            """
+        )
     )
-    op.add_column("t_member", sa.Column("bio", sa.String(length=500), nullable=False, server_default=""))
-    op.add_column("t_member", sa.Column("avatar_id", sa.Integer(), nullable=True))
-    op.add_column("t_member", sa.Column("cover_id", sa.Integer(), nullable=True))
-
-    # Identity fields (first_name and last_name already exist)
-    op.add_column("t_member", sa.Column("gender", sa.String(length=50), nullable=True))
-    op.add_column("t_member", sa.Column("date_of_birth", sa.DateTime(timezone=True), nullable=True))
-
-    # Social fields (stored as JSONB arrays)
-    op.add_column(
-        "t_member", sa.Column("friends", postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default="[]")
-    )
-    op.add_column(
-        "t_member", sa.Column("followers", postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default="[]")
-    )
-    op.add_column(
-        "t_member", sa.Column("following", postgresql.JSONB(astext_type=sa.Text()), nullable=False, server_default="[]")
-    )
-
-    # Member state
-    op.add_column("t_member", sa.Column("is_active", sa.Boolean(), nullable=False, server_default="true"))
 
     # Add unique constraint on username
     op.create_unique_constraint("uq_member_username", "t_member", ["username"])
@@ -8,11 +8,6 @@ Create Date: 2025-10-03 17:48:31.108586
 
 from typing import Sequence, Union
 
-from alembic import op
-import sqlalchemy as sa
-from sqlalchemy.dialects import postgresql
-
-
 # revision identifiers, used by Alembic.
 revision: str = "821aebd9f19f"
 down_revision: Union[str, Sequence[str], None] = None
@@ -22,11 +17,11 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # Just executing a simple command to test the migration setup
-    op.execute("SELECT 1")
+    # Baseline revision: no schema changes, alembic_version is stamped by the upgrade itself
+    pass
 
 
 def downgrade() -> None:
     """Downgrade schema."""
-    # Just executing a simple command to test the migration setup
-    op.execute("SELECT 2")
+    # Baseline revision: nothing to undo
+    pass
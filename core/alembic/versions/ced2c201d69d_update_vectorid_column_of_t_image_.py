@@ -22,23 +22,40 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Upgrade schema."""
-    # Drop the existing vectorId column
-    op.drop_column("t_image_metadata", "vectorId")
-
-    # Add the vectorId column back with UUID type
-    op.add_column("t_image_metadata", sa.Column("vectorId", postgresql.UUID(as_uuid=False), nullable=True))
-
-    # Create index for the new vectorId column for better query performance
-    op.create_index("ix_t_image_metadata_vectorId", "t_image_metadata", ["vectorId"])
+    # Convert vectorId to UUID in place; integer ids have no uuid mapping, so existing values become NULL
+    op.alter_column(
+        "t_image_metadata",
+        "vectorId",
+        existing_type=sa.Integer(),
+        type_=postgresql.UUID(as_uuid=False),
+        existing_nullable=True,
+        postgresql_using="NULL",
+    )
+
+    # Partial index: most rows have no vectorId yet, so NULLs are kept out of the B-tree to keep it small
+    # CONCURRENTLY keeps t_image_metadata writable during the build, but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_t_image_metadata_vectorId",
+            "t_image_metadata",
+            ["vectorId"],
+            postgresql_where=sa.text('"vectorId" IS NOT NULL'),
+            postgresql_concurrently=True,
+        )
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # Drop the index
-    op.drop_index("ix_t_image_metadata_vectorId", table_name="t_image_metadata")
-
-    # Drop the UUID vectorId column
-    op.drop_column("t_image_metadata", "vectorId")
-
-    # Add back the Integer vectorId column
-    op.add_column("t_image_metadata", sa.Column("vectorId", sa.Integer(), nullable=True))
+    with op.get_context().autocommit_block():
+        op.drop_index("ix_t_image_metadata_vectorId", table_name="t_image_metadata", postgresql_concurrently=True)
+
+    # Convert vectorId back to Integer in place; UUID values have no integer mapping, so they become NULL
+    op.alter_column(
+        "t_image_metadata",
+        "vectorId",
+        existing_type=postgresql.UUID(as_uuid=False),
+        type_=sa.Integer(),
+        existing_nullable=True,
+        postgresql_using="NULL::integer",
+    )
@@ -0,0 +1,47 @@
+"""Add updatedAt and (ownerId, uploadedAt) indexes to the t_image_metadata table
+
+Revision ID: e595925f59b8
+Revises: 30ccf79aacdc
+Create Date: 2026-10-18 10:12:41.503917
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e595925f59b8"
+down_revision: Union[str, Sequence[str], None] = "30ccf79aacdc"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # uri, ownerId and uploadedAt are already indexed; updatedAt is the remaining ListAll sort column
+    # Composite index serves "one owner's images, newest first" without a separate sort step
+    # CONCURRENTLY keeps t_image_metadata writable during the build, but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_t_image_metadata_updatedAt",
+            "t_image_metadata",
+            ["updatedAt"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_t_image_metadata_ownerId_uploadedAt",
+            "t_image_metadata",
+            ["ownerId", "uploadedAt"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Drop the indexes
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_t_image_metadata_ownerId_uploadedAt", table_name="t_image_metadata", postgresql_concurrently=True
+        )
+        op.drop_index("ix_t_image_metadata_updatedAt", table_name="t_image_metadata", postgresql_concurrently=True)
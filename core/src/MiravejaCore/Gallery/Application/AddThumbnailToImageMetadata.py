@@ -1,11 +1,17 @@
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
+from MiravejaCore.Gallery.Domain.Events import ImageThumbnailSetEvent
 from MiravejaCore.Gallery.Domain.Exceptions import ImageMetadataNotFoundException
 from MiravejaCore.Gallery.Domain.Models import ImageMetadata
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class AddThumbnailToImageMetadataCommand(BaseModel):
-    thumbnailUri: str = Field(..., description="New thumbnail URI to assign to the image")
+    thumbnailUri: str = Field(..., max_length=500, description="New thumbnail URI to assign to the image")
+
+    model_config = {"frozen": True}
 
 
 class AddThumbnailToImageMetadataHandler:
@@ -22,21 +28,22 @@ class AddThumbnailToImageMetadataHandler:
         self._logger = logger
 
     async def Handle(self, imageMetadataId, command: AddThumbnailToImageMetadataCommand) -> None:
-        self._logger.Info(f"Adding thumbnail to image metadata with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Adding thumbnail to image metadata with command: %s", LazyJson(command))
 
         with self._databaseManagerFactory.Create() as databaseManager:
             repository = databaseManager.GetRepository(self._tImageMetadataRepository)
-            imageMetadata: ImageMetadata = repository.FindById(imageMetadataId)
+            self._logger.Debug("Assigning thumbnail URI %s to image metadata", command.thumbnailUri)
+            imageMetadata: Optional[ImageMetadata] = repository.UpdateThumbnailUri(
+                imageMetadataId, command.thumbnailUri
+            )
 
             if not imageMetadata:
-                self._logger.Warning(f"Image metadata with ID {imageMetadataId.id} not found.")
+                self._logger.Warning("Image metadata with ID %s not found.", imageMetadataId.id)
                 raise ImageMetadataNotFoundException(imageMetadataId)
 
-            self._logger.Debug(f"Assigning thumbnail URI {command.thumbnailUri} to image metadata")
-            imageMetadata.SetThumbnailUri(command.thumbnailUri)
-
-            repository.Save(imageMetadata)
             databaseManager.Commit()
 
-        self._logger.Info(f"Image metadata updated successfully: {imageMetadata.model_dump_json(indent=4)}")
-        await self._eventDispatcher.DispatchAll(imageMetadata.ReleaseEvents())
+        imageMetadata.EmitEvent(ImageThumbnailSetEvent.FromModel(imageMetadata))
+        self._logger.Info("Image metadata updated successfully: %s", LazyJson(imageMetadata))
+        # The update is committed, so publishing the events does not need to hold up the caller
+        self._eventDispatcher.DispatchAllInBackground(imageMetadata.ReleaseEvents())
@@ -2,17 +2,21 @@ from typing import Type
 
 from pydantic import BaseModel, Field
 
+from MiravejaCore.Gallery.Domain.Events import ImageMetadataVectorIdAssignedEvent
 from MiravejaCore.Gallery.Domain.Exceptions import ImageMetadataNotFoundException
 from MiravejaCore.Gallery.Domain.Interfaces import IImageMetadataRepository
 from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManagerFactory
 from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import ImageMetadataId, VectorId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class AddVectorIdToImageMetadataCommand(BaseModel):
     vectorId: VectorId = Field(..., description="New vector ID to assign to the image")
 
+    model_config = {"frozen": True}
+
 
 class AddVectorIdToImageMetadataHandler:
     def __init__(
@@ -28,21 +32,20 @@ class AddVectorIdToImageMetadataHandler:
         self._logger = logger
 
     async def Handle(self, imageMetadataId: ImageMetadataId, command: AddVectorIdToImageMetadataCommand) -> None:
-        self._logger.Info(f"Adding vector ID to image metadata with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Adding vector ID to image metadata with command: %s", LazyJson(command))
 
         with self._databaseManagerFactory.Create() as databaseManager:
             repository = databaseManager.GetRepository(self._tImageMetadataRepository)
-            imageMetadata = repository.FindById(imageMetadataId)
+            self._logger.Debug("Assigning vector ID %s to image metadata", command.vectorId.id)
+            imageMetadata = repository.UpdateVectorId(imageMetadataId, command.vectorId)
 
             if not imageMetadata:
-                self._logger.Warning(f"Image metadata with ID {imageMetadataId.id} not found.")
+                self._logger.Warning("Image metadata with ID %s not found.", imageMetadataId.id)
                 raise ImageMetadataNotFoundException(imageMetadataId)
 
-            self._logger.Debug(f"Assigning vector ID {command.vectorId.id} to image metadata")
-            imageMetadata.AssignVectorId(command.vectorId)
-
-            repository.Save(imageMetadata)
             databaseManager.Commit()
 
-        self._logger.Info(f"Image metadata updated successfully: {imageMetadata.model_dump_json(indent=4)}")
-        await self._eventDispatcher.DispatchAll(imageMetadata.ReleaseEvents())
+        imageMetadata.EmitEvent(ImageMetadataVectorIdAssignedEvent.FromModel(imageMetadata, command.vectorId))
+        self._logger.Info("Image metadata updated successfully: %s", LazyJson(imageMetadata))
+        # The update is committed, so publishing the events does not need to hold up the caller
+        self._eventDispatcher.DispatchAllInBackground(imageMetadata.ReleaseEvents())
@@ -5,6 +5,7 @@ from MiravejaCore.Gallery.Domain.Interfaces import IImageMetadataRepository
 from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManagerFactory
 from MiravejaCore.Shared.Identifiers.Models import ImageMetadataId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 from MiravejaCore.Shared.Utils.Types.Handler import HandlerResponse
 
 
@@ -20,15 +21,13 @@ class FindImageMetadataByIdHandler:
         self._logger = logger
 
     def Handle(self, imageMetadataId: ImageMetadataId) -> Optional[HandlerResponse]:
-        self._logger.Info(f"Finding image metadata by ID: {imageMetadataId.id}")
+        self._logger.Info("Finding image metadata by ID: %s", imageMetadataId.id)
 
         with self._databaseManagerFactory.Create() as databaseManager:
             imageMetadata = databaseManager.GetRepository(self._tImageMetadataRepository).FindById(imageMetadataId)
         if not imageMetadata:
-            self._logger.Warning(f"Image metadata with ID {imageMetadataId.id} not found.")
+            self._logger.Warning("Image metadata with ID %s not found.", imageMetadataId.id)
             raise ImageMetadataNotFoundException(imageMetadataId)
 
-        self._logger.Info(
-            f"Image metadata with ID {imageMetadataId.id} found: {imageMetadata.model_dump_json(indent=4)}"
-        )
+        self._logger.Info("Image metadata with ID %s found: %s", imageMetadataId.id, LazyJson(imageMetadata))
         return imageMetadata.model_dump()
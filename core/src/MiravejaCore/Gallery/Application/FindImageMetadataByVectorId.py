@@ -7,6 +7,7 @@ from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManag
 from MiravejaCore.Shared.Errors.Models import DomainException
 from MiravejaCore.Shared.Identifiers.Models import VectorId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 from MiravejaCore.Shared.Utils.Types.Handler import HandlerResponse
 
 
@@ -26,17 +27,15 @@ class FindImageMetadataByVectorIdHandler:
         self._logger = logger
 
     def Handle(self, command: FindImageMetadataByVectorIdCommand) -> HandlerResponse:
-        self._logger.Info(f"Finding image metadata by Vector ID: {command.vectorId.id}")
+        self._logger.Info("Finding image metadata by Vector ID: %s", command.vectorId.id)
 
         with self._databaseManagerFactory.Create() as databaseManager:
             imageMetadata = databaseManager.GetRepository(self._tImageMetadataRepository).FindByVectorId(
                 command.vectorId
             )
         if not imageMetadata:
-            self._logger.Warning(f"Image metadata with Vector ID {command.vectorId.id} not found.")
+            self._logger.Warning("Image metadata with Vector ID %s not found.", command.vectorId.id)
             raise DomainException(f"Image metadata with Vector ID {command.vectorId.id} not found.")
 
-        self._logger.Info(
-            f"Image metadata with Vector ID {command.vectorId.id} found: {imageMetadata.model_dump_json(indent=4)}"
-        )
+        self._logger.Info("Image metadata with Vector ID %s found: %s", command.vectorId.id, LazyJson(imageMetadata))
         return imageMetadata.model_dump()
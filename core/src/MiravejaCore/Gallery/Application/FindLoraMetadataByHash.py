@@ -3,6 +3,7 @@ from typing import Optional, Type
 from MiravejaCore.Gallery.Domain.Interfaces import ILoraMetadataRepository
 from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManagerFactory
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 from MiravejaCore.Shared.Utils.Types.Handler import HandlerResponse
 
 
@@ -18,13 +19,13 @@ class FindLoraMetadataByHashHandler:
         self._logger = logger
 
     def Handle(self, hash: str) -> Optional[HandlerResponse]:
-        self._logger.Info(f"Finding LoRA metadata by hash: {hash}")
+        self._logger.Info("Finding LoRA metadata by hash: %s", hash)
 
         with self._databaseManagerFactory.Create() as databaseManager:
             loraMetadata = databaseManager.GetRepository(self._tLoraMetadataRepository).FindByHash(hash)
         if not loraMetadata:
-            self._logger.Warning(f"LoRA metadata with hash {hash} not found.")
+            self._logger.Warning("LoRA metadata with hash %s not found.", hash)
             return None
 
-        self._logger.Info(f"LoRA metadata with hash {hash} found: {loraMetadata.model_dump_json(indent=4)}")
+        self._logger.Info("LoRA metadata with hash %s found: %s", hash, LazyJson(loraMetadata))
         return loraMetadata.model_dump()
@@ -26,15 +26,15 @@ class GenerateThumbnailHandler:
         self.imageContentRepository = imageContentRepository
         self.logger = logger
         self.eventDispatcher = eventDispatcher
+        # The service's output format is fixed for its lifetime, so resolve the key extension once
+        self._extension: str = thumbnailGenerationService.format.ToExtension()
 
     async def Handle(self, command: GenerateThumbnailCommand) -> str:
         self.logger.Info("Handling GenerateThumbnailCommand.")
         thumbnailData = await self.thumbnailGenerationService.GenerateThumbnail(BytesIO(command.imageData))
         self.logger.Info("Thumbnail generated.")
 
-        key: str = (
-            f"{str(command.ownerId)}/thumbnails/{str(uuid4())}.{self.thumbnailGenerationService.format.ToExtension()}"
-        )
+        key: str = f"{command.ownerId}/thumbnails/{uuid4()}.{self._extension}"
 
         uri = await self.imageContentRepository.Upload(
             key=key,
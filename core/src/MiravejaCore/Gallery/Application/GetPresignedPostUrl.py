@@ -26,9 +26,14 @@ class GetPresignedPostUrlHandler:
         self.signedUrlService = signedUrlService
         self.logger = logger
 
+    @staticmethod
+    def GetKeyPrefix(ownerId: str) -> str:
+        """Key prefix every upload signed for the given owner is placed under."""
+        return f"{ownerId}/gallery/"
+
     async def Handle(self, command: GetPresignedPostUrlCommand, agent: KeycloakUser) -> HandlerResponse:
         try:
-            key: str = f"{agent.id}/gallery/{command.filename}"
+            key: str = f"{self.GetKeyPrefix(agent.id)}{command.filename}"
 
             presignedPostUrl = await self.imageContentRepository.GetPresignedPostUrl(
                 key=key,
@@ -3,6 +3,7 @@ from typing import Type
 from MiravejaCore.Gallery.Domain.Interfaces import IImageMetadataRepository
 from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManagerFactory
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 from MiravejaCore.Shared.Utils.Repository.Queries import ListAllQuery
 from MiravejaCore.Shared.Utils.Types.Handler import HandlerResponse
 
@@ -23,7 +24,7 @@ class ListAllImageMetadatasHandler:
         self._logger = logger
 
     def Handle(self, command: ListAllImageMetadatasCommand) -> HandlerResponse:
-        self._logger.Info(f"Listing all image metadatas with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Listing all image metadatas with command: %s", LazyJson(command))
         with self._databaseManagerFactory.Create() as databaseManager:
             repository: IImageMetadataRepository = databaseManager.GetRepository(self._tImageMetadataRepository)
             allImageMetadatas = repository.ListAll(command)
@@ -10,9 +10,10 @@ from MiravejaCore.Gallery.Application.RegisterLoraMetadata import (
 from MiravejaCore.Gallery.Domain.Enums import SamplerType, SchedulerType, TechniqueType
 from MiravejaCore.Gallery.Domain.Interfaces import IGenerationMetadataRepository
 from MiravejaCore.Gallery.Domain.Models import GenerationMetadata, LoraMetadata, Size
-from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManagerFactory
+from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManager, IDatabaseManagerFactory
 from MiravejaCore.Shared.Identifiers.Models import GenerationMetadataId, ImageMetadataId, LoraMetadataId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class RegisterGenerationMetadataCommand(BaseModel):
@@ -54,47 +55,62 @@ class RegisterGenerationMetadataHandler:
         self.registerLoraMetadataHandler = registerLoraMetadataHandler
         self.logger = logger
 
-    def Handle(self, imageId: ImageMetadataId, command: RegisterGenerationMetadataCommand) -> int:
-        self.logger.Info(f"Registering generation metadata with command: {command.model_dump_json(indent=4)}")
-
-        with self.databaseManagerFactory.Create() as databaseManager:
-            generationMetadataId: GenerationMetadataId = databaseManager.GetRepository(
-                self.tGenerationMetadataRepository
-            ).GenerateNewId()
-
-            self.logger.Debug(f"Creating generation metadata entity with ID: {generationMetadataId.id}")
-
-            loraMetadatas: List[LoraMetadata] = []
-            if command.loras:
-                for lora in command.loras:
-                    existingLora = self.findLoraMetadataByHashHandler.Handle(lora.hash)
-                    if existingLora is not None:
-                        self.logger.Debug(f"LoRA with hash {lora.hash} already exists with ID {existingLora['id']}")
-                        loraMetadatas.append(LoraMetadata.model_validate(existingLora))
-                    else:
-                        newLoraId = self.registerLoraMetadataHandler.Handle(lora)
-                        self.logger.Debug(f"Registered new LoRA with hash {lora.hash} and ID {newLoraId}")
-                        loraMetadatas.append(LoraMetadata(id=LoraMetadataId(id=newLoraId), **lora.model_dump()))
-
-            generationMetadata = GenerationMetadata.Register(
-                id=generationMetadataId,
-                imageId=imageId,
-                prompt=command.prompt,
-                negativePrompt=command.negativePrompt,
-                seed=command.seed,
-                model=command.model,
-                sampler=command.sampler,
-                scheduler=command.scheduler,
-                steps=command.steps,
-                cfgScale=command.cfgScale,
-                size=command.size,
-                loras=loraMetadatas,
-                techniques=command.techniques,
-            )
-
-            databaseManager.GetRepository(self.tGenerationMetadataRepository).Save(generationMetadata)
-            databaseManager.Commit()
-
-        self.logger.Info(f"Generation metadata registered with ID: {generationMetadataId.id}")
+    def Handle(
+        self,
+        imageId: ImageMetadataId,
+        command: RegisterGenerationMetadataCommand,
+        databaseManager: Optional[IDatabaseManager] = None,
+    ) -> int:
+        self.logger.Info("Registering generation metadata with command: %s", LazyJson(command))
+
+        if databaseManager is not None:
+            # Join the caller's unit of work; the caller owns the commit
+            generationMetadataId = self._Register(databaseManager, imageId, command)
+        else:
+            with self.databaseManagerFactory.Create() as ownDatabaseManager:
+                generationMetadataId = self._Register(ownDatabaseManager, imageId, command)
+                ownDatabaseManager.Commit()
+
+        self.logger.Info("Generation metadata registered with ID: %s", generationMetadataId.id)
 
         return generationMetadataId.id
+
+    def _Register(
+        self, databaseManager: IDatabaseManager, imageId: ImageMetadataId, command: RegisterGenerationMetadataCommand
+    ) -> GenerationMetadataId:
+        repository = databaseManager.GetRepository(self.tGenerationMetadataRepository)
+        generationMetadataId: GenerationMetadataId = repository.GenerateNewId()
+
+        self.logger.Debug("Creating generation metadata entity with ID: %s", generationMetadataId.id)
+
+        loraMetadatas: List[LoraMetadata] = []
+        if command.loras:
+            for lora in command.loras:
+                existingLora = self.findLoraMetadataByHashHandler.Handle(lora.hash)
+                if existingLora is not None:
+                    self.logger.Debug("LoRA with hash %s already exists with ID %s", lora.hash, existingLora["id"])
+                    loraMetadatas.append(LoraMetadata.model_validate(existingLora))
+                else:
+                    newLoraId = self.registerLoraMetadataHandler.Handle(lora)
+                    self.logger.Debug("Registered new LoRA with hash %s and ID %s", lora.hash, newLoraId)
+                    loraMetadatas.append(LoraMetadata(id=LoraMetadataId(id=newLoraId), **lora.model_dump()))
+
+        generationMetadata = GenerationMetadata.Register(
+            id=generationMetadataId,
+            imageId=imageId,
+            prompt=command.prompt,
+            negativePrompt=command.negativePrompt,
+            seed=command.seed,
+            model=command.model,
+            sampler=command.sampler,
+            scheduler=command.scheduler,
+            steps=command.steps,
+            cfgScale=command.cfgScale,
+            size=command.size,
+            loras=loraMetadatas,
+            techniques=command.techniques,
+        )
+
+        repository.Save(generationMetadata)
+
+        return generationMetadataId
@@ -1,7 +1,9 @@
-from typing import Optional, Type
+import asyncio
+from typing import Any, List, Optional, Type
 
 from pydantic import BaseModel, Field
 
+from MiravejaCore.Gallery.Application.GetPresignedPostUrl import GetPresignedPostUrlHandler
 from MiravejaCore.Gallery.Application.RegisterGenerationMetadata import (
     RegisterGenerationMetadataCommand,
     RegisterGenerationMetadataHandler,
@@ -17,6 +19,9 @@ from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManag
 from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import ImageMetadataId, MemberId, VectorId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
+
+MAX_CONCURRENT_STORAGE_CHECKS = 32
 
 
 class RegisterImageMetadataCommand(BaseModel):
@@ -34,6 +39,17 @@ class RegisterImageMetadataCommand(BaseModel):
     )
     vectorId: Optional[VectorId] = Field(None, description="Identifier linking to the associated vector data")
 
+    @classmethod
+    def FromTrusted(cls, **data: Any) -> "RegisterImageMetadataCommand":
+        """
+        Build a command from data that was already validated, e.g. replayed from stored image metadata.
+
+        Field validation and coercion are skipped, so values must already have their declared types
+        (ImageRepositoryType, RegisterGenerationMetadataCommand, VectorId). Untrusted input must keep going
+        through the regular constructor.
+        """
+        return cls.model_construct(**data)
+
 
 class RegisterImageMetadataHandler:
     def __init__(
@@ -44,6 +60,7 @@ class RegisterImageMetadataHandler:
         imageContentRepository: IImageContentRepository,
         eventDispatcher: EventDispatcher,
         logger: ILogger,
+        trustPresignedUploads: bool = False,
     ):
         self._databaseManagerFactory = databaseManagerFactory
         self._tImageMetadataRepository = tImageMetadataRepository
@@ -51,65 +68,142 @@ class RegisterImageMetadataHandler:
         self._imageContentRepository = imageContentRepository
         self._eventDispatcher = eventDispatcher
         self._logger = logger
+        self._trustPresignedUploads = trustPresignedUploads
 
     async def Handle(self, command: RegisterImageMetadataCommand) -> int:
-        self._logger.Info(f"Registering image metadata with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Registering image metadata with command: %s", LazyJson(command))
+
+        # Validated once and shared by the ownership check and the new entity
+        ownerId = MemberId(id=command.ownerId)
+
+        # The storage check runs before the transaction opens, so no connection is held while it is awaited
+        if command.repositoryType == ImageRepositoryType.S3:
+            await self._EnsureImageContentIsOwned(command, ownerId)
+        # @todo Handle other repository types (e.g., DevianArt, etc.)
 
         with self._databaseManagerFactory.Create() as databaseManager:
             repository = databaseManager.GetRepository(self._tImageMetadataRepository)
 
             # Check for existing image metadata with the same URI
-            existingImageMetadata = repository.FindByUri(command.uri)
-            if existingImageMetadata:
-                self._logger.Warning(f"Image metadata with URI {command.uri} already exists.")
+            if repository.FindExistingUris({command.uri}):
+                self._logger.Warning("Image metadata with URI %s already exists.", command.uri)
                 raise ImageMetadataUriAlreadyExistsException(command.uri)
 
-            if command.repositoryType == ImageRepositoryType.S3:
-                # Check if the image was indeed uploaded to storage
-                if not await self._imageContentRepository.Exists(command.uri):
-                    self._logger.Warning(f"Image content with URI {command.uri} does not exist.")
-                    raise ImageContentNotFoundException(command.uri)
-                # Check if the image was uploaded by the claimed owner
-                if not await self._imageContentRepository.IsOwnedBy(command.uri, MemberId(id=command.ownerId)):
-                    self._logger.Warning(
-                        f"Image content with URI {command.uri} is not owned by member ID {command.ownerId}."
-                    )
-                    raise ImageContentNotFoundException(command.uri)
-            # @todo Handle other repository types (e.g., DevianArt, etc.)
-
-            imageMetadataId: ImageMetadataId = repository.GenerateNewId()
-
-            self._logger.Debug(f"Creating image metadata entity with ID: {imageMetadataId.id}")
-
-            ownerId = MemberId(id=command.ownerId)
-            size = Size(width=command.width, height=command.height)
-
-            imageMetadata = ImageMetadata.Register(
-                id=imageMetadataId,
-                ownerId=ownerId,
-                title=command.title,
-                subtitle=command.subtitle,
-                description=command.description,
-                size=size,
-                repositoryType=command.repositoryType,
-                uri=command.uri,
-                isAiGenerated=command.isAiGenerated,
-                generationMetadata=None,
-                vectorId=command.vectorId,
-            )
-
+            imageMetadata = self._CreateImageMetadata(command, ownerId, repository.GenerateNewId())
             repository.Save(imageMetadata)
-            databaseManager.Commit()
 
-            # Handle generation metadata if the image is AI-generated
+            # Handle generation metadata if the image is AI-generated, in the same transaction as the image
             if command.isAiGenerated and command.generationMetadata:
                 self._registerGenerationMetadataHandler.Handle(
-                    imageId=imageMetadataId, command=command.generationMetadata
+                    imageId=imageMetadata.id, command=command.generationMetadata, databaseManager=databaseManager
                 )
 
             databaseManager.Commit()
-        self._logger.Info(f"Image metadata registered with ID: {imageMetadataId.id}")
+        self._logger.Info("Image metadata registered with ID: %s", imageMetadata.id.id)
+
+        # The metadata is committed, so subscribers do not need to hold up the caller
+        self._eventDispatcher.DispatchAllInBackground(imageMetadata.ReleaseEvents())
+
+        return imageMetadata.id.id
+
+    async def HandleBatch(self, commands: List[RegisterImageMetadataCommand]) -> List[int]:
+        self._logger.Info("Registering a batch of %s image metadata", len(commands))
+
+        ownerIds = [MemberId(id=command.ownerId) for command in commands]
 
-        await self._eventDispatcher.DispatchAll(imageMetadata.ReleaseEvents())
+        # Storage checks run before the transaction opens, so no connection is held while they are awaited;
+        # the semaphore keeps a large batch from opening one storage request per image at once
+        storageChecks = asyncio.Semaphore(MAX_CONCURRENT_STORAGE_CHECKS)
 
-        return imageMetadataId.id
+        async def EnsureImageContentIsOwnedLimited(command: RegisterImageMetadataCommand, ownerId: MemberId) -> None:
+            async with storageChecks:
+                await self._EnsureImageContentIsOwned(command, ownerId)
+
+        await asyncio.gather(
+            *(
+                EnsureImageContentIsOwnedLimited(command, ownerId)
+                for command, ownerId in zip(commands, ownerIds)
+                if command.repositoryType == ImageRepositoryType.S3
+            )
+        )
+
+        with self._databaseManagerFactory.Create() as databaseManager:
+            repository = databaseManager.GetRepository(self._tImageMetadataRepository)
+
+            # Reject URIs already registered, or repeated within the batch itself
+            takenUris = repository.FindExistingUris({command.uri for command in commands})
+            for command in commands:
+                if command.uri in takenUris:
+                    self._logger.Warning("Image metadata with URI %s already exists.", command.uri)
+                    raise ImageMetadataUriAlreadyExistsException(command.uri)
+                takenUris.add(command.uri)
+
+            # One nextval round-trip reserves the IDs for the whole batch
+            imageMetadataIds = repository.GenerateNewIds(len(commands))
+            imageMetadatas = [
+                self._CreateImageMetadata(command, ownerId, imageMetadataId)
+                for command, ownerId, imageMetadataId in zip(commands, ownerIds, imageMetadataIds)
+            ]
+            repository.SaveMany(imageMetadatas)
+
+            for command, imageMetadata in zip(commands, imageMetadatas):
+                if command.isAiGenerated and command.generationMetadata:
+                    self._registerGenerationMetadataHandler.Handle(
+                        imageId=imageMetadata.id, command=command.generationMetadata, databaseManager=databaseManager
+                    )
+
+            databaseManager.Commit()
+        self._logger.Info(
+            "Image metadata batch registered with IDs: %s", [imageMetadata.id.id for imageMetadata in imageMetadatas]
+        )
+
+        self._eventDispatcher.DispatchAllInBackground(
+            [event for imageMetadata in imageMetadatas for event in imageMetadata.ReleaseEvents()]
+        )
+
+        return [imageMetadata.id.id for imageMetadata in imageMetadatas]
+
+    async def _EnsureImageContentIsOwned(self, command: RegisterImageMetadataCommand, ownerId: MemberId) -> None:
+        if self._trustPresignedUploads:
+            # The presigned POST policy already bound the upload to the owner's key prefix, so storage is not asked;
+            # the URI must therefore start with that prefix in our own storage and must not climb out of it
+            ownerUriPrefix = self._imageContentRepository.GetKeyUri(
+                GetPresignedPostUrlHandler.GetKeyPrefix(command.ownerId)
+            )
+            if not command.uri.startswith(ownerUriPrefix) or ".." in command.uri[len(ownerUriPrefix) :].split("/"):
+                self._logger.Warning(
+                    "Image content with URI %s is not owned by member ID %s.", command.uri, command.ownerId
+                )
+                raise ImageContentNotFoundException(command.uri)
+            return
+
+        exists, isOwned = await self._imageContentRepository.ExistsAndIsOwnedBy(command.uri, ownerId)
+        # Check if the image was indeed uploaded to storage
+        if not exists:
+            self._logger.Warning("Image content with URI %s does not exist.", command.uri)
+            raise ImageContentNotFoundException(command.uri)
+        # Check if the image was uploaded by the claimed owner
+        if not isOwned:
+            self._logger.Warning(
+                "Image content with URI %s is not owned by member ID %s.", command.uri, command.ownerId
+            )
+            raise ImageContentNotFoundException(command.uri)
+
+    def _CreateImageMetadata(
+        self, command: RegisterImageMetadataCommand, ownerId: MemberId, imageMetadataId: ImageMetadataId
+    ) -> ImageMetadata:
+        self._logger.Debug("Creating image metadata entity with ID: %s", imageMetadataId.id)
+
+        return ImageMetadata.Register(
+            id=imageMetadataId,
+            ownerId=ownerId,
+            title=command.title,
+            subtitle=command.subtitle,
+            description=command.description,
+            size=Size(width=command.width, height=command.height),
+            repositoryType=command.repositoryType,
+            uri=command.uri,
+            isAiGenerated=command.isAiGenerated,
+            generationMetadata=None,
+            vectorId=command.vectorId,
+        )
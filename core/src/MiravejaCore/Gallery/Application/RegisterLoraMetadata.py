@@ -6,6 +6,7 @@ from MiravejaCore.Gallery.Domain.Interfaces import ILoraMetadataRepository
 from MiravejaCore.Gallery.Domain.Models import LoraMetadata
 from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManagerFactory
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class RegisterLoraMetadataCommand(BaseModel):
@@ -25,18 +26,19 @@ class RegisterLoraMetadataHandler:
         self._logger = logger
 
     def Handle(self, command: RegisterLoraMetadataCommand) -> int:
-        self._logger.Info(f"Registering LoRA metadata with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Registering LoRA metadata with command: %s", LazyJson(command))
 
         with self._databaseManagerFactory.Create() as databaseManager:
-            loraMetadataId = databaseManager.GetRepository(self._tLoraMetadataRepository).GenerateNewId()
+            repository = databaseManager.GetRepository(self._tLoraMetadataRepository)
+            loraMetadataId = repository.GenerateNewId()
 
-            self._logger.Debug(f"Creating LoRA metadata entity with ID: {loraMetadataId}")
+            self._logger.Debug("Creating LoRA metadata entity with ID: %s", loraMetadataId)
 
             loraMetadata = LoraMetadata.Register(id=loraMetadataId, hash=command.hash, name=command.name)
 
-            databaseManager.GetRepository(self._tLoraMetadataRepository).Save(loraMetadata)
+            repository.Save(loraMetadata)
             databaseManager.Commit()
 
-        self._logger.Info(f"LoRA metadata registered with ID: {loraMetadataId}")
+        self._logger.Info("LoRA metadata registered with ID: %s", loraMetadataId)
 
         return loraMetadataId.id
@@ -8,6 +8,7 @@ from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManag
 from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import ImageMetadataId, VectorId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class UpdateImageMetadataCommand(BaseModel):
@@ -32,14 +33,14 @@ class UpdateImageMetadataHandler:
         self._logger = logger
 
     async def Handle(self, imageMetadataId: ImageMetadataId, command: UpdateImageMetadataCommand) -> None:
-        self._logger.Info(f"Updating image metadata with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Updating image metadata with command: %s", LazyJson(command))
 
         with self._databaseManagerFactory.Create() as databaseManager:
             repository = databaseManager.GetRepository(self._tImageMetadataRepository)
             imageMetadata = repository.FindById(imageMetadataId)
 
             if not imageMetadata:
-                self._logger.Warning(f"Image metadata with ID {imageMetadataId.id} not found.")
+                self._logger.Warning("Image metadata with ID %s not found.", imageMetadataId.id)
                 raise ImageMetadataNotFoundException(imageMetadataId)
 
             # Update fields if any text field is provided
@@ -53,17 +54,17 @@ class UpdateImageMetadataHandler:
             # Handle vector ID operations
             if command.removeVectorId:
                 if imageMetadata.vectorId is not None:
-                    self._logger.Debug(f"Removing vector ID {imageMetadata.vectorId.id} from image metadata")
+                    self._logger.Debug("Removing vector ID %s from image metadata", imageMetadata.vectorId.id)
                     imageMetadata.UnassignVectorId()
                 else:
                     self._logger.Debug("No vector ID to remove from image metadata")
             elif command.vectorId is not None:
                 vectorId = VectorId(id=command.vectorId)
-                self._logger.Debug(f"Assigning vector ID {vectorId.id} to image metadata")
+                self._logger.Debug("Assigning vector ID %s to image metadata", vectorId.id)
                 imageMetadata.AssignVectorId(vectorId)
 
             repository.Save(imageMetadata)
             databaseManager.Commit()
 
-        self._logger.Info(f"Image metadata updated successfully: {imageMetadata.model_dump_json(indent=4)}")
+        self._logger.Info("Image metadata updated successfully: %s", LazyJson(imageMetadata))
         await self._eventDispatcher.DispatchAll(imageMetadata.ReleaseEvents())
@@ -15,6 +15,13 @@ class GalleryConfig(BaseModel):
     thumbnailFormat: MimeType = Field(
         default=MimeType.JPEG, description="Default image format for generated thumbnails"
     )
+    trustPresignedUploads: bool = Field(
+        default=False,
+        description=(
+            "Skip the storage round-trip when registering S3 images and rely on the presigned POST policy, "
+            "only checking that the URI lies under the owner's upload prefix"
+        ),
+    )
 
     @classmethod
     def FromEnv(cls) -> "GalleryConfig":
@@ -24,4 +31,5 @@ class GalleryConfig(BaseModel):
                 height=int(os.getenv("GALLERY_THUMBNAIL_HEIGHT", "150")),
             ),
             thumbnailFormat=MimeType(os.getenv("GALLERY_THUMBNAIL_FORMAT", "image/jpeg")),
+            trustPresignedUploads=os.getenv("GALLERY_TRUST_PRESIGNED_UPLOADS", "false").lower() in ("true", "1", "yes"),
         )
@@ -4,6 +4,26 @@ from MiravejaCore.Shared.Events.Domain.Interfaces import DomainEvent
 from MiravejaCore.Shared.Events.Domain.Services import eventRegistry
 
 
+def _ImageMetadataPayload(imageMetadata) -> Dict[str, Any]:
+    """Build the event payload for an image metadata, without its ID and timestamps."""
+    return {
+        "ownerId": str(imageMetadata.ownerId),
+        "title": imageMetadata.title,
+        "subtitle": imageMetadata.subtitle,
+        "description": imageMetadata.description,
+        "width": imageMetadata.size.width,
+        "height": imageMetadata.size.height,
+        "repositoryType": imageMetadata.repositoryType,
+        "uri": imageMetadata.uri,
+        "thumbnailUri": imageMetadata.thumbnailUri,
+        "isAiGenerated": imageMetadata.isAiGenerated,
+        "generationMetadata": (
+            imageMetadata.generationMetadata.model_dump() if imageMetadata.generationMetadata else None
+        ),
+        "vectorId": str(imageMetadata.vectorId) if imageMetadata.vectorId else None,
+    }
+
+
 @eventRegistry.RegisterEvent(eventType="image.metadata.registered", eventVersion=1)
 class ImageMetadataRegisteredEvent(DomainEvent):
     """Event representing the registration of new image metadata."""
@@ -24,10 +44,11 @@ class ImageMetadataRegisteredEvent(DomainEvent):
         Returns:
             ImageMetadataRegisteredEvent: The created event.
         """
-        return cls(
+        # The fields come from an already validated ImageMetadata, so the event skips re-validation
+        return cls.model_construct(
             aggregateId=int(imageMetadata.id),
             imageMetadataId=int(imageMetadata.id),
-            data=imageMetadata.model_dump(exclude={"id", "uploadedAt", "updatedAt"}),
+            data=_ImageMetadataPayload(imageMetadata),
         )
 
 
@@ -53,11 +74,16 @@ class ImageMetadataUpdatedEvent(DomainEvent):
         Returns:
             ImageMetadataUpdatedEvent: The created event.
         """
-        return cls(
+        oldData = _ImageMetadataPayload(oldImageMetadata)
+        newData = _ImageMetadataPayload(newImageMetadata)
+        # Only the fields that actually changed travel with the event
+        changedKeys = [key for key in newData if oldData[key] != newData[key]]
+
+        return cls.model_construct(
             aggregateId=int(newImageMetadata.id),
             imageMetadataId=int(newImageMetadata.id),
-            oldData=oldImageMetadata.model_dump(exclude={"id", "uploadedAt", "updatedAt"}),
-            newData=newImageMetadata.model_dump(exclude={"id", "uploadedAt", "updatedAt"}),
+            oldData={key: oldData[key] for key in changedKeys},
+            newData={key: newData[key] for key in changedKeys},
         )
 
 
@@ -80,7 +106,7 @@ class ImageMetadataVectorIdAssignedEvent(DomainEvent):
             imageMetadata (ImageMetadata): The image metadata model.
             vectorId (VectorId): The assigned vector ID.
         """
-        return cls(
+        return cls.model_construct(
             aggregateId=int(imageMetadata.id),
             imageMetadataId=int(imageMetadata.id),
             vectorId=str(vectorId.id),
@@ -106,7 +132,7 @@ class ImageMetadataVectorIdUnassignedEvent(DomainEvent):
             imageMetadata (ImageMetadata): The image metadata model.
             vectorId (VectorId): The unassigned vector ID.
         """
-        return cls(
+        return cls.model_construct(
             aggregateId=int(imageMetadata.id),
             imageMetadataId=int(imageMetadata.id),
             vectorId=str(vectorId.id),
@@ -130,7 +156,7 @@ class ImageThumbnailSetEvent(DomainEvent):
         Args:
             imageMetadata (ImageMetadata): The image metadata model.
         """
-        return cls(
+        return cls.model_construct(
             aggregateId=int(imageMetadata.id),
             imageMetadataId=int(imageMetadata.id),
             thumbnailUri=imageMetadata.thumbnailUri,
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, BinaryIO, Dict, Iterator, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
 
 from MiravejaCore.Gallery.Domain.Models import GenerationMetadata, ImageMetadata, LoraMetadata, Size
 from MiravejaCore.Shared.Identifiers.Models import (
@@ -37,6 +37,10 @@ class IImageMetadataRepository(ABC):
     def FindByUri(self, uri: str) -> Optional[ImageMetadata]:
         pass
 
+    @abstractmethod
+    def FindExistingUris(self, uris: Set[str]) -> Set[str]:
+        """Return the subset of the given URIs that are already registered, in a single query."""
+
     @abstractmethod
     def FindByVectorId(self, vectorId: VectorId) -> Optional[ImageMetadata]:
         pass
@@ -49,10 +53,26 @@ class IImageMetadataRepository(ABC):
     def Save(self, imageMetadata: ImageMetadata) -> None:
         pass
 
+    @abstractmethod
+    def SaveMany(self, imageMetadatas: List[ImageMetadata]) -> None:
+        """Stage new image metadata for insertion; they are written together when the transaction flushes."""
+
+    @abstractmethod
+    def UpdateThumbnailUri(self, imageId: ImageMetadataId, thumbnailUri: str) -> Optional[ImageMetadata]:
+        """Set the thumbnail URI in a single statement and return the updated metadata, or None if not found."""
+
+    @abstractmethod
+    def UpdateVectorId(self, imageId: ImageMetadataId, vectorId: VectorId) -> Optional[ImageMetadata]:
+        """Set the vector ID in a single statement and return the updated metadata, or None if not found."""
+
     @abstractmethod
     def GenerateNewId(self) -> ImageMetadataId:
         pass
 
+    @abstractmethod
+    def GenerateNewIds(self, count: int) -> List[ImageMetadataId]:
+        """Reserve `count` new IDs in a single round-trip."""
+
 
 class IGenerationMetadataRepository(ABC):
     """Interface for generation metadata repository."""
@@ -121,6 +141,14 @@ class IImageContentRepository(ABC):
     async def IsOwnedBy(self, imageUri: str, ownerId: MemberId) -> bool:
         pass
 
+    @abstractmethod
+    async def ExistsAndIsOwnedBy(self, imageUri: str, ownerId: MemberId) -> Tuple[bool, bool]:
+        pass
+
+    @abstractmethod
+    def GetKeyUri(self, key: str) -> str:
+        """URI under which the object stored at the given key is served."""
+
 
 class IThumbnailGenerationService(ABC):
     """Interface for image thumbnail generation."""
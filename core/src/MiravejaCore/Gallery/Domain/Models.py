@@ -104,6 +104,18 @@ class LoraMetadata(BaseModel):
         """Factory method to create a new LoraMetadata instance."""
         return cls(id=id, hash=hash, name=name, generationMetadatas=[])
 
+    @classmethod
+    def FromDatabase(cls, id: int, hash: str, name: Optional[str], generationMetadatas: List[int]) -> "LoraMetadata":
+        """Rebuild a stored LoraMetadata without re-running validation; only for rows the database already holds."""
+        return cls.model_construct(
+            id=LoraMetadataId.model_construct(id=id),
+            hash=hash,
+            name=name,
+            generationMetadatas=[
+                GenerationMetadataId.model_construct(id=generationId) for generationId in generationMetadatas
+            ],
+        )
+
 
 class GenerationMetadata(BaseModel):
     """Model representing metadata for a generation process. Not possible to update after creation."""
@@ -178,6 +190,40 @@ class GenerationMetadata(BaseModel):
             techniques=techniques,
         )
 
+    @classmethod
+    def FromDatabase(
+        cls,
+        id: int,
+        imageId: int,
+        prompt: str,
+        negativePrompt: Optional[str],
+        seed: Optional[str],
+        model: Optional[str],
+        sampler: Optional[str],
+        scheduler: Optional[str],
+        steps: Optional[int],
+        cfgScale: Optional[float],
+        size: Optional[str],
+        loras: List[LoraMetadata],
+        techniques: Optional[List[str]],
+    ) -> "GenerationMetadata":
+        """Rebuild a stored GenerationMetadata without re-running validation; only for rows the database already holds."""
+        return cls.model_construct(
+            id=GenerationMetadataId.model_construct(id=id),
+            imageId=ImageMetadataId.model_construct(id=imageId),
+            prompt=prompt,
+            negativePrompt=negativePrompt,
+            seed=seed,
+            model=model,
+            sampler=SamplerType(sampler) if sampler is not None else None,
+            scheduler=SchedulerType(scheduler) if scheduler is not None else None,
+            steps=steps,
+            cfgScale=cfgScale,
+            size=Size.CreateFromString(size) if size is not None else None,
+            loras=loras,
+            techniques=[TechniqueType(technique) for technique in techniques] if techniques is not None else None,
+        )
+
 
 class ImageMetadata(EventEmitter):
     """Model representing metadata for an image in the gallery."""
@@ -287,6 +333,43 @@ class ImageMetadata(EventEmitter):
 
         return imageMetadata
 
+    @classmethod
+    def FromDatabase(
+        cls,
+        id: int,
+        ownerId: str,
+        title: str,
+        subtitle: str,
+        description: Optional[str],
+        width: int,
+        height: int,
+        repositoryType: str,
+        uri: str,
+        thumbnailUri: Optional[str],
+        isAiGenerated: bool,
+        generationMetadata: Optional[GenerationMetadata],
+        vectorId: Optional[str],
+        uploadedAt: datetime,
+        updatedAt: datetime,
+    ) -> "ImageMetadata":
+        """Rebuild a stored ImageMetadata without re-running validation; only for rows the database already holds."""
+        return cls.model_construct(
+            id=ImageMetadataId.model_construct(id=id),
+            ownerId=MemberId.model_construct(id=ownerId),
+            title=title,
+            subtitle=subtitle,
+            description=description,
+            size=Size.model_construct(width=width, height=height),
+            repositoryType=ImageRepositoryType(repositoryType),
+            uri=uri,
+            thumbnailUri=thumbnailUri,
+            isAiGenerated=isAiGenerated,
+            generationMetadata=generationMetadata,
+            vectorId=VectorId.model_construct(id=vectorId) if vectorId is not None else None,
+            uploadedAt=uploadedAt,
+            updatedAt=updatedAt,
+        )
+
     def IsAiGeneratedWithMetadata(self) -> bool:
         """Check if the image is AI-generated and has associated generation metadata."""
         return self.isAiGenerated and self.generationMetadata is not None
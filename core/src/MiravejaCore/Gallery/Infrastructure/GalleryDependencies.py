@@ -31,7 +31,8 @@ from MiravejaCore.Gallery.Infrastructure.Sql.Repository import (
 )
 from MiravejaCore.Shared.DatabaseManager.Infrastructure.Factories import SqlDatabaseManagerFactory
 from MiravejaCore.Shared.DI.Models import Container
-from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
+from MiravejaCore.Shared.Events.Application.EventDispatcher import BatchingEventDispatcher, EventDispatcher
+from MiravejaCore.Shared.Events.Domain.Interfaces import IEventProducer
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
 from MiravejaCore.Shared.Storage.Domain.Configuration import MinIoConfig
 from MiravejaCore.Shared.Storage.Domain.Services import SignedUrlService
@@ -40,14 +41,15 @@ from MiravejaCore.Shared.Storage.Domain.Services import SignedUrlService
 class GalleryDependencies:
     @staticmethod
     def RegisterDependencies(container: Container):
+        # Validate configs once at registration; the registrations below close over the built objects
         galleryConfig: GalleryConfig = GalleryConfig.model_validate(container.Get("galleryConfig"))
+        minioConfig: MinIoConfig = MinIoConfig.model_validate(container.Get("minioConfig"))
 
-        container.RegisterFactories(
+        # Stateless services are built once; the MinIO repository also checks the bucket on construction
+        container.RegisterSingletons(
             {
                 # Services
-                SignedUrlService.__name__: lambda container: SignedUrlService(
-                    config=MinIoConfig.model_validate(container.Get("minioConfig")),
-                ),
+                SignedUrlService.__name__: lambda container: SignedUrlService(config=minioConfig),
                 PillowThumbnailGenerationService.__name__: lambda container: PillowThumbnailGenerationService(
                     size=galleryConfig.thumbnailSize,
                     imgFormat=galleryConfig.thumbnailFormat,
@@ -56,14 +58,25 @@ class GalleryDependencies:
                     PillowThumbnailGenerationService.__name__
                 ),
                 # Repositories
-                IImageMetadataRepository.__name__: lambda container: SqlImageMetadataRepository,
-                IGenerationMetadataRepository.__name__: lambda container: SqlGenerationMetadataRepository,
-                ILoraMetadataRepository.__name__: lambda container: SqlLoraMetadataRepository,
                 IImageContentRepository.__name__: lambda container: MinIoImageContentRepository(
                     boto3Client=container.Get(Boto3Session.client.__name__),
-                    config=MinIoConfig.model_validate(container.Get("minioConfig")),
+                    config=minioConfig,
                     logger=container.Get(ILogger.__name__),
                 ),
+                # Dispatcher shared by the handlers that publish in the background, so their events are batched
+                BatchingEventDispatcher.__name__: lambda container: BatchingEventDispatcher(
+                    eventProducer=container.Get(IEventProducer.__name__),
+                    logger=container.Get(ILogger.__name__),
+                ),
+            }
+        )
+
+        container.RegisterFactories(
+            {
+                # Repositories
+                IImageMetadataRepository.__name__: lambda container: SqlImageMetadataRepository,
+                IGenerationMetadataRepository.__name__: lambda container: SqlGenerationMetadataRepository,
+                ILoraMetadataRepository.__name__: lambda container: SqlLoraMetadataRepository,
                 # Handlers
                 FindLoraMetadataByHashHandler.__name__: lambda container: FindLoraMetadataByHashHandler(
                     databaseManagerFactory=container.Get(SqlDatabaseManagerFactory.__name__),
@@ -103,7 +116,8 @@ class GalleryDependencies:
                     registerGenerationMetadataHandler=container.Get(RegisterGenerationMetadataHandler.__name__),
                     imageContentRepository=container.Get(IImageContentRepository.__name__),
                     logger=container.Get(ILogger.__name__),
-                    eventDispatcher=container.Get(EventDispatcher.__name__),
+                    eventDispatcher=container.Get(BatchingEventDispatcher.__name__),
+                    trustPresignedUploads=galleryConfig.trustPresignedUploads,
                 ),
                 UpdateImageMetadataHandler.__name__: lambda container: UpdateImageMetadataHandler(
                     databaseManagerFactory=container.Get(SqlDatabaseManagerFactory.__name__),
@@ -119,13 +133,13 @@ class GalleryDependencies:
                 AddVectorIdToImageMetadataHandler.__name__: lambda container: AddVectorIdToImageMetadataHandler(
                     databaseManagerFactory=container.Get(SqlDatabaseManagerFactory.__name__),
                     tImageMetadataRepository=container.Get(IImageMetadataRepository.__name__),
-                    eventDispatcher=container.Get(EventDispatcher.__name__),
+                    eventDispatcher=container.Get(BatchingEventDispatcher.__name__),
                     logger=container.Get(ILogger.__name__),
                 ),
                 AddThumbnailToImageMetadataHandler.__name__: lambda container: AddThumbnailToImageMetadataHandler(
                     databaseManagerFactory=container.Get(SqlDatabaseManagerFactory.__name__),
                     tImageMetadataRepository=container.Get(IImageMetadataRepository.__name__),
-                    eventDispatcher=container.Get(EventDispatcher.__name__),
+                    eventDispatcher=container.Get(BatchingEventDispatcher.__name__),
                     logger=container.Get(ILogger.__name__),
                 ),
                 GenerateThumbnailHandler.__name__: lambda container: GenerateThumbnailHandler(
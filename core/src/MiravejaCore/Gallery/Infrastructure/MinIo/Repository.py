@@ -1,6 +1,8 @@
-from typing import Any, BinaryIO, Dict
+import asyncio
+from typing import Any, BinaryIO, Dict, Tuple
 
 from botocore.client import BaseClient as Boto3Client
+from botocore.exceptions import ClientError
 
 from MiravejaCore.Gallery.Domain.Interfaces import IImageContentRepository
 from MiravejaCore.Shared.Identifiers.Models import MemberId
@@ -9,10 +11,14 @@ from MiravejaCore.Shared.Storage.Domain.Configuration import MinIoConfig
 
 
 class MinIoImageContentRepository(IImageContentRepository):
+    # The boto3 client is synchronous: calls that go over the network run on a worker thread so they do not block
+    # the event loop, while presigning is a local signature computation and stays inline
     def __init__(self, boto3Client: Boto3Client, config: MinIoConfig, logger: ILogger) -> None:
         self._boto3Client = boto3Client
         self._config = config
         self._logger = logger
+        # Every image URI is f"{config.outsideEndpoint}/{config.bucketName}/{imageKey}"; the prefix never changes
+        self._uriPrefix = f"{config.outsideEndpoint.rstrip('/')}/{config.bucketName}/"
         self._Initialize()
 
     def _Initialize(self) -> None:
@@ -20,23 +26,30 @@ class MinIoImageContentRepository(IImageContentRepository):
         existingBuckets = self._boto3Client.list_buckets()
         bucketNames = [bucket["Name"] for bucket in existingBuckets.get("Buckets", [])]
         if self._config.bucketName not in bucketNames:
-            self._logger.Info(f"Creating bucket {self._config.bucketName}")
+            self._logger.Info("Creating bucket %s", self._config.bucketName)
             self._boto3Client.create_bucket(
                 Bucket=self._config.bucketName,
                 ObjectLockEnabledForBucket=True,
             )
         else:
-            self._logger.Info(f"Bucket {self._config.bucketName} already exists")
+            self._logger.Info("Bucket %s already exists", self._config.bucketName)
 
     def _GetImageKey(self, imageUri: str) -> str:
-        # the image uri is f"{config.outsideEndpoint}/{config.bucketName}/{imageKey}"
-        return imageUri.replace(f"{self._config.outsideEndpoint.rstrip('/')}/{self._config.bucketName}/", "")
+        return imageUri.removeprefix(self._uriPrefix)
 
-    def _GetKeyUri(self, key: str) -> str:
-        return f"{self._config.outsideEndpoint.rstrip('/')}/{self._config.bucketName}/{key}"
+    def GetKeyUri(self, key: str) -> str:
+        return f"{self._uriPrefix}{key}"
+
+    async def _HeadObject(self, key: str) -> Dict[str, Any]:
+        return await asyncio.to_thread(self._boto3Client.head_object, Bucket=self._config.bucketName, Key=key)
+
+    @staticmethod
+    def _IsNotFound(error: Exception) -> bool:
+        # HEAD responses carry no body, so a missing key surfaces as a bare 404 rather than NoSuchKey
+        return isinstance(error, ClientError) and error.response.get("Error", {}).get("Code") in {"404", "NoSuchKey"}
 
     async def GetPresignedGetUrl(self, key: str) -> str:
-        self._logger.Info(f"Generating presigned GET URL for {key}")
+        self._logger.Info("Generating presigned GET URL for %s", key)
         try:
             presignedUrl = self._boto3Client.generate_presigned_url(
                 "get_object",
@@ -45,11 +58,11 @@ class MinIoImageContentRepository(IImageContentRepository):
             )
             return presignedUrl
         except Exception as e:
-            self._logger.Error(f"Error generating presigned GET URL: {e}")
+            self._logger.Error("Error generating presigned GET URL: %s", e)
             raise e
 
     async def GetPresignedPostUrl(self, key: str, ownerId: MemberId) -> Dict[str, Any]:
-        self._logger.Info(f"Generating presigned POST URL for {key}")
+        self._logger.Info("Generating presigned POST URL for %s", key)
         try:
             presignedPost = self._boto3Client.generate_presigned_post(
                 Bucket=self._config.bucketName,
@@ -67,67 +80,90 @@ class MinIoImageContentRepository(IImageContentRepository):
             )
             return presignedPost
         except Exception as e:
-            self._logger.Error(f"Error generating presigned POST URL: {e}")
+            self._logger.Error("Error generating presigned POST URL: %s", e)
             raise e
 
     async def GetMetadata(self, imageUri: str) -> dict:
         key = self._GetImageKey(imageUri)
-        self._logger.Info(f"Fetching metadata for {key}")
+        self._logger.Info("Fetching metadata for %s", key)
         try:
-            response = self._boto3Client.head_object(Bucket=self._config.bucketName, Key=key)
+            response = await self._HeadObject(key)
             return response.get("Metadata", {})
-        except self._boto3Client.exceptions.NoSuchKey:
-            self._logger.Warning(f"Object {key} not found in bucket {self._config.bucketName}")
-            return {}
+        except ClientError as e:
+            if self._IsNotFound(e):
+                self._logger.Warning("Object %s not found in bucket %s", key, self._config.bucketName)
+                return {}
+            self._logger.Error("Error fetching metadata for %s: %s", key, e)
+            raise e
         except Exception as e:
-            self._logger.Error(f"Error fetching metadata for {key}: {e}")
+            self._logger.Error("Error fetching metadata for %s: %s", key, e)
             raise e
 
     async def Upload(self, key: str, imageContent: BinaryIO) -> str:
-        self._logger.Info(f"Uploading object {key} to bucket {self._config.bucketName}")
+        self._logger.Info("Uploading object %s to bucket %s", key, self._config.bucketName)
         try:
-            self._boto3Client.put_object(Bucket=self._config.bucketName, Key=key, Body=imageContent)
-            self._logger.Info(f"Successfully uploaded {key}")
-            return self._GetKeyUri(key)
+            await asyncio.to_thread(
+                self._boto3Client.put_object, Bucket=self._config.bucketName, Key=key, Body=imageContent
+            )
+            self._logger.Info("Successfully uploaded %s", key)
+            return self.GetKeyUri(key)
         except Exception as e:
-            self._logger.Error(f"Error uploading object {key}: {e}")
+            self._logger.Error("Error uploading object %s: %s", key, e)
             raise e
 
     async def Delete(self, imageUri: str) -> None:
         key = self._GetImageKey(imageUri)
-        self._logger.Info(f"Deleting object {key} from bucket {self._config.bucketName}")
+        self._logger.Info("Deleting object %s from bucket %s", key, self._config.bucketName)
         try:
-            self._boto3Client.delete_object(Bucket=self._config.bucketName, Key=key)
-            self._logger.Info(f"Successfully deleted {key}")
+            await asyncio.to_thread(self._boto3Client.delete_object, Bucket=self._config.bucketName, Key=key)
+            self._logger.Info("Successfully deleted %s", key)
         except Exception as e:
-            self._logger.Error(f"Error deleting object {key}: {e}")
+            self._logger.Error("Error deleting object %s: %s", key, e)
             raise e
 
     async def Exists(self, imageUri: str) -> bool:
         key = self._GetImageKey(imageUri)
-        self._logger.Info(f"Checking existence of object {key} in bucket {self._config.bucketName}")
+        self._logger.Info("Checking existence of object %s in bucket %s", key, self._config.bucketName)
         try:
-            self._boto3Client.head_object(Bucket=self._config.bucketName, Key=key)
-            self._logger.Info(f"Object {key} exists")
+            await self._HeadObject(key)
+            self._logger.Info("Object %s exists", key)
             return True
         except Exception as e:
-            self._logger.Error(f"Error checking existence of object {key}: {e}")
-            if "Not Found" in str(e):
-                self._logger.Info(f"Object {key} does not exist")
+            self._logger.Error("Error checking existence of object %s: %s", key, e)
+            if self._IsNotFound(e):
+                self._logger.Info("Object %s does not exist", key)
                 return False
             raise e
 
     async def IsOwnedBy(self, imageUri: str, ownerId: MemberId) -> bool:
-        self._logger.Info(f"Checking ownership of object {imageUri} by member ID {ownerId.id}")
+        self._logger.Info("Checking ownership of object %s by member ID %s", imageUri, ownerId.id)
         try:
             metadata = await self.GetMetadata(imageUri)
             actualOwnerId = metadata.get("owner-id")
             if actualOwnerId == str(ownerId.id):
-                self._logger.Info(f"Object {imageUri} is owned by member ID {ownerId.id}")
+                self._logger.Info("Object %s is owned by member ID %s", imageUri, ownerId.id)
                 return True
 
-            self._logger.Warning(f"Object {imageUri} is not owned by member ID {ownerId.id}")
+            self._logger.Warning("Object %s is not owned by member ID %s", imageUri, ownerId.id)
             return False
         except Exception as e:
-            self._logger.Error(f"Error checking ownership of object {imageUri}: {e}")
+            self._logger.Error("Error checking ownership of object %s: %s", imageUri, e)
+            raise e
+
+    async def ExistsAndIsOwnedBy(self, imageUri: str, ownerId: MemberId) -> Tuple[bool, bool]:
+        key = self._GetImageKey(imageUri)
+        self._logger.Info("Checking existence and ownership of object %s by member ID %s", key, ownerId.id)
+        try:
+            # A single HEAD returns both whether the object exists and its owner metadata
+            response = await self._HeadObject(key)
+        except Exception as e:
+            if self._IsNotFound(e):
+                self._logger.Info("Object %s does not exist", key)
+                return False, False
+            self._logger.Error("Error checking existence and ownership of object %s: %s", key, e)
             raise e
+
+        isOwned = response.get("Metadata", {}).get("owner-id") == str(ownerId.id)
+        if not isOwned:
+            self._logger.Warning("Object %s is not owned by member ID %s", imageUri, ownerId.id)
+        return True, isOwned
@@ -2,6 +2,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Mapped, declarative_base, mapped_column, relationship
 
 from MiravejaCore.Gallery.Domain.Enums import SamplerType, SchedulerType
@@ -49,6 +50,14 @@ class LoraMetadataEntity(Base):
             "generationMetadatas": [gm.id for gm in self.generationMetadatas] if self.generationMetadatas else [],
         }
 
+    def ToDomain(self) -> LoraMetadata:
+        return LoraMetadata.FromDatabase(
+            id=self.id,
+            hash=self.hash,
+            name=self.name,
+            generationMetadatas=[gm.id for gm in self.generationMetadatas],
+        )
+
     @classmethod
     def FromDomain(cls, domainLoraMetadata: LoraMetadata) -> "LoraMetadataEntity":
         return cls(
@@ -72,7 +81,7 @@ class GenerationMetadataEntity(Base):
     steps: Mapped[Optional[int]] = mapped_column(sa.Integer, nullable=True)
     cfgScale: Mapped[Optional[float]] = mapped_column(sa.Float, nullable=True)
     size: Mapped[Optional[str]] = mapped_column(sa.String(20), nullable=True)  # Stored as "WIDTHxHEIGHT"
-    techniques: Mapped[Optional[str]] = mapped_column(sa.String(255), nullable=True)  # Comma-separated list
+    techniques: Mapped[Optional[List[str]]] = mapped_column(postgresql.ARRAY(sa.String(64)), nullable=True)
 
     # Many-to-many relationship with LoRA metadata
     loras: Mapped[List["LoraMetadataEntity"]] = relationship(
@@ -100,9 +109,26 @@ class GenerationMetadataEntity(Base):
             "cfgScale": self.cfgScale,
             "size": self.size,
             "loras": [lora.ToDict() for lora in self.loras] if self.loras else [],  # Return list of LoRA dicts
-            "techniques": self.techniques.split(",") if self.techniques else None,
+            "techniques": self.techniques or None,
         }
 
+    def ToDomain(self) -> GenerationMetadata:
+        return GenerationMetadata.FromDatabase(
+            id=self.id,
+            imageId=self.imageId,
+            prompt=self.prompt,
+            negativePrompt=self.negativePrompt,
+            seed=self.seed,
+            model=self.model,
+            sampler=self.sampler,
+            scheduler=self.scheduler,
+            steps=self.steps,
+            cfgScale=self.cfgScale,
+            size=self.size,
+            loras=[lora.ToDomain() for lora in self.loras],
+            techniques=self.techniques or None,
+        )
+
     @classmethod
     def FromDomain(cls, domainGenerationMetadata: GenerationMetadata) -> "GenerationMetadataEntity":
         loraEntities = (
@@ -111,8 +137,6 @@ class GenerationMetadataEntity(Base):
             else []
         )
 
-        techniquesStr = ",".join(domainGenerationMetadata.techniques) if domainGenerationMetadata.techniques else None
-
         return cls(
             id=domainGenerationMetadata.id.id,
             imageId=domainGenerationMetadata.imageId.id,
@@ -126,30 +150,40 @@ class GenerationMetadataEntity(Base):
             cfgScale=domainGenerationMetadata.cfgScale,
             size=str(domainGenerationMetadata.size) if domainGenerationMetadata.size else None,
             loras=loraEntities,
-            techniques=techniquesStr,
+            techniques=(
+                [technique.value for technique in domainGenerationMetadata.techniques]
+                if domainGenerationMetadata.techniques
+                else None
+            ),
         )
 
 
 class ImageMetadataEntity(Base):
     __tablename__ = "t_image_metadata"
+    # Covers "one owner's images, newest first" listings
+    __table_args__ = (sa.Index("ix_t_image_metadata_ownerId_uploadedAt", "ownerId", "uploadedAt"),)
 
     id: Mapped[int] = mapped_column(sa.Integer, primary_key=True, autoincrement=True)
-    ownerId: Mapped[str] = mapped_column(sa.String(36), nullable=False)  # Assuming UUID string
+    ownerId: Mapped[str] = mapped_column(sa.String(36), nullable=False, index=True)  # Assuming UUID string
     title: Mapped[str] = mapped_column(sa.String(200), nullable=False)
     subtitle: Mapped[str] = mapped_column(sa.String(200), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(sa.String(2000), nullable=True)
     width: Mapped[int] = mapped_column(sa.Integer, nullable=False)
     height: Mapped[int] = mapped_column(sa.Integer, nullable=False)
     repositoryType: Mapped[str] = mapped_column(sa.String(50), nullable=False)  # Enum as string
-    uri: Mapped[str] = mapped_column(sa.String(500), nullable=False)
+    uri: Mapped[str] = mapped_column(sa.String(500), nullable=False, unique=True, index=True)
     thumbnailUri: Mapped[Optional[str]] = mapped_column(sa.String(500), nullable=True)
     isAiGenerated: Mapped[bool] = mapped_column(sa.Boolean, nullable=False, default=False)
-    vectorId: Mapped[Optional[int]] = mapped_column(sa.Integer, nullable=True)
+    vectorId: Mapped[Optional[str]] = mapped_column(postgresql.UUID(as_uuid=False), nullable=True)
     uploadedAt: Mapped[datetime] = mapped_column(
-        sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False
+        sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False, index=True
     )
     updatedAt: Mapped[datetime] = mapped_column(
-        sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False, onupdate=sa.text("now()")
+        sa.DateTime(timezone=True),
+        server_default=sa.text("now()"),
+        nullable=False,
+        onupdate=sa.text("now()"),
+        index=True,
     )
 
     # One-to-one relationship with generation metadata
@@ -175,6 +209,25 @@ class ImageMetadataEntity(Base):
             "updatedAt": self.updatedAt,
         }
 
+    def ToDomain(self) -> ImageMetadata:
+        return ImageMetadata.FromDatabase(
+            id=self.id,
+            ownerId=self.ownerId,
+            title=self.title,
+            subtitle=self.subtitle,
+            description=self.description,
+            width=self.width,
+            height=self.height,
+            repositoryType=self.repositoryType,
+            uri=self.uri,
+            thumbnailUri=self.thumbnailUri,
+            isAiGenerated=self.isAiGenerated,
+            generationMetadata=self.generationMetadata.ToDomain() if self.generationMetadata else None,
+            vectorId=self.vectorId,
+            uploadedAt=self.uploadedAt,
+            updatedAt=self.updatedAt,
+        )
+
     @classmethod
     def FromDomain(cls, domainImageMetadata: ImageMetadata) -> "ImageMetadataEntity":
         return cls(
@@ -1,7 +1,9 @@
-from typing import Iterator, Optional
+from typing import Iterator, List, Optional, Set
 
-from sqlalchemy import text
+from sqlalchemy import text, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session as DatabaseSession
+from sqlalchemy.orm import selectinload
 
 from MiravejaCore.Gallery.Domain.Interfaces import (
     IGenerationMetadataRepository,
@@ -13,11 +15,21 @@ from MiravejaCore.Gallery.Infrastructure.Sql.Entities import (
     GenerationMetadataEntity,
     ImageMetadataEntity,
     LoraMetadataEntity,
+    LoraMetaToGenerationMetaEntity,
 )
 from MiravejaCore.Shared.Identifiers.Models import GenerationMetadataId, ImageMetadataId, LoraMetadataId, VectorId
 from MiravejaCore.Shared.Utils.Repository.Queries import ListAllQuery
 from MiravejaCore.Shared.Utils.Repository.Types import FilterFunction
 
+# ToDomain walks image -> generation metadata -> LoRAs -> their generation IDs; load every level in one batched IN
+# query instead of lazily per row
+LOAD_GENERATION_METADATA = (
+    selectinload(ImageMetadataEntity.generationMetadata)
+    .selectinload(GenerationMetadataEntity.loras)
+    .selectinload(LoraMetadataEntity.generationMetadatas)
+)
+LOAD_LORAS = selectinload(GenerationMetadataEntity.loras).selectinload(LoraMetadataEntity.generationMetadatas)
+
 
 class SqlImageMetadataRepository(IImageMetadataRepository):
     def __init__(self, dbSession: DatabaseSession):
@@ -26,7 +38,12 @@ class SqlImageMetadataRepository(IImageMetadataRepository):
     def ListAll(
         self, query: ListAllQuery = ListAllQuery(), filterFunction: Optional[FilterFunction] = None
     ) -> Iterator[ImageMetadata]:
-        dbQuery = self._dbSession.query(ImageMetadataEntity)
+        dbQuery = self._dbSession.query(ImageMetadataEntity).options(LOAD_GENERATION_METADATA)
+
+        # Apply column criteria in SQL so filtered-out rows are never fetched and the page is filled with matches
+        if isinstance(filterFunction, dict):
+            dbQuery = dbQuery.filter_by(**filterFunction)
+            filterFunction = None
 
         # Apply sorting
         sortColumn = getattr(ImageMetadataEntity, query.sortBy, None)
@@ -41,7 +58,7 @@ class SqlImageMetadataRepository(IImageMetadataRepository):
 
         # Yield results as an iterator
         for entity in dbQuery.yield_per(100):  # SQLAlchemy will load 100 rows at a time
-            imageMetadata: ImageMetadata = ImageMetadata.model_validate(entity.ToDict())
+            imageMetadata: ImageMetadata = entity.ToDomain()
             # Apply in-memory filtering if a filter function is provided
             if filterFunction is not None and callable(filterFunction) and not filterFunction(imageMetadata):
                 continue
@@ -52,16 +69,23 @@ class SqlImageMetadataRepository(IImageMetadataRepository):
         return dbQuery.count()
 
     def FindById(self, imageId: ImageMetadataId) -> Optional[ImageMetadata]:
-        entity = self._dbSession.get(ImageMetadataEntity, int(imageId))
+        entity = self._dbSession.get(ImageMetadataEntity, int(imageId), options=[LOAD_GENERATION_METADATA])
         if entity is None:
             return None
-        return ImageMetadata.model_validate(entity.ToDict())
+        return entity.ToDomain()
 
     def FindByUri(self, uri: str) -> Optional[ImageMetadata]:
         entity = self._dbSession.query(ImageMetadataEntity).filter(ImageMetadataEntity.uri == uri).first()
         if entity is None:
             return None
-        return ImageMetadata.model_validate(entity.ToDict())
+        return entity.ToDomain()
+
+    def FindExistingUris(self, uris: Set[str]) -> Set[str]:
+        if not uris:
+            return set()
+        # Only the URI column is selected, so no entity is hydrated just to test existence
+        rows = self._dbSession.query(ImageMetadataEntity.uri).filter(ImageMetadataEntity.uri.in_(uris)).all()
+        return {row.uri for row in rows}
 
     def FindByVectorId(self, vectorId: VectorId) -> Optional[ImageMetadata]:
         entity = (
@@ -69,40 +93,89 @@ class SqlImageMetadataRepository(IImageMetadataRepository):
         )
         if entity is None:
             return None
-        return ImageMetadata.model_validate(entity.ToDict())
+        return entity.ToDomain()
 
     def ImageMetadataExists(self, imageId: ImageMetadataId) -> bool:
         entity = self._dbSession.get(ImageMetadataEntity, int(imageId))
         return entity is not None
 
     def Save(self, imageMetadata: ImageMetadata) -> None:
+        # Save serves both registration and updates; one INSERT ... ON CONFLICT replaces merge's SELECT by primary key
         entity = ImageMetadataEntity.FromDomain(imageMetadata)
-        self._dbSession.merge(entity)
+        values = {column.key: getattr(entity, column.key) for column in ImageMetadataEntity.__table__.columns}
+        statement = insert(ImageMetadataEntity).values(**values)
+        statement = statement.on_conflict_do_update(
+            index_elements=[ImageMetadataEntity.id],
+            set_={key: statement.excluded[key] for key in values if key != "id"},
+        )
+        self._dbSession.execute(statement)
+
+    def SaveMany(self, imageMetadatas: List[ImageMetadata]) -> None:
+        # New rows need no merge lookup; add_all lets the flush send them as one batched INSERT
+        self._dbSession.add_all([ImageMetadataEntity.FromDomain(imageMetadata) for imageMetadata in imageMetadatas])
+
+    def UpdateThumbnailUri(self, imageId: ImageMetadataId, thumbnailUri: str) -> Optional[ImageMetadata]:
+        return self._UpdateReturning(imageId, thumbnailUri=thumbnailUri)
+
+    def UpdateVectorId(self, imageId: ImageMetadataId, vectorId: VectorId) -> Optional[ImageMetadata]:
+        return self._UpdateReturning(imageId, vectorId=str(vectorId))
+
+    def _UpdateReturning(self, imageId: ImageMetadataId, **values) -> Optional[ImageMetadata]:
+        # UPDATE ... RETURNING writes and reads the row in one round-trip; updatedAt is refreshed by its onupdate.
+        # The loader option eager-loads generation metadata, so ToDomain does not lazy-load it row by row.
+        statement = (
+            update(ImageMetadataEntity)
+            .where(ImageMetadataEntity.id == int(imageId))
+            .values(**values)
+            .returning(ImageMetadataEntity)
+            .options(LOAD_GENERATION_METADATA)
+        )
+        entity = self._dbSession.execute(statement).scalar_one_or_none()
+        if entity is None:
+            return None
+        return entity.ToDomain()
 
     def GenerateNewId(self) -> ImageMetadataId:
         result = self._dbSession.execute(text("SELECT nextval('seq_image_metadata_id')"))
         newId = result.scalar_one()
         return ImageMetadataId(id=newId)
 
+    def GenerateNewIds(self, count: int) -> List[ImageMetadataId]:
+        if count <= 0:
+            return []
+        result = self._dbSession.execute(
+            text("SELECT nextval('seq_image_metadata_id') FROM generate_series(1, :count)"), {"count": count}
+        )
+        return [ImageMetadataId(id=newId) for newId in result.scalars()]
+
 
 class SqlGenerationMetadataRepository(IGenerationMetadataRepository):
     def __init__(self, dbSession: DatabaseSession):
         self._dbSession = dbSession
 
     def Save(self, generationMetadata: GenerationMetadata) -> None:
+        # Generation metadata is only ever created, under a fresh sequence ID, and its LoRAs are already stored.
+        # Insert the row and its link rows directly rather than letting merge SELECT the row and every LoRA first.
         entity = GenerationMetadataEntity.FromDomain(generationMetadata)
-        self._dbSession.merge(entity)
+        entity.loras = []
+        self._dbSession.add(entity)
+        self._dbSession.add_all(
+            [
+                LoraMetaToGenerationMetaEntity(loraId=lora.id.id, generationMetadataId=generationMetadata.id.id)
+                for lora in generationMetadata.loras or []
+            ]
+        )
 
     def GenerationMetadataExists(self, generationMetadataId) -> bool:
         entity = self._dbSession.get(GenerationMetadataEntity, int(generationMetadataId))
         return entity is not None
 
     def FindById(self, generationMetadataId) -> Optional[GenerationMetadata]:
-        entity = self._dbSession.get(GenerationMetadataEntity, int(generationMetadataId))
+        entity = self._dbSession.get(GenerationMetadataEntity, int(generationMetadataId), options=[LOAD_LORAS])
         if entity is None:
             return None
 
-        return GenerationMetadata.model_validate(entity.ToDict())
+        return entity.ToDomain()
 
     def GenerateNewId(self) -> GenerationMetadataId:
         result = self._dbSession.execute(text("SELECT nextval('seq_generation_metadata_id')"))
@@ -116,15 +189,16 @@ class SqlLoraMetadataRepository(ILoraMetadataRepository):
         self._dbSession = dbSession
 
     def Save(self, loraMetadata) -> None:
+        # LoRAs are only saved once, right after FindByHash missed, under a fresh sequence ID
         entity = LoraMetadataEntity.FromDomain(loraMetadata)
-        self._dbSession.merge(entity)
+        self._dbSession.add(entity)
 
     def FindByHash(self, hash: str) -> Optional[LoraMetadata]:
         entity = self._dbSession.query(LoraMetadataEntity).filter(LoraMetadataEntity.hash == hash).first()
         if entity is None:
             return None
 
-        return LoraMetadata.model_validate(entity.ToDict())
+        return entity.ToDomain()
 
     def GenerateNewId(self) -> LoraMetadataId:
         result = self._dbSession.execute(text("SELECT nextval('seq_lora_metadata_id')"))
@@ -7,6 +7,7 @@ from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManag
 from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import MemberId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class ActivateMemberByIdCommand(BaseModel):
@@ -27,20 +28,21 @@ class ActivateMemberByIdHandler:
         self._eventDispatcher = eventDispatcher
 
     async def Handle(self, command: ActivateMemberByIdCommand) -> None:
-        self._logger.Info(f"Activating member by ID with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Activating member by ID with command: %s", LazyJson(command))
 
         with self._databaseManagerFactory.Create() as databaseManager:
             memberRepository: IMemberRepository = databaseManager.GetRepository(self._tMemberRepository)
 
             member = memberRepository.FindById(command.memberId)
             if not member:
-                self._logger.Warning(f"Member with ID {command.memberId.id} not found.")
+                self._logger.Warning("Member with ID %s not found.", command.memberId.id)
                 return
 
             member.Activate()
             memberRepository.Save(member)
             databaseManager.Commit()
-            self._logger.Info(f"Member with ID {command.memberId.id} has been activated.")
+            self._logger.Info("Member with ID %s has been activated.", command.memberId.id)
 
-        await self._eventDispatcher.DispatchAll(member.ReleaseEvents())
-        self._logger.Info(f"Dispatched activation events for member ID {command.memberId.id}.")
+        # Activation is already committed; the response need not wait on the event producer
+        self._eventDispatcher.DispatchAllInBackground(member.ReleaseEvents())
+        self._logger.Info("Scheduled dispatch of activation events for member ID %s.", command.memberId.id)
@@ -7,6 +7,7 @@ from MiravejaCore.Member.Domain.Interfaces import IMemberRepository
 from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManagerFactory
 from MiravejaCore.Shared.Identifiers.Models import MemberId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 from MiravejaCore.Shared.Utils.Types.Handler import HandlerResponse
 
 
@@ -26,13 +27,13 @@ class FindMemberByIdHandler:
         self._logger = logger
 
     async def Handle(self, command: FindMemberByIdCommand) -> Optional[HandlerResponse]:
-        self._logger.Info(f"Finding member by ID with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Finding member by ID with command: %s", LazyJson(command))
 
         with self._databaseManagerFactory.Create() as databaseManager:
             member = databaseManager.GetRepository(self._tMemberRepository).FindById(command.memberId)
         if not member:
-            self._logger.Warning(f"Member with ID {command.memberId.id} not found.")
+            self._logger.Warning("Member with ID %s not found.", command.memberId.id)
             raise MemberNotFoundException(command.memberId.id)
 
-        self._logger.Info(f"Member with ID {command.memberId.id} found: {member.model_dump_json(indent=4)}")
+        self._logger.Info("Member with ID %s found: %s", command.memberId.id, LazyJson(member))
         return member.model_dump()
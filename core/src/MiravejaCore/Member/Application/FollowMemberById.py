@@ -7,6 +7,7 @@ from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManag
 from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import MemberId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class FollowMemberByIdCommand(BaseModel):
@@ -28,27 +29,30 @@ class FollowMemberByIdHandler:
         self._eventDispatcher = eventDispatcher
 
     async def Handle(self, command: FollowMemberByIdCommand) -> None:
-        self._logger.Info(f"Following member by ID with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Following member by ID with command: %s", LazyJson(command))
 
         with self._databaseManagerFactory.Create() as databaseManager:
             memberRepository: IMemberRepository = databaseManager.GetRepository(self._tMemberRepository)
 
-            agent = memberRepository.FindById(command.agentId)
+            # Both members are loaded in one round-trip
+            members = memberRepository.FindByIds([command.agentId, command.memberIdToFollow])
+
+            agent = members.get(command.agentId)
             if not agent:
-                self._logger.Warning(f"Agent member with ID {command.agentId.id} not found.")
+                self._logger.Warning("Agent member with ID %s not found.", command.agentId.id)
                 return
 
-            memberToFollow = memberRepository.FindById(command.memberIdToFollow)
+            memberToFollow = members.get(command.memberIdToFollow)
             if not memberToFollow:
-                self._logger.Warning(f"Member to follow with ID {command.memberIdToFollow.id} not found.")
+                self._logger.Warning("Member to follow with ID %s not found.", command.memberIdToFollow.id)
                 return
 
             agent.FollowMember(memberToFollow.id)
             memberRepository.Save(agent)
             databaseManager.Commit()
             self._logger.Info(
-                f"Member with ID {command.agentId.id} is now following member ID {command.memberIdToFollow.id}."
+                "Member with ID %s is now following member ID %s.", command.agentId.id, command.memberIdToFollow.id
             )
 
-        await self._eventDispatcher.DispatchAll(agent.ReleaseEvents())
-        self._logger.Info(f"Dispatched follow events for member ID {command.agentId.id}.")
+        self._eventDispatcher.DispatchAllInBackground(agent.ReleaseEvents())
+        self._logger.Info("Scheduled dispatch of follow events for member ID %s.", command.agentId.id)
@@ -5,6 +5,7 @@ from MiravejaCore.Member.Domain.Interfaces import IMemberRepository
 from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManagerFactory
 from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 from MiravejaCore.Shared.Utils.Repository.Queries import ListAllQuery
 from MiravejaCore.Shared.Utils.Types.Handler import HandlerResponse
 
@@ -27,7 +28,7 @@ class ListAllMembersHandler:
         self._eventDispatcher = eventDispatcher
 
     async def Handle(self, command: ListAllMembersCommand) -> HandlerResponse:
-        self._logger.Info(f"Listing all members with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Listing all members with command: %s", LazyJson(command))
         with self._databaseManagerFactory.Create() as databaseManager:
             repository: IMemberRepository = databaseManager.GetRepository(self._tMemberRepository)
             allMembers = repository.ListAll(command)
@@ -10,6 +10,7 @@ from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManag
 from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import ImageMetadataId, MemberId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class RegisterMemberCommand(BaseModel):
@@ -41,10 +42,10 @@ class RegisterMemberHandler:
         self._logger = logger
 
     async def Handle(self, command: RegisterMemberCommand) -> None:
-        self._logger.Info(f"Registering member with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Registering member with command: %s", LazyJson(command))
         memberId: MemberId = MemberId(id=command.id)
 
-        self._logger.Debug(f"Creating member entity with ID: {memberId.id}")
+        self._logger.Debug("Creating member entity with ID: %s", memberId.id)
         member = Member.Register(
             id=memberId,
             email=command.email,
@@ -57,18 +58,17 @@ class RegisterMemberHandler:
             gender=command.gender,
             dateOfBirth=datetime.fromisoformat(command.dateOfBirth) if command.dateOfBirth else None,
         )
-        self._logger.Debug(f"Created member entity: {member.model_dump_json(indent=4)}")
+        self._logger.Debug("Created member entity: %s", LazyJson(member))
 
         with self._databaseManagerFactory.Create() as databaseManager:
             memberRepository: IMemberRepository = databaseManager.GetRepository(self._tMemberRepository)
 
-            if memberRepository.MemberExists(memberId):
-                self._logger.Error(f"Member with ID {memberId.id} already exists.")
+            if not memberRepository.SaveIfAbsent(member):
+                self._logger.Error("Member with ID %s already exists.", memberId.id)
                 raise MemberAlreadyExistsException(memberId.id)
 
-            memberRepository.Save(member)
             databaseManager.Commit()
 
         await self._eventDispatcher.DispatchAll(member.ReleaseEvents())
 
-        self._logger.Info(f"Member registered successfully: {member.model_dump_json(indent=4)}")
+        self._logger.Info("Member registered successfully: %s", LazyJson(member))
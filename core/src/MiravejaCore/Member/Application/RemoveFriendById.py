@@ -7,6 +7,7 @@ from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManag
 from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import MemberId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class RemoveFriendByIdCommand(BaseModel):
@@ -28,27 +29,31 @@ class RemoveFriendByIdHandler:
         self._eventDispatcher = eventDispatcher
 
     async def Handle(self, command: RemoveFriendByIdCommand) -> None:
-        self._logger.Info(f"Removing friend by ID with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Removing friend by ID with command: %s", LazyJson(command))
 
         with self._databaseManagerFactory.Create() as databaseManager:
             memberRepository: IMemberRepository = databaseManager.GetRepository(self._tMemberRepository)
 
-            agent = memberRepository.FindById(command.agentId)
+            members = memberRepository.FindByIds([command.agentId, command.friendId])
+
+            agent = members.get(command.agentId)
             if not agent:
-                self._logger.Warning(f"Agent member with ID {command.agentId.id} not found.")
+                self._logger.Warning("Agent member with ID %s not found.", command.agentId.id)
                 return
 
-            friend = memberRepository.FindById(command.friendId)
+            friend = members.get(command.friendId)
             if not friend:
-                self._logger.Warning(f"Friend member with ID {command.friendId.id} not found.")
+                self._logger.Warning("Friend member with ID %s not found.", command.friendId.id)
                 return
 
             agent.RemoveFriend(friend.id)
             memberRepository.Save(agent)
             databaseManager.Commit()
             self._logger.Info(
-                f"Member with ID {command.friendId.id} has been removed as a friend to member ID {command.agentId.id}."
+                "Member with ID %s has been removed as a friend to member ID %s.",
+                command.friendId.id,
+                command.agentId.id,
             )
 
         await self._eventDispatcher.DispatchAll(agent.ReleaseEvents())
-        self._logger.Info(f"Dispatched friend removal events for member ID {command.agentId.id}.")
+        self._logger.Info("Dispatched friend removal events for member ID %s.", command.agentId.id)
@@ -7,6 +7,7 @@ from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManag
 from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import MemberId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class UnfollowMemberByIdCommand(BaseModel):
@@ -28,27 +29,29 @@ class UnfollowMemberByIdHandler:
         self._eventDispatcher = eventDispatcher
 
     async def Handle(self, command: UnfollowMemberByIdCommand) -> None:
-        self._logger.Info(f"Unfollowing member by ID with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Unfollowing member by ID with command: %s", LazyJson(command))
 
         with self._databaseManagerFactory.Create() as databaseManager:
             memberRepository: IMemberRepository = databaseManager.GetRepository(self._tMemberRepository)
 
-            agent = memberRepository.FindById(command.agentId)
+            members = memberRepository.FindByIds([command.agentId, command.memberIdToUnfollow])
+
+            agent = members.get(command.agentId)
             if not agent:
-                self._logger.Warning(f"Agent member with ID {command.agentId.id} not found.")
+                self._logger.Warning("Agent member with ID %s not found.", command.agentId.id)
                 return
 
-            memberToUnfollow = memberRepository.FindById(command.memberIdToUnfollow)
+            memberToUnfollow = members.get(command.memberIdToUnfollow)
             if not memberToUnfollow:
-                self._logger.Warning(f"Member to unfollow with ID {command.memberIdToUnfollow.id} not found.")
+                self._logger.Warning("Member to unfollow with ID %s not found.", command.memberIdToUnfollow.id)
                 return
 
             agent.UnfollowMember(memberToUnfollow.id)
             memberRepository.Save(agent)
             databaseManager.Commit()
             self._logger.Info(
-                f"Member with ID {command.agentId.id} has unfollowed member ID {command.memberIdToUnfollow.id}."
+                "Member with ID %s has unfollowed member ID %s.", command.agentId.id, command.memberIdToUnfollow.id
             )
 
         await self._eventDispatcher.DispatchAll(agent.ReleaseEvents())
-        self._logger.Info(f"Dispatched unfollow events for member ID {command.agentId.id}.")
+        self._logger.Info("Dispatched unfollow events for member ID %s.", command.agentId.id)
@@ -8,6 +8,7 @@ from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManag
 from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import MemberId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class UpdateMemberIdentityByIdComand(BaseModel):
@@ -32,14 +33,14 @@ class UpdateMemberIdentityByIdHandler:
         self._eventDispatcher = eventDispatcher
 
     async def Handle(self, command: UpdateMemberIdentityByIdComand) -> None:
-        self._logger.Info(f"Updating member identity by ID with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Updating member identity by ID with command: %s", LazyJson(command))
 
         with self._databaseManagerFactory.Create() as databaseManager:
             memberRepository: IMemberRepository = databaseManager.GetRepository(self._tMemberRepository)
 
             member = memberRepository.FindById(command.memberId)
             if not member:
-                self._logger.Warning(f"Member with ID {command.memberId.id} not found.")
+                self._logger.Warning("Member with ID %s not found.", command.memberId.id)
                 return
 
             member.UpdateIdentity(
@@ -51,7 +52,7 @@ class UpdateMemberIdentityByIdHandler:
 
             memberRepository.Save(member)
             databaseManager.Commit()
-            self._logger.Info(f"Member with ID {command.memberId.id} updated successfully.")
+            self._logger.Info("Member with ID %s updated successfully.", command.memberId.id)
 
         await self._eventDispatcher.DispatchAll(member.ReleaseEvents())
-        self._logger.Info(f"Dispatched identity update events for member ID {command.memberId.id}.")
+        self._logger.Info("Dispatched identity update events for member ID %s.", command.memberId.id)
@@ -7,6 +7,7 @@ from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManag
 from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import ImageMetadataId, MemberId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class UpdateMemberProfileByIdCommand(BaseModel):
@@ -30,20 +31,20 @@ class UpdateMemberProfileByIdHandler:
         self._eventDispatcher = eventDispatcher
 
     async def Handle(self, command: UpdateMemberProfileByIdCommand) -> None:
-        self._logger.Info(f"Updating member profile by ID with command: {command.model_dump_json(indent=4)}")
+        self._logger.Info("Updating member profile by ID with command: %s", LazyJson(command))
 
         with self._databaseManagerFactory.Create() as databaseManager:
             memberRepository: IMemberRepository = databaseManager.GetRepository(self._tMemberRepository)
 
             member = memberRepository.FindById(command.memberId)
             if not member:
-                self._logger.Warning(f"Member with ID {command.memberId.id} not found.")
+                self._logger.Warning("Member with ID %s not found.", command.memberId.id)
                 return
 
             member.UpdateProfile(bio=command.bio, avatarId=command.avatarId, coverId=command.coverId)
             memberRepository.Save(member)
             databaseManager.Commit()
-            self._logger.Info(f"Member with ID {command.memberId.id} profile has been updated.")
+            self._logger.Info("Member with ID %s profile has been updated.", command.memberId.id)
 
         await self._eventDispatcher.DispatchAll(member.ReleaseEvents())
-        self._logger.Info(f"Dispatched profile update events for member ID {command.memberId.id}.")
+        self._logger.Info("Dispatched profile update events for member ID %s.", command.memberId.id)
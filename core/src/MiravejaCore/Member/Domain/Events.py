@@ -80,10 +80,12 @@ class MemberFoundEvent(DomainEvent):
         Returns:
             MemberFoundEvent: The created event.
         """
-        return cls(
-            memberId=str(memberId),
+        # Events are built from IDs and models that are already validated, so construction skips validation
+        aggregateId = str(memberId)
+        return cls.model_construct(
+            memberId=aggregateId,
             foundAt=str(datetime.now(timezone.utc)),
-            aggregateId=str(memberId),
+            aggregateId=aggregateId,
         )
 
 
@@ -109,9 +111,10 @@ class MemberRegisteredEvent(DomainEvent):
         Returns:
             MemberRegisteredEvent: The created event.
         """
-        return cls(
-            aggregateId=str(member.id),
-            memberId=str(member.id),
+        aggregateId = str(member.id)
+        return cls.model_construct(
+            aggregateId=aggregateId,
+            memberId=aggregateId,
             email=member.email,
             name=member.identity.fullName,
         )
@@ -138,10 +141,14 @@ class MemberActivatedEvent(DomainEvent):
         Returns:
             MemberActivatedEvent: The created event.
         """
-        return cls(
-            memberId=str(member.id),
-            activatedAt=str(datetime.now(timezone.utc)),
-            aggregateId=str(member.id),
+        aggregateId = str(member.id)
+        # One clock read serves both the payload timestamp and the event's occurredAt
+        activatedAt = datetime.now(timezone.utc)
+        return cls.model_construct(
+            memberId=aggregateId,
+            activatedAt=activatedAt.isoformat(),
+            aggregateId=aggregateId,
+            occurredAt=activatedAt,
         )
 
 
@@ -165,10 +172,13 @@ class MemberDeactivatedEvent(DomainEvent):
         Returns:
             MemberDeactivatedEvent: The created event.
         """
-        return cls(
-            memberId=str(member.id),
-            deactivatedAt=str(datetime.now(timezone.utc)),
-            aggregateId=str(member.id),
+        aggregateId = str(member.id)
+        deactivatedAt = datetime.now(timezone.utc)
+        return cls.model_construct(
+            memberId=aggregateId,
+            deactivatedAt=deactivatedAt.isoformat(),
+            aggregateId=aggregateId,
+            occurredAt=deactivatedAt,
         )
 
 
@@ -194,11 +204,12 @@ class MemberProfileUpdatedEvent(DomainEvent):
         Returns:
             MemberProfileUpdatedEvent: The created event.
         """
-        return cls(
-            memberId=str(newMember.id),
+        aggregateId = str(newMember.id)
+        return cls.model_construct(
+            memberId=aggregateId,
             oldProfile=oldMember.profile.model_dump(),
             newProfile=newMember.profile.model_dump(),
-            aggregateId=str(newMember.id),
+            aggregateId=aggregateId,
         )
 
 
@@ -224,11 +235,12 @@ class MemberIdentityUpdatedEvent(DomainEvent):
         Returns:
             MemberIdentityUpdatedEvent: The created event.
         """
-        return cls(
-            memberId=str(newMember.id),
+        aggregateId = str(newMember.id)
+        return cls.model_construct(
+            memberId=aggregateId,
             oldIdentity=oldMember.identity.model_dump(),
             newIdentity=newMember.identity.model_dump(),
-            aggregateId=str(newMember.id),
+            aggregateId=aggregateId,
         )
 
 
@@ -254,10 +266,11 @@ class MemberAddedFriendEvent(DomainEvent):
         Returns:
             MemberAddedFriendEvent: The created event.
         """
-        return cls(
-            memberId=str(memberId),
+        aggregateId = str(memberId)
+        return cls.model_construct(
+            memberId=aggregateId,
             friendMemberId=str(friendMemberId),
-            aggregateId=str(memberId),
+            aggregateId=aggregateId,
         )
 
 
@@ -283,10 +296,11 @@ class MemberRemovedFriendEvent(DomainEvent):
         Returns:
             MemberRemovedFriendEvent: The created event.
         """
-        return cls(
-            memberId=str(memberId),
+        aggregateId = str(memberId)
+        return cls.model_construct(
+            memberId=aggregateId,
             friendMemberId=str(friendMemberId),
-            aggregateId=str(memberId),
+            aggregateId=aggregateId,
         )
 
 
@@ -312,10 +326,11 @@ class MemberFollowedEvent(DomainEvent):
         Returns:
             MemberFollowedEvent: The created event.
         """
-        return cls(
-            memberId=str(memberId),
+        aggregateId = str(memberId)
+        return cls.model_construct(
+            memberId=aggregateId,
             followedMemberId=str(followedMemberId),
-            aggregateId=str(memberId),
+            aggregateId=aggregateId,
         )
 
 
@@ -341,8 +356,9 @@ class MemberUnfollowedEvent(DomainEvent):
         Returns:
             MemberUnfollowedEvent: The created event.
         """
-        return cls(
-            memberId=str(memberId),
+        aggregateId = str(memberId)
+        return cls.model_construct(
+            memberId=aggregateId,
             unfollowedMemberId=str(unfollowedMemberId),
-            aggregateId=str(memberId),
+            aggregateId=aggregateId,
         )
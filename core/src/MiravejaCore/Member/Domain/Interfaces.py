@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Iterator, Optional
+from typing import Dict, Iterator, List, Optional
 
 from MiravejaCore.Member.Domain.Models import Member
 from MiravejaCore.Shared.Identifiers.Models import MemberId
@@ -22,6 +22,10 @@ class IMemberRepository(ABC):
     def FindById(self, memberId: MemberId) -> Optional[Member]:
         pass
 
+    @abstractmethod
+    def FindByIds(self, memberIds: List[MemberId]) -> Dict[MemberId, Member]:
+        """Load several members in one query; IDs with no stored member are absent from the result."""
+
     @abstractmethod
     def MemberExists(self, memberId: MemberId) -> bool:
         pass
@@ -29,3 +33,7 @@ class IMemberRepository(ABC):
     @abstractmethod
     def Save(self, member: Member) -> None:
         pass
+
+    @abstractmethod
+    def SaveIfAbsent(self, member: Member) -> bool:
+        """Insert the member unless one with the same ID is already stored; returns whether it was inserted."""
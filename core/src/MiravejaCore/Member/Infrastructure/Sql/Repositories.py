@@ -1,5 +1,7 @@
-from typing import Iterator, Optional
+from typing import Dict, Iterator, List, Optional
 
+from sqlalchemy import inspect
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session as DatabaseSession
 
 from MiravejaCore.Member.Domain.Interfaces import IMemberRepository
@@ -22,6 +24,11 @@ class SqlMemberRepository(IMemberRepository):
     ) -> Iterator[Member]:
         dbQuery = self._dbSession.query(MemberEntity)
 
+        # Apply column criteria in SQL so filtered-out rows are never fetched and the page is filled with matches
+        if isinstance(filterFunction, dict):
+            dbQuery = dbQuery.filter_by(**filterFunction)
+            filterFunction = None
+
         # Apply sorting
         sortColumn = getattr(MemberEntity, query.sortBy, None)
         if sortColumn is not None:
@@ -51,6 +58,15 @@ class SqlMemberRepository(IMemberRepository):
             return None
         return Member.FromDatabase(**entity.ToDict())
 
+    def FindByIds(self, memberIds: List[MemberId]) -> Dict[MemberId, Member]:
+        if not memberIds:
+            return {}
+        entities = self._dbSession.query(MemberEntity).filter(
+            MemberEntity.id.in_([str(memberId) for memberId in memberIds])
+        )
+        members = (Member.FromDatabase(**entity.ToDict()) for entity in entities)
+        return {member.id: member for member in members}
+
     def MemberExists(self, memberId: MemberId) -> bool:
         entity = self._dbSession.get(MemberEntity, str(memberId))
         return entity is not None
@@ -63,3 +79,10 @@ class SqlMemberRepository(IMemberRepository):
         except Exception as error:
             self._dbSession.rollback()
             raise error
+
+    def SaveIfAbsent(self, member: Member) -> bool:
+        # The existence check rides on the INSERT itself, so concurrent registrations of one ID cannot both pass it
+        entity = MemberEntity.FromDomain(member)
+        values = {attribute.key: getattr(entity, attribute.key) for attribute in inspect(MemberEntity).column_attrs}
+        statement = insert(MemberEntity).values(**values).on_conflict_do_nothing(index_elements=[MemberEntity.id])
+        return self._dbSession.execute(statement).rowcount == 1
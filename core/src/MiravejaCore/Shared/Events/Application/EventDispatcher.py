@@ -1,8 +1,14 @@
+import asyncio
+from typing import Any, ClassVar, Coroutine, Optional, Set
+
 from MiravejaCore.Shared.Events.Domain.Interfaces import DomainEvent, IEventProducer
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
 
 
 class EventDispatcher:
+    # Dispatchers are built per use, so in-flight background dispatches are held at class level until they finish.
+    _backgroundDispatches: ClassVar[Set["asyncio.Task[None]"]] = set()
+
     def __init__(self, eventProducer: IEventProducer, logger: ILogger):
         self._eventProducer = eventProducer
         self._logger = logger
@@ -21,6 +27,29 @@ class EventDispatcher:
             self._logger.Error(f"Failed to dispatch events: {ex}")
             raise ex
 
+    def DispatchAllInBackground(self, events: list[DomainEvent]) -> "asyncio.Task[None]":
+        """Schedule dispatch of the given domain events without waiting for the event producer."""
+        return self._TrackBackgroundDispatch(self.DispatchAll(events))
+
+    def _TrackBackgroundDispatch(self, dispatch: Coroutine[Any, Any, None]) -> "asyncio.Task[None]":
+        task = asyncio.create_task(dispatch)
+        self._backgroundDispatches.add(task)
+        task.add_done_callback(self._OnBackgroundDispatchDone)
+        return task
+
+    def _OnBackgroundDispatchDone(self, task: "asyncio.Task[None]") -> None:
+        self._backgroundDispatches.discard(task)
+        if not task.cancelled():
+            # DispatchAll already logged any failure; retrieving it keeps asyncio from reporting it again.
+            task.exception()
+
+    @classmethod
+    async def WaitForBackgroundDispatches(cls) -> None:
+        """Wait for every in-flight background dispatch to finish, e.g. before the process shuts down."""
+        if cls._backgroundDispatches:
+            # Failures were already logged by DispatchAll; shutdown should not stop on them.
+            await asyncio.gather(*cls._backgroundDispatches, return_exceptions=True)
+
     async def Dispatch(self, event: DomainEvent) -> None:
         """Dispatch a single domain event using the event producer."""
         if event is None:
@@ -34,3 +63,25 @@ class EventDispatcher:
         except Exception as ex:
             self._logger.Error(f"Failed to dispatch event: {ex}")
             raise ex
+
+
+class BatchingEventDispatcher(EventDispatcher):
+    """EventDispatcher that merges background dispatches issued within the same event-loop tick."""
+
+    def __init__(self, eventProducer: IEventProducer, logger: ILogger):
+        super().__init__(eventProducer, logger)
+        self._pendingEvents: list[DomainEvent] = []
+        self._pendingDispatch: Optional["asyncio.Task[None]"] = None
+
+    def DispatchAllInBackground(self, events: list[DomainEvent]) -> "asyncio.Task[None]":
+        """Buffer the given domain events and dispatch them with any others released before the next loop tick."""
+        self._pendingEvents.extend(events)
+        if self._pendingDispatch is None:
+            self._pendingDispatch = self._TrackBackgroundDispatch(self._DispatchPending())
+        return self._pendingDispatch
+
+    async def _DispatchPending(self) -> None:
+        # Runs on the tick after the first buffered call; later calls start a new batch.
+        events, self._pendingEvents = self._pendingEvents, []
+        self._pendingDispatch = None
+        await self.DispatchAll(events)
@@ -16,8 +16,8 @@ class EventEmitter(IEventEmitter):
 
     def ReleaseEvents(self) -> List[DomainEvent]:
         """Release all emitted domain events and clear the internal event list."""
-        releasedEvents = self.events.copy()
-        self.events.clear()
+        # Hand over the current list and start a new one instead of copying and clearing.
+        releasedEvents, self.events = self.events, []
         return releasedEvents
 
     def ClearEvents(self) -> None:
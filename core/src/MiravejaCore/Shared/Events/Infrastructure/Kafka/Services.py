@@ -130,7 +130,9 @@ class KafkaEventProducer(IEventProducer):
         self._logger.Info(f"Producing {len(events)} events to Kafka.")
 
         try:
-            # Send all events in parallel
+            # Send all events in parallel; each send waits for its own delivery, so no flush is needed here.
+            # Flushing would close the accumulator's open batches early and stop events from concurrent
+            # dispatches from being coalesced into the same record batch within linger_ms.
             results = await asyncio.gather(*(self.Produce(event) for event in events), return_exceptions=True)
 
             # Check for any errors
@@ -138,8 +140,6 @@ class KafkaEventProducer(IEventProducer):
                 if isinstance(result, Exception):
                     self._logger.Error(f"Kafka produce error for event batch: {result}")
 
-            # Flush any remaining messages
-            await self._producer.flush()
             self._logger.Info(f"Successfully produced {len(events)} events to Kafka.")
 
         except Exception as ex:
@@ -1,6 +1,8 @@
 import logging
 from logging import Formatter, Handler
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
 
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
 
@@ -30,3 +32,14 @@ class Logger(ILogger):
 
     def Critical(self, msg: str, *args: Tuple[Any], **kwargs: Dict[str, Any]):
         self._logger.critical(msg, *args, **kwargs)  # type: ignore
+
+
+class LazyJson:
+    """Defers a model's JSON dump until the logger actually formats the record; compact unless an indent is given."""
+
+    def __init__(self, model: BaseModel, indent: Optional[int] = None) -> None:
+        self._model = model
+        self._indent = indent
+
+    def __str__(self) -> str:
+        return self._model.model_dump_json(indent=self._indent)
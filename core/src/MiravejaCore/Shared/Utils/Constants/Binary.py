@@ -1,10 +1,12 @@
-SIZE_1_KB = 1024  # 1 KB
+from typing import Final
 
-SIZE_1_MB = 1024 * 1024  # 1 MB
-SIZE_16_MB = 16 * 1024 * 1024  # 16 MB
-SIZE_32_MB = 32 * 1024 * 1024  # 32 MB
-SIZE_64_MB = 64 * 1024 * 1024  # 64 MB
-SIZE_128_MB = 128 * 1024 * 1024  # 128 MB
-SIZE_256_MB = 256 * 1024 * 1024  # 256 MB
-SIZE_512_MB = 512 * 1024 * 1024  # 512 MB
-SIZE_1_GB = 1024 * 1024 * 1024  # 1 GB
+SIZE_1_KB: Final[int] = 1024  # 1 KB
+
+SIZE_1_MB: Final[int] = 1024 * 1024  # 1 MB
+SIZE_16_MB: Final[int] = 16 * 1024 * 1024  # 16 MB
+SIZE_32_MB: Final[int] = 32 * 1024 * 1024  # 32 MB
+SIZE_64_MB: Final[int] = 64 * 1024 * 1024  # 64 MB
+SIZE_128_MB: Final[int] = 128 * 1024 * 1024  # 128 MB
+SIZE_256_MB: Final[int] = 256 * 1024 * 1024  # 256 MB
+SIZE_512_MB: Final[int] = 512 * 1024 * 1024  # 512 MB
+SIZE_1_GB: Final[int] = 1024 * 1024 * 1024  # 1 GB
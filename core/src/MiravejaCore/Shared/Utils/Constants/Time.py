@@ -1,7 +1,9 @@
-MILLIS_1_SEC = 1000  # 1 second
-MILLIS_3_SEC = 3000  # 3 seconds
-MILLIS_5_SEC = 5000  # 5 seconds
-MILLIS_10_SEC = 10000  # 10 seconds
-MILLIS_30_SEC = 30000  # 30 seconds
+from typing import Final
 
-SECONDS_1_HOUR = 3600  # 1 hour
+MILLIS_1_SEC: Final[int] = 1000  # 1 second
+MILLIS_3_SEC: Final[int] = 3000  # 3 seconds
+MILLIS_5_SEC: Final[int] = 5000  # 5 seconds
+MILLIS_10_SEC: Final[int] = 10000  # 10 seconds
+MILLIS_30_SEC: Final[int] = 30000  # 30 seconds
+
+SECONDS_1_HOUR: Final[int] = 3600  # 1 hour
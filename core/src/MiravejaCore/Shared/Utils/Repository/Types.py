@@ -1,3 +1,6 @@
-from typing import Callable
+from typing import Any, Callable, Dict, Union
 
-FilterFunction = Callable[[object], bool]
+FilterPredicate = Callable[[object], bool]
+# Column name -> required value; SQL repositories apply these in the query, before pagination
+FilterCriteria = Dict[str, Any]
+FilterFunction = Union[FilterPredicate, FilterCriteria]
@@ -190,6 +190,29 @@ class TestRegisterGenerationMetadataHandler:
         assert savedMetadata.negativePrompt is None
         assert savedMetadata.loras is None or savedMetadata.loras == []
 
+    def test_HandleWithCallerDatabaseManager_ShouldSaveWithoutCreatingOrCommitting(self, mock_dependencies):
+        """Test that Handle joins the caller's database manager and leaves the commit to the caller."""
+        # Arrange
+        handler = RegisterGenerationMetadataHandler(
+            databaseManagerFactory=mock_dependencies["database_manager_factory"],
+            tGenerationMetadataRepository=IGenerationMetadataRepository,
+            findLoraMetadataByHashHandler=mock_dependencies["find_lora_metadata_handler"],
+            registerLoraMetadataHandler=mock_dependencies["register_lora_metadata_handler"],
+            logger=mock_dependencies["logger"],
+        )
+
+        imageId = ImageMetadataId(id=42)
+        command = RegisterGenerationMetadataCommand(prompt="A beautiful landscape")
+
+        # Act
+        result = handler.Handle(imageId, command, databaseManager=mock_dependencies["database_manager"])
+
+        # Assert
+        assert result == 100
+        mock_dependencies["database_manager_factory"].Create.assert_not_called()
+        mock_dependencies["generation_metadata_repository"].Save.assert_called_once()
+        mock_dependencies["database_manager"].Commit.assert_not_called()
+
     def test_HandleWithCompleteCommandNoLoras_ShouldRegisterGenerationMetadataWithAllFields(self, mock_dependencies):
         """Test that Handle registers generation metadata with complete command data without LoRAs."""
         # Arrange
@@ -261,7 +284,9 @@ class TestRegisterGenerationMetadataHandler:
         assert result == 100
         mock_dependencies["find_lora_metadata_handler"].Handle.assert_called_once_with("lora_hash_123")
         mock_dependencies["register_lora_metadata_handler"].Handle.assert_not_called()
-        mock_dependencies["logger"].Debug.assert_any_call("LoRA with hash lora_hash_123 already exists with ID 50")
+        mock_dependencies["logger"].Debug.assert_any_call(
+            "LoRA with hash %s already exists with ID %s", "lora_hash_123", 50
+        )
 
         savedMetadata = mock_dependencies["generation_metadata_repository"].Save.call_args[0][0]
         assert len(savedMetadata.loras) == 1
@@ -294,7 +319,9 @@ class TestRegisterGenerationMetadataHandler:
         assert result == 100
         mock_dependencies["find_lora_metadata_handler"].Handle.assert_called_once_with("new_lora_hash")
         mock_dependencies["register_lora_metadata_handler"].Handle.assert_called_once_with(loraCommand)
-        mock_dependencies["logger"].Debug.assert_any_call("Registered new LoRA with hash new_lora_hash and ID 60")
+        mock_dependencies["logger"].Debug.assert_any_call(
+            "Registered new LoRA with hash %s and ID %s", "new_lora_hash", 60
+        )
 
         savedMetadata = mock_dependencies["generation_metadata_repository"].Save.call_args[0][0]
         assert len(savedMetadata.loras) == 1
@@ -415,4 +442,4 @@ class TestRegisterGenerationMetadataHandler:
         assert result == 100
         assert mock_dependencies["logger"].Info.call_count >= 2  # Start and end logging
         assert mock_dependencies["logger"].Debug.call_count >= 1  # Debug logging for entity creation
-        mock_dependencies["logger"].Info.assert_any_call("Generation metadata registered with ID: 100")
+        mock_dependencies["logger"].Info.assert_any_call("Generation metadata registered with ID: %s", 100)
@@ -5,12 +5,14 @@ This module contains tests for registering image metadata including
 validation, repository interactions, and error handling scenarios.
 """
 
+import asyncio
 from typing import Type
 from unittest.mock import Mock, AsyncMock
 import pytest
 from pydantic import ValidationError
 
 from MiravejaCore.Gallery.Application.RegisterImageMetadata import (
+    MAX_CONCURRENT_STORAGE_CHECKS,
     RegisterImageMetadataCommand,
     RegisterImageMetadataHandler,
 )
@@ -24,7 +26,6 @@ from MiravejaCore.Gallery.Domain.Exceptions import (
     ImageContentNotFoundException,
 )
 from MiravejaCore.Gallery.Domain.Interfaces import IImageMetadataRepository
-from MiravejaCore.Gallery.Domain.Models import ImageMetadata
 from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import ImageMetadataId, VectorId
 
@@ -169,6 +170,38 @@ class TestRegisterImageMetadataCommand:
 
         assert "String should have at most 200 characters" in str(exc_info.value)
 
+    def test_FromTrustedWithValidatedData_ShouldBuildCommandWithoutValidation(self):
+        """Test that FromTrusted builds an equivalent command while skipping field validation."""
+        # Arrange
+        data = {
+            "ownerId": "99999999-9999-9999-9999-999999999999",
+            "title": "Replayed Image",
+            "subtitle": "Replayed Subtitle",
+            "description": None,
+            "width": 640,
+            "height": 480,
+            "repositoryType": ImageRepositoryType.S3,
+            "uri": "https://example.com/replayed.jpg",
+            "isAiGenerated": False,
+            "generationMetadata": None,
+            "vectorId": None,
+        }
+
+        # Act
+        command = RegisterImageMetadataCommand.FromTrusted(**data)
+
+        # Assert
+        assert command == RegisterImageMetadataCommand(**data)
+
+    def test_FromTrustedWithInvalidData_ShouldNotRaise(self):
+        """Test that FromTrusted leaves validation to the caller."""
+        # Act
+        command = RegisterImageMetadataCommand.FromTrusted(ownerId="owner", title="", width=0)
+
+        # Assert
+        assert command.title == ""
+        assert command.width == 0
+
 
 class TestRegisterImageMetadataHandler:
     """Tests for RegisterImageMetadataHandler business logic."""
@@ -181,6 +214,7 @@ class TestRegisterImageMetadataHandler:
         mock_repository = Mock()
         mock_generation_handler = Mock(spec=RegisterGenerationMetadataHandler)
         mock_image_content_repository = AsyncMock()  # Async methods need AsyncMock
+        mock_image_content_repository.ExistsAndIsOwnedBy.return_value = (True, True)
         mock_event_dispatcher = Mock(spec=EventDispatcher)
         mock_logger = Mock()
 
@@ -188,6 +222,7 @@ class TestRegisterImageMetadataHandler:
         mock_uow_factory.Create.return_value.__enter__ = Mock(return_value=mock_uow)
         mock_uow_factory.Create.return_value.__exit__ = Mock(return_value=None)
         mock_uow.GetRepository.return_value = mock_repository
+        mock_repository.FindExistingUris.return_value = set()  # No existing image
 
         return {
             "uow_factory": mock_uow_factory,
@@ -231,7 +266,6 @@ class TestRegisterImageMetadataHandler:
         )
 
         image_id = ImageMetadataId(id=42)
-        mock_dependencies["repository"].FindByUri.return_value = None  # No existing image
         mock_dependencies["repository"].GenerateNewId.return_value = image_id
 
         # Act
@@ -239,11 +273,11 @@ class TestRegisterImageMetadataHandler:
 
         # Assert
         assert result == 42
-        mock_dependencies["repository"].FindByUri.assert_called_once_with(command.uri)
+        mock_dependencies["repository"].FindExistingUris.assert_called_once_with({command.uri})
         mock_dependencies["repository"].GenerateNewId.assert_called_once()
         mock_dependencies["repository"].Save.assert_called_once()
-        assert mock_dependencies["uow"].Commit.call_count == 2  # Called twice: after save and after generation
-        mock_dependencies["event_dispatcher"].DispatchAll.assert_called_once()
+        mock_dependencies["uow"].Commit.assert_called_once()
+        mock_dependencies["event_dispatcher"].DispatchAllInBackground.assert_called_once()
         mock_dependencies["logger"].Info.assert_called()
 
     @pytest.mark.asyncio
@@ -266,15 +300,14 @@ class TestRegisterImageMetadataHandler:
             vectorId=None,
         )
 
-        existing_image = Mock(spec=ImageMetadata)
-        mock_dependencies["repository"].FindByUri.return_value = existing_image
+        mock_dependencies["repository"].FindExistingUris.return_value = {command.uri}
 
         # Act & Assert
         with pytest.raises(ImageMetadataUriAlreadyExistsException) as exc_info:
             await handler.Handle(command)
 
         assert str(exc_info.value) == f"Image metadata with URI '{command.uri}' already exists."
-        mock_dependencies["repository"].FindByUri.assert_called_once_with(command.uri)
+        mock_dependencies["repository"].FindExistingUris.assert_called_once_with({command.uri})
         mock_dependencies["repository"].Save.assert_not_called()
         mock_dependencies["uow"].Commit.assert_not_called()
 
@@ -298,7 +331,6 @@ class TestRegisterImageMetadataHandler:
         )
 
         image_id = ImageMetadataId(id=123)
-        mock_dependencies["repository"].FindByUri.return_value = None
         mock_dependencies["repository"].GenerateNewId.return_value = image_id
 
         # Act
@@ -307,11 +339,11 @@ class TestRegisterImageMetadataHandler:
         # Assert
         assert result == 123
         mock_dependencies["generation_handler"].Handle.assert_called_once_with(
-            imageId=image_id, command=generation_metadata
+            imageId=image_id, command=generation_metadata, databaseManager=mock_dependencies["uow"]
         )
         mock_dependencies["repository"].Save.assert_called_once()
-        assert mock_dependencies["uow"].Commit.call_count == 2  # Called twice: after save and after generation
-        mock_dependencies["event_dispatcher"].DispatchAll.assert_called_once()
+        mock_dependencies["uow"].Commit.assert_called_once()
+        mock_dependencies["event_dispatcher"].DispatchAllInBackground.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_HandleAiGeneratedImageWithoutMetadata_ShouldNotCallGenerationHandler(
@@ -334,7 +366,6 @@ class TestRegisterImageMetadataHandler:
         )
 
         image_id = ImageMetadataId(id=456)
-        mock_dependencies["repository"].FindByUri.return_value = None
         mock_dependencies["repository"].GenerateNewId.return_value = image_id
 
         # Act
@@ -344,10 +375,8 @@ class TestRegisterImageMetadataHandler:
         assert result == 456
         mock_dependencies["generation_handler"].Handle.assert_not_called()
         mock_dependencies["repository"].Save.assert_called_once()
-        assert (
-            mock_dependencies["uow"].Commit.call_count == 2
-        )  # Still called twice (second commit even when no generation)
-        mock_dependencies["event_dispatcher"].DispatchAll.assert_called_once()
+        mock_dependencies["uow"].Commit.assert_called_once()
+        mock_dependencies["event_dispatcher"].DispatchAllInBackground.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_HandleNonAiGeneratedImage_ShouldNotCallGenerationHandler(self, handler, mock_dependencies):
@@ -368,7 +397,6 @@ class TestRegisterImageMetadataHandler:
         )
 
         image_id = ImageMetadataId(id=789)
-        mock_dependencies["repository"].FindByUri.return_value = None
         mock_dependencies["repository"].GenerateNewId.return_value = image_id
 
         # Act
@@ -378,16 +406,12 @@ class TestRegisterImageMetadataHandler:
         assert result == 789
         mock_dependencies["generation_handler"].Handle.assert_not_called()
         mock_dependencies["repository"].Save.assert_called_once()
-        assert (
-            mock_dependencies["uow"].Commit.call_count == 2
-        )  # Still called twice (second commit even when no generation)
-        mock_dependencies["event_dispatcher"].DispatchAll.assert_called_once()
+        mock_dependencies["uow"].Commit.assert_called_once()
+        mock_dependencies["event_dispatcher"].DispatchAllInBackground.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_HandleImageNotExistsInStorage_ShouldRaiseImageContentNotFoundException(
-        self, handler, mock_dependencies
-    ):
-        """Test that handler raises exception when image doesn't exist in storage."""
+    async def test_HandleImageNotExistsInStorage_ShouldRaiseBeforeOpeningTransaction(self, handler, mock_dependencies):
+        """Test that handler fails on missing storage content without opening a database transaction."""
         # Arrange
         command = RegisterImageMetadataCommand(
             ownerId="12345678-1234-1234-1234-123456789012",
@@ -403,14 +427,15 @@ class TestRegisterImageMetadataHandler:
             vectorId=None,
         )
 
-        mock_dependencies["repository"].FindByUri.return_value = None
-        mock_dependencies["image_content_repository"].Exists.return_value = False
+        mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.return_value = (False, False)
 
         # Act & Assert
         with pytest.raises(ImageContentNotFoundException):
             await handler.Handle(command)
 
-        mock_dependencies["image_content_repository"].Exists.assert_called_once_with(command.uri)
+        mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.assert_called_once()
+        assert mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.call_args[0][0] == command.uri
+        mock_dependencies["uow_factory"].Create.assert_not_called()
         mock_dependencies["repository"].Save.assert_not_called()
 
     @pytest.mark.asyncio
@@ -431,16 +456,219 @@ class TestRegisterImageMetadataHandler:
             vectorId=None,
         )
 
-        mock_dependencies["repository"].FindByUri.return_value = None
-        mock_dependencies["image_content_repository"].Exists.return_value = True
-        mock_dependencies["image_content_repository"].IsOwnedBy.return_value = False
+        mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.return_value = (True, False)
 
         # Act & Assert
         with pytest.raises(ImageContentNotFoundException):
             await handler.Handle(command)
 
-        mock_dependencies["image_content_repository"].IsOwnedBy.assert_called_once()
-        call_args = mock_dependencies["image_content_repository"].IsOwnedBy.call_args
+        mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.assert_called_once()
+        call_args = mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.call_args
         assert call_args[0][0] == command.uri
         assert call_args[0][1].id == command.ownerId
         mock_dependencies["repository"].Save.assert_not_called()
+
+    def _create_batch_command(self, uri, generation_metadata=None):
+        """Helper method to create a command for batch registration tests."""
+        return RegisterImageMetadataCommand(
+            ownerId="99999999-9999-9999-9999-999999999999",
+            title="Batch Image",
+            subtitle="Batch Subtitle",
+            description=None,
+            width=640,
+            height=480,
+            repositoryType=ImageRepositoryType.S3,
+            uri=uri,
+            isAiGenerated=generation_metadata is not None,
+            generationMetadata=generation_metadata,
+            vectorId=None,
+        )
+
+    @pytest.mark.asyncio
+    async def test_HandleBatchValidCommands_ShouldSaveAllInOneTransaction(self, handler, mock_dependencies):
+        """Test that HandleBatch saves every image with one SaveMany, commits once and dispatches all events."""
+        # Arrange
+        generation_metadata = Mock(spec=RegisterGenerationMetadataCommand)
+        commands = [
+            self._create_batch_command("https://example.com/batch-1.jpg"),
+            self._create_batch_command("https://example.com/batch-2.jpg", generation_metadata),
+        ]
+        mock_dependencies["repository"].GenerateNewIds.return_value = [ImageMetadataId(id=1), ImageMetadataId(id=2)]
+
+        # Act
+        result = await handler.HandleBatch(commands)
+
+        # Assert
+        assert result == [1, 2]
+        mock_dependencies["repository"].GenerateNewIds.assert_called_once_with(2)
+        mock_dependencies["repository"].GenerateNewId.assert_not_called()
+        mock_dependencies["repository"].FindExistingUris.assert_called_once_with({command.uri for command in commands})
+        assert mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.call_count == 2
+        mock_dependencies["uow_factory"].Create.assert_called_once()
+        mock_dependencies["repository"].Save.assert_not_called()
+        savedImages = mock_dependencies["repository"].SaveMany.call_args[0][0]
+        assert [image.uri for image in savedImages] == [command.uri for command in commands]
+        mock_dependencies["generation_handler"].Handle.assert_called_once_with(
+            imageId=ImageMetadataId(id=2), command=generation_metadata, databaseManager=mock_dependencies["uow"]
+        )
+        mock_dependencies["uow"].Commit.assert_called_once()
+        dispatchedEvents = mock_dependencies["event_dispatcher"].DispatchAllInBackground.call_args[0][0]
+        assert len(dispatchedEvents) == 2
+
+    @pytest.mark.asyncio
+    async def test_HandleBatchRepeatedUri_ShouldRaiseImageMetadataUriAlreadyExistsException(
+        self, handler, mock_dependencies
+    ):
+        """Test that HandleBatch rejects a URI repeated within the batch before saving anything."""
+        # Arrange
+        commands = [
+            self._create_batch_command("https://example.com/same.jpg"),
+            self._create_batch_command("https://example.com/same.jpg"),
+        ]
+
+        # Act & Assert
+        with pytest.raises(ImageMetadataUriAlreadyExistsException):
+            await handler.HandleBatch(commands)
+
+        mock_dependencies["repository"].SaveMany.assert_not_called()
+        mock_dependencies["uow"].Commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_HandleBatchMissingImageContent_ShouldRaiseBeforeOpeningTransaction(self, handler, mock_dependencies):
+        """Test that HandleBatch fails on missing storage content without opening a database transaction."""
+        # Arrange
+        commands = [
+            self._create_batch_command("https://example.com/present.jpg"),
+            self._create_batch_command("https://example.com/missing.jpg"),
+        ]
+        mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.side_effect = [(True, True), (False, False)]
+
+        # Act & Assert
+        with pytest.raises(ImageContentNotFoundException):
+            await handler.HandleBatch(commands)
+
+        mock_dependencies["uow_factory"].Create.assert_not_called()
+        mock_dependencies["event_dispatcher"].DispatchAllInBackground.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_HandleBatchLargeBatch_ShouldCapConcurrentStorageChecks(self, handler, mock_dependencies):
+        """Test that HandleBatch never runs more than MAX_CONCURRENT_STORAGE_CHECKS storage checks at once."""
+        # Arrange
+        commands = [
+            self._create_batch_command(f"https://example.com/batch-{index}.jpg")
+            for index in range(MAX_CONCURRENT_STORAGE_CHECKS + 8)
+        ]
+        mock_dependencies["repository"].GenerateNewIds.return_value = [
+            ImageMetadataId(id=index + 1) for index in range(len(commands))
+        ]
+        inFlight = 0
+        peakInFlight = 0
+
+        async def exists_and_is_owned_by(uri, ownerId):
+            nonlocal inFlight, peakInFlight
+            inFlight += 1
+            peakInFlight = max(peakInFlight, inFlight)
+            await asyncio.sleep(0)
+            inFlight -= 1
+            return (True, True)
+
+        mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.side_effect = exists_and_is_owned_by
+
+        # Act
+        await handler.HandleBatch(commands)
+
+        # Assert
+        assert mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.call_count == len(commands)
+        assert peakInFlight == MAX_CONCURRENT_STORAGE_CHECKS
+
+    @pytest.fixture
+    def trusting_handler(self, mock_dependencies):
+        """Create a handler that trusts the presigned upload flow."""
+        mock_dependencies["image_content_repository"].GetKeyUri = Mock(
+            side_effect=lambda key: f"http://minio.local:9000/bucket/{key}"
+        )
+        return RegisterImageMetadataHandler(
+            databaseManagerFactory=mock_dependencies["uow_factory"],
+            tImageMetadataRepository=IImageMetadataRepository,
+            registerGenerationMetadataHandler=mock_dependencies["generation_handler"],
+            imageContentRepository=mock_dependencies["image_content_repository"],
+            eventDispatcher=mock_dependencies["event_dispatcher"],
+            logger=mock_dependencies["logger"],
+            trustPresignedUploads=True,
+        )
+
+    @pytest.mark.asyncio
+    async def test_HandleTrustingPresignedUploadsWithOwnerPrefix_ShouldSkipStorageCheck(
+        self, trusting_handler, mock_dependencies
+    ):
+        """Test that a trusting handler registers an image under the owner's prefix without asking storage."""
+        # Arrange
+        command = self._create_batch_command(
+            "http://minio.local:9000/bucket/99999999-9999-9999-9999-999999999999/gallery/image.jpg"
+        )
+        mock_dependencies["repository"].GenerateNewId.return_value = ImageMetadataId(id=7)
+
+        # Act
+        result = await trusting_handler.Handle(command)
+
+        # Assert
+        assert result == 7
+        mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.assert_not_called()
+        mock_dependencies["repository"].Save.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_HandleTrustingPresignedUploadsWithForeignPrefix_ShouldRaiseImageContentNotFoundException(
+        self, trusting_handler, mock_dependencies
+    ):
+        """Test that a trusting handler still rejects a URI under another member's prefix."""
+        # Arrange
+        command = self._create_batch_command(
+            "http://minio.local:9000/bucket/12345678-1234-1234-1234-123456789012/gallery/image.jpg"
+        )
+
+        # Act & Assert
+        with pytest.raises(ImageContentNotFoundException):
+            await trusting_handler.Handle(command)
+
+        mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.assert_not_called()
+        mock_dependencies["repository"].Save.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "uri",
+        [
+            "https://evil.example/x/99999999-9999-9999-9999-999999999999/gallery/image.jpg",
+            "http://minio.local:9000/other-bucket/99999999-9999-9999-9999-999999999999/gallery/image.jpg",
+            "http://minio.local:9000/bucket/image.jpg?next=/99999999-9999-9999-9999-999999999999/gallery/",
+            "http://minio.local:9000/bucket/99999999-9999-9999-9999-999999999999/gallery/../../other/image.jpg",
+        ],
+        ids=["foreign-host", "foreign-bucket", "prefix-in-query-string", "parent-segment"],
+    )
+    async def test_HandleTrustingPresignedUploadsWithUriOutsideOwnerPrefix_ShouldRaiseImageContentNotFoundException(
+        self, trusting_handler, mock_dependencies, uri
+    ):
+        """Test that a trusting handler rejects URIs that only contain the owner's prefix instead of starting with it."""
+        # Arrange
+        command = self._create_batch_command(uri)
+
+        # Act & Assert
+        with pytest.raises(ImageContentNotFoundException):
+            await trusting_handler.Handle(command)
+
+        mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.assert_not_called()
+        mock_dependencies["repository"].Save.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_HandleS3Image_ShouldReuseOneOwnerIdForCheckAndEntity(self, handler, mock_dependencies):
+        """Test that Handle builds the owner ID once and shares it between the storage check and the entity."""
+        # Arrange
+        command = self._create_batch_command("https://example.com/owned.jpg")
+        mock_dependencies["repository"].GenerateNewId.return_value = ImageMetadataId(id=8)
+
+        # Act
+        await handler.Handle(command)
+
+        # Assert
+        checkedOwnerId = mock_dependencies["image_content_repository"].ExistsAndIsOwnedBy.call_args[0][1]
+        savedImage = mock_dependencies["repository"].Save.call_args[0][0]
+        assert savedImage.ownerId is checkedOwnerId
@@ -10,6 +10,7 @@ from MiravejaCore.Gallery.Domain.Interfaces import ILoraMetadataRepository
 from MiravejaCore.Gallery.Domain.Models import LoraMetadata
 from MiravejaCore.Shared.Identifiers.Models import LoraMetadataId
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
+from MiravejaCore.Shared.Logging.Models import LazyJson
 
 
 class TestRegisterLoraMetadataCommand:
@@ -85,10 +86,11 @@ class TestRegisterLoraMetadataHandler:
         # Assert
         assert result == 42
         mock_dependencies["logger"].Info.assert_called()
-        # The log message includes the object representation (e.g., "id=42")
-        debugCallArgs = mock_dependencies["logger"].Debug.call_args[0][0]
-        assert "Creating LoRA metadata entity with ID:" in debugCallArgs
-        assert "42" in debugCallArgs
+        # The log message is formatted lazily; render it to check the object representation (e.g., "id=42")
+        debugCallArgs = mock_dependencies["logger"].Debug.call_args[0]
+        debugMessage = debugCallArgs[0] % debugCallArgs[1:]
+        assert "Creating LoRA metadata entity with ID:" in debugMessage
+        assert "42" in debugMessage
         mock_dependencies["lora_metadata_repository"].Save.assert_called_once()
         mock_dependencies["database_manager"].Commit.assert_called_once()
 
@@ -121,6 +123,26 @@ class TestRegisterLoraMetadataHandler:
         assert savedMetadata.hash == "test_hash_456"
         assert savedMetadata.name == "CustomStyleLoRA"
 
+    def test_HandleLogsCommand_ShouldDeferSerializationToLogger(self, mock_dependencies):
+        """Test that Handle passes the command lazily so it is only serialized when the record is emitted."""
+        # Arrange
+        handler = RegisterLoraMetadataHandler(
+            databaseManagerFactory=mock_dependencies["database_manager_factory"],
+            tLoraMetadataRepository=ILoraMetadataRepository,
+            logger=mock_dependencies["logger"],
+        )
+
+        command = RegisterLoraMetadataCommand(hash="test_hash_789")
+
+        # Act
+        handler.Handle(command)
+
+        # Assert
+        firstInfoCall = mock_dependencies["logger"].Info.call_args_list[0]
+        assert firstInfoCall[0][0] == "Registering LoRA metadata with command: %s"
+        assert isinstance(firstInfoCall[0][1], LazyJson)
+        assert str(firstInfoCall[0][1]) == command.model_dump_json()
+
     def test_HandleLogsCorrectly_ShouldCallLoggerMethods(self, mock_dependencies):
         """Test that Handle logs appropriate information during execution."""
         # Arrange
@@ -141,7 +163,7 @@ class TestRegisterLoraMetadataHandler:
         mock_dependencies["logger"].Debug.assert_called_once()
 
         # Check specific log messages
-        infoCallArgs = [call[0][0] for call in mock_dependencies["logger"].Info.call_args_list]
+        infoCallArgs = [call[0][0] % call[0][1:] for call in mock_dependencies["logger"].Info.call_args_list]
         assert any("Registering LoRA metadata with command" in msg for msg in infoCallArgs)
         # The final log message includes the object representation, just check for the key parts
         assert any("LoRA metadata registered with ID:" in msg and "42" in msg for msg in infoCallArgs)
@@ -162,9 +184,8 @@ class TestRegisterLoraMetadataHandler:
 
         # Assert
         assert result == 42
-        # Verify GetRepository was called twice (once for GenerateNewId, once for Save)
-        assert mock_dependencies["database_manager"].GetRepository.call_count == 2
-        mock_dependencies["database_manager"].GetRepository.assert_called_with(ILoraMetadataRepository)
+        # Verify the repository is resolved once and reused for GenerateNewId and Save
+        mock_dependencies["database_manager"].GetRepository.assert_called_once_with(ILoraMetadataRepository)
 
     def test_HandleCommitsTransaction_ShouldCallCommit(self, mock_dependencies):
         """Test that Handle commits the transaction after saving."""
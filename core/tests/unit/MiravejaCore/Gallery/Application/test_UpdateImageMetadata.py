@@ -6,7 +6,7 @@ validation, repository interactions, and error handling scenarios.
 """
 
 from typing import Type
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 import pytest
 from pydantic import ValidationError
 
@@ -16,10 +16,31 @@ from MiravejaCore.Gallery.Application.UpdateImageMetadata import (
 )
 from MiravejaCore.Gallery.Domain.Exceptions import ImageMetadataNotFoundException
 from MiravejaCore.Gallery.Domain.Interfaces import IImageMetadataRepository
-from MiravejaCore.Gallery.Domain.Models import ImageMetadata
-from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import ImageMetadataId, VectorId
 
+_TOO_SHORT = "string_too_short"
+_TOO_LONG = "string_too_long"
+
+_EXISTING_VECTOR_ID = "3f2b8c1e-5d4a-4e6f-9b7c-1a2d3e4f5a6b"
+_NEW_VECTOR_ID = "7c9e6679-7425-40de-944b-e07fc1f90ae7"
+
+_VECTOR_ID_CACHE: dict[str, VectorId] = {}
+_IMAGE_METADATA_ID_CACHE: dict[int, ImageMetadataId] = {}
+
+
+def _vid(value: str) -> VectorId:
+    """Return a cached VectorId, validating each distinct value only once."""
+    if value not in _VECTOR_ID_CACHE:
+        _VECTOR_ID_CACHE[value] = VectorId(id=value)
+    return _VECTOR_ID_CACHE[value]
+
+
+def _imid(value: int) -> ImageMetadataId:
+    """Return a cached ImageMetadataId, validating each distinct value only once."""
+    if value not in _IMAGE_METADATA_ID_CACHE:
+        _IMAGE_METADATA_ID_CACHE[value] = ImageMetadataId(id=value)
+    return _IMAGE_METADATA_ID_CACHE[value]
+
 
 class TestUpdateImageMetadataCommand:
     """Tests for UpdateImageMetadataCommand validation."""
@@ -96,55 +117,30 @@ class TestUpdateImageMetadataCommand:
         assert command.vectorId is None
         assert command.removeVectorId is True
 
-    def test_EmptyTitle_ShouldRaiseValidationError(self):
-        """Test that empty title raises ValidationError."""
-        # Arrange, Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
-            UpdateImageMetadataCommand(
-                title="", subtitle=None, description=None, vectorId=None, removeVectorId=False
-            )  # Empty title
-
-        assert "String should have at least 1 character" in str(exc_info.value)
-
-    def test_TitleTooLong_ShouldRaiseValidationError(self):
-        """Test that title exceeding max length raises ValidationError."""
-        # Arrange, Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
-            UpdateImageMetadataCommand(
-                title="x" * 201, subtitle=None, description=None, vectorId=None, removeVectorId=False
-            )  # Exceeds max length of 200
-
-        assert "String should have at most 200 characters" in str(exc_info.value)
-
-    def test_EmptySubtitle_ShouldRaiseValidationError(self):
-        """Test that empty subtitle raises ValidationError."""
-        # Arrange, Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
-            UpdateImageMetadataCommand(
-                title=None, subtitle="", description=None, vectorId=None, removeVectorId=False
-            )  # Empty subtitle
-
-        assert "String should have at least 1 character" in str(exc_info.value)
-
-    def test_SubtitleTooLong_ShouldRaiseValidationError(self):
-        """Test that subtitle exceeding max length raises ValidationError."""
-        # Arrange, Act & Assert
-        with pytest.raises(ValidationError) as exc_info:
-            UpdateImageMetadataCommand(
-                title=None, subtitle="x" * 201, description=None, vectorId=None, removeVectorId=False
-            )  # Exceeds max length of 200
-
-        assert "String should have at most 200 characters" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "field,value,expected_error_type",
+        [
+            ("title", "", _TOO_SHORT),
+            ("title", "x" * 201, _TOO_LONG),
+            ("subtitle", "", _TOO_SHORT),
+            ("subtitle", "x" * 201, _TOO_LONG),
+            ("description", "x" * 2001, _TOO_LONG),
+        ],
+        ids=["EmptyTitle", "TitleTooLong", "EmptySubtitle", "SubtitleTooLong", "DescriptionTooLong"],
+    )
+    def test_InvalidField_ShouldRaiseValidationError(self, field, value, expected_error_type):
+        """Test that out-of-bounds text fields raise ValidationError."""
+        # Arrange
+        kwargs = {"title": None, "subtitle": None, "description": None, "vectorId": None, "removeVectorId": False}
+        kwargs[field] = value
 
-    def test_DescriptionTooLong_ShouldRaiseValidationError(self):
-        """Test that description exceeding max length raises ValidationError."""
-        # Arrange, Act & Assert
+        # Act & Assert
         with pytest.raises(ValidationError) as exc_info:
-            UpdateImageMetadataCommand(
-                title=None, subtitle=None, description="x" * 2001, vectorId=None, removeVectorId=False
-            )  # Exceeds max length of 2000
+            UpdateImageMetadataCommand(**kwargs)
 
-        assert "String should have at most 2000 characters" in str(exc_info.value)
+        error = exc_info.value.errors()[0]
+        assert error["type"] == expected_error_type
+        assert error["loc"] == (field,)
 
     def test_NegativeVectorId_ShouldCreateSuccessfully(self):
         """Test that negative vectorId is allowed (validation handled elsewhere)."""
@@ -157,6 +153,18 @@ class TestUpdateImageMetadataCommand:
         assert command.vectorId == -1
 
 
+@pytest.fixture(scope="module")
+def base_image_id():
+    """Shared image metadata identifier, built once per module."""
+    return _imid(123)
+
+
+@pytest.fixture(scope="module")
+def base_command_kwargs():
+    """Default (no-op) command fields shared by the handler tests."""
+    return {"title": None, "subtitle": None, "description": None, "vectorId": None, "removeVectorId": False}
+
+
 class TestUpdateImageMetadataHandler:
     """Tests for UpdateImageMetadataHandler business logic."""
 
@@ -166,7 +174,7 @@ class TestUpdateImageMetadataHandler:
         mock_uow_factory = Mock()
         mock_uow = Mock()
         mock_repository = Mock()
-        mock_event_dispatcher = Mock(spec=EventDispatcher)
+        mock_event_dispatcher = Mock(DispatchAll=AsyncMock())
         mock_logger = Mock()
 
         # Setup UoW chain
@@ -195,23 +203,21 @@ class TestUpdateImageMetadataHandler:
     @pytest.fixture
     def mock_image_metadata(self):
         """Create a mock image metadata object."""
-        mock_metadata = Mock(spec=ImageMetadata)
+        mock_metadata = Mock()
         mock_metadata.title = "Original Title"
         mock_metadata.subtitle = "Original Subtitle"
         mock_metadata.description = "Original Description"
-        mock_metadata.vectorId = VectorId(id=456)
+        mock_metadata.vectorId = _vid(_EXISTING_VECTOR_ID)
         return mock_metadata
 
     @pytest.mark.asyncio
     async def test_HandleUpdateTitle_ShouldUpdateTitleSuccessfully(
-        self, handler, mock_dependencies, mock_image_metadata
+        self, handler, mock_dependencies, mock_image_metadata, base_image_id, base_command_kwargs
     ):
         """Test successful title update."""
         # Arrange
-        image_id = ImageMetadataId(id=123)
-        command = UpdateImageMetadataCommand(
-            title="New Title", subtitle=None, description=None, vectorId=None, removeVectorId=False
-        )
+        image_id = base_image_id
+        command = UpdateImageMetadataCommand.model_construct(**{**base_command_kwargs, "title": "New Title"})
         mock_dependencies["repository"].FindById.return_value = mock_image_metadata
 
         # Act
@@ -227,14 +233,12 @@ class TestUpdateImageMetadataHandler:
 
     @pytest.mark.asyncio
     async def test_HandleUpdateSubtitle_ShouldUpdateSubtitleSuccessfully(
-        self, handler, mock_dependencies, mock_image_metadata
+        self, handler, mock_dependencies, mock_image_metadata, base_image_id, base_command_kwargs
     ):
         """Test successful subtitle update."""
         # Arrange
-        image_id = ImageMetadataId(id=123)
-        command = UpdateImageMetadataCommand(
-            title=None, subtitle="New Subtitle", description=None, vectorId=None, removeVectorId=False
-        )
+        image_id = base_image_id
+        command = UpdateImageMetadataCommand.model_construct(**{**base_command_kwargs, "subtitle": "New Subtitle"})
         mock_dependencies["repository"].FindById.return_value = mock_image_metadata
 
         # Act
@@ -251,13 +255,13 @@ class TestUpdateImageMetadataHandler:
 
     @pytest.mark.asyncio
     async def test_HandleUpdateDescription_ShouldUpdateDescriptionSuccessfully(
-        self, handler, mock_dependencies, mock_image_metadata
+        self, handler, mock_dependencies, mock_image_metadata, base_image_id, base_command_kwargs
     ):
         """Test successful description update."""
         # Arrange
-        image_id = ImageMetadataId(id=123)
-        command = UpdateImageMetadataCommand(
-            title=None, subtitle=None, description="New Description", vectorId=None, removeVectorId=False
+        image_id = base_image_id
+        command = UpdateImageMetadataCommand.model_construct(
+            **{**base_command_kwargs, "description": "New Description"}
         )
         mock_dependencies["repository"].FindById.return_value = mock_image_metadata
 
@@ -275,17 +279,18 @@ class TestUpdateImageMetadataHandler:
 
     @pytest.mark.asyncio
     async def test_HandleUpdateAllFields_ShouldUpdateAllFieldsSuccessfully(
-        self, handler, mock_dependencies, mock_image_metadata
+        self, handler, mock_dependencies, mock_image_metadata, base_image_id, base_command_kwargs
     ):
         """Test successful update of all fields."""
         # Arrange
-        image_id = ImageMetadataId(id=123)
-        command = UpdateImageMetadataCommand(
-            title="New Title",
-            subtitle="New Subtitle",
-            description="New Description",
-            vectorId=None,
-            removeVectorId=False,
+        image_id = base_image_id
+        command = UpdateImageMetadataCommand.model_construct(
+            **{
+                **base_command_kwargs,
+                "title": "New Title",
+                "subtitle": "New Subtitle",
+                "description": "New Description",
+            }
         )
         mock_dependencies["repository"].FindById.return_value = mock_image_metadata
 
@@ -302,14 +307,12 @@ class TestUpdateImageMetadataHandler:
 
     @pytest.mark.asyncio
     async def test_HandleImageMetadataNotFound_ShouldRaiseImageMetadataNotFoundException(
-        self, handler, mock_dependencies
+        self, handler, mock_dependencies, base_command_kwargs
     ):
         """Test that missing image metadata raises appropriate exception."""
         # Arrange
-        image_id = ImageMetadataId(id=999)
-        command = UpdateImageMetadataCommand(
-            title="New Title", subtitle=None, description=None, vectorId=None, removeVectorId=False
-        )
+        image_id = _imid(999)
+        command = UpdateImageMetadataCommand.model_construct(**{**base_command_kwargs, "title": "New Title"})
         mock_dependencies["repository"].FindById.return_value = None  # Not found
 
         # Act & Assert
@@ -323,39 +326,32 @@ class TestUpdateImageMetadataHandler:
 
     @pytest.mark.asyncio
     async def test_HandleAssignVectorId_ShouldAssignVectorIdSuccessfully(
-        self, handler, mock_dependencies, mock_image_metadata
+        self, handler, mock_dependencies, mock_image_metadata, base_image_id, base_command_kwargs
     ):
         """Test successful vector ID assignment."""
         # Arrange
-        image_id = ImageMetadataId(id=123)
-        command = UpdateImageMetadataCommand(
-            title=None, subtitle=None, description=None, vectorId=789, removeVectorId=False
-        )
+        image_id = base_image_id
+        command = UpdateImageMetadataCommand.model_construct(**{**base_command_kwargs, "vectorId": _NEW_VECTOR_ID})
         mock_dependencies["repository"].FindById.return_value = mock_image_metadata
 
         # Act
         await handler.Handle(image_id, command)
 
         # Assert
-        mock_image_metadata.AssignVectorId.assert_called_once()
-        # Verify the VectorId was created correctly
-        call_args = mock_image_metadata.AssignVectorId.call_args[0][0]
-        assert call_args.id == 789
+        mock_image_metadata.AssignVectorId.assert_called_once_with(_vid(_NEW_VECTOR_ID))
         mock_dependencies["repository"].Save.assert_called_once_with(mock_image_metadata)
         mock_dependencies["uow"].Commit.assert_called_once()
         mock_dependencies["event_dispatcher"].DispatchAll.assert_called_once()
 
     @pytest.mark.asyncio
     async def test_HandleRemoveVectorIdWhenPresent_ShouldRemoveVectorIdSuccessfully(
-        self, handler, mock_dependencies, mock_image_metadata
+        self, handler, mock_dependencies, mock_image_metadata, base_image_id, base_command_kwargs
     ):
         """Test successful vector ID removal when present."""
         # Arrange
-        image_id = ImageMetadataId(id=123)
-        command = UpdateImageMetadataCommand(
-            title=None, subtitle=None, description=None, vectorId=None, removeVectorId=True
-        )
-        mock_image_metadata.vectorId = VectorId(id=456)  # Has vector ID
+        image_id = base_image_id
+        command = UpdateImageMetadataCommand.model_construct(**{**base_command_kwargs, "removeVectorId": True})
+        mock_image_metadata.vectorId = _vid(_EXISTING_VECTOR_ID)  # Has vector ID
         mock_dependencies["repository"].FindById.return_value = mock_image_metadata
 
         # Act
@@ -369,14 +365,12 @@ class TestUpdateImageMetadataHandler:
 
     @pytest.mark.asyncio
     async def test_HandleRemoveVectorIdWhenNotPresent_ShouldNotCallUnassign(
-        self, handler, mock_dependencies, mock_image_metadata
+        self, handler, mock_dependencies, mock_image_metadata, base_image_id, base_command_kwargs
     ):
         """Test vector ID removal when not present doesn't call unassign."""
         # Arrange
-        image_id = ImageMetadataId(id=123)
-        command = UpdateImageMetadataCommand(
-            title=None, subtitle=None, description=None, vectorId=None, removeVectorId=True
-        )
+        image_id = base_image_id
+        command = UpdateImageMetadataCommand.model_construct(**{**base_command_kwargs, "removeVectorId": True})
         mock_image_metadata.vectorId = None  # No vector ID
         mock_dependencies["repository"].FindById.return_value = mock_image_metadata
 
@@ -390,13 +384,13 @@ class TestUpdateImageMetadataHandler:
         mock_dependencies["event_dispatcher"].DispatchAll.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_HandleNoUpdates_ShouldStillSaveAndCommit(self, handler, mock_dependencies, mock_image_metadata):
+    async def test_HandleNoUpdates_ShouldStillSaveAndCommit(
+        self, handler, mock_dependencies, mock_image_metadata, base_image_id, base_command_kwargs
+    ):
         """Test that handler still saves and commits even with no updates."""
         # Arrange
-        image_id = ImageMetadataId(id=123)
-        command = UpdateImageMetadataCommand(
-            title=None, subtitle=None, description=None, vectorId=None, removeVectorId=False
-        )  # No updates
+        image_id = base_image_id
+        command = UpdateImageMetadataCommand.model_construct(**base_command_kwargs)  # No updates
         mock_dependencies["repository"].FindById.return_value = mock_image_metadata
 
         # Act
@@ -413,19 +407,15 @@ class TestUpdateImageMetadataHandler:
 
     @pytest.mark.asyncio
     async def test_HandleBothVectorIdAndRemoveVectorId_ShouldPrioritizeRemove(
-        self, handler, mock_dependencies, mock_image_metadata
+        self, handler, mock_dependencies, mock_image_metadata, base_image_id, base_command_kwargs
     ):
         """Test that removeVectorId takes priority over vectorId assignment."""
         # Arrange
-        image_id = ImageMetadataId(id=123)
-        command = UpdateImageMetadataCommand(
-            title=None,
-            subtitle=None,
-            description=None,
-            vectorId=789,
-            removeVectorId=True,
+        image_id = base_image_id
+        command = UpdateImageMetadataCommand.model_construct(
+            **{**base_command_kwargs, "vectorId": _NEW_VECTOR_ID, "removeVectorId": True}
         )
-        mock_image_metadata.vectorId = VectorId(id=456)  # Has vector ID
+        mock_image_metadata.vectorId = _vid(_EXISTING_VECTOR_ID)  # Has vector ID
         mock_dependencies["repository"].FindById.return_value = mock_image_metadata
 
         # Act
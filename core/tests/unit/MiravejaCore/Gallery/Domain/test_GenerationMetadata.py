@@ -214,6 +214,32 @@ class TestGenerationMetadata:
         assert generation.prompt == prompt
         assert generation.negativePrompt is None
 
+    def test_FromDatabaseWithStoredRow_ShouldConvertStoredValuesToDomainTypes(self):
+        """Test that FromDatabase converts stored strings back into enums and Size."""
+        metadata = GenerationMetadata.FromDatabase(
+            id=1,
+            imageId=2,
+            prompt="stored prompt",
+            negativePrompt="stored negative",
+            seed="42",
+            model="model_hash",
+            sampler=SamplerType.DPMPP_2M.value,
+            scheduler=None,
+            steps=30,
+            cfgScale=7.0,
+            size="512x768",
+            loras=[],
+            techniques=[TechniqueType.TEXT_TO_IMAGE.value],
+        )
+
+        assert metadata.id == GenerationMetadataId(id=1)
+        assert metadata.imageId == ImageMetadataId(id=2)
+        assert metadata.sampler == SamplerType.DPMPP_2M
+        assert metadata.scheduler is None
+        assert metadata.size == Size(width=512, height=768)
+        assert metadata.loras == []
+        assert metadata.techniques == [TechniqueType.TEXT_TO_IMAGE]
+
     def test_SerializeTechniquesWithNone_ShouldReturnNone(self):
         """Test that SerializeTechniques returns None when techniques is None."""
         generation = self._create_minimal_generation_metadata(techniques=None)
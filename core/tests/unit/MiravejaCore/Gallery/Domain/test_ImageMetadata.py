@@ -3,8 +3,9 @@ from datetime import datetime, timezone
 from pydantic import ValidationError
 from unittest.mock import patch
 
-from MiravejaCore.Gallery.Domain.Models import ImageMetadata, Size, GenerationMetadata
+from MiravejaCore.Gallery.Domain.Models import ImageMetadata, Size, GenerationMetadata, LoraMetadata
 from MiravejaCore.Gallery.Domain.Enums import ImageRepositoryType
+from MiravejaCore.Gallery.Domain.Events import ImageMetadataRegisteredEvent, ImageMetadataUpdatedEvent
 from MiravejaCore.Shared.Identifiers.Models import ImageMetadataId, MemberId, GenerationMetadataId, VectorId
 
 
@@ -239,6 +240,92 @@ class TestImageMetadata:
         assert image.generationMetadata is None
         assert image.vectorId is None
 
+    def test_FromDatabaseWithStoredRow_ShouldRebuildNestedModelsWithoutEvents(self):
+        """Test that FromDatabase rebuilds a stored row, nested generation metadata included, without emitting events."""
+        owner_id = MemberId.Generate()
+        vector_id = VectorId.Generate()
+        uploaded_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+        image = ImageMetadata.FromDatabase(
+            id=5,
+            ownerId=str(owner_id),
+            title="Stored Image",
+            subtitle="Stored Subtitle",
+            description=None,
+            width=640,
+            height=480,
+            repositoryType=ImageRepositoryType.S3.value,
+            uri="https://example.com/stored.jpg",
+            thumbnailUri=None,
+            isAiGenerated=True,
+            generationMetadata=GenerationMetadata.FromDatabase(
+                id=7,
+                imageId=5,
+                prompt="stored prompt",
+                negativePrompt=None,
+                seed=None,
+                model=None,
+                sampler=None,
+                scheduler=None,
+                steps=None,
+                cfgScale=None,
+                size="640x480",
+                loras=[LoraMetadata.FromDatabase(id=3, hash="lora_hash", name=None, generationMetadatas=[7])],
+                techniques=None,
+            ),
+            vectorId=str(vector_id),
+            uploadedAt=uploaded_at,
+            updatedAt=uploaded_at,
+        )
+
+        assert image.id == ImageMetadataId(id=5)
+        assert image.ownerId == owner_id
+        assert image.size == Size(width=640, height=480)
+        assert image.repositoryType == ImageRepositoryType.S3
+        assert image.vectorId == vector_id
+        assert image.generationMetadata.id == GenerationMetadataId(id=7)
+        assert image.generationMetadata.size == Size(width=640, height=480)
+        assert image.generationMetadata.loras[0].generationMetadatas == [GenerationMetadataId(id=7)]
+        assert image.GetEvents() == []
+        assert image.model_dump()["generationMetadata"]["loras"] == [{"id": 3, "hash": "lora_hash", "name": None}]
+
+    def test_RegisterEmitsEvent_ShouldCarryPayloadWithoutIdAndTimestamps(self):
+        """Test that Register emits a registered event whose data omits the ID and timestamps."""
+        owner_id = MemberId.Generate()
+
+        image = ImageMetadata.Register(
+            id=ImageMetadataId(id=1),
+            ownerId=owner_id,
+            title="Test Image",
+            subtitle="Test Subtitle",
+            description=None,
+            size=Size(width=1920, height=1080),
+            repositoryType=ImageRepositoryType.S3,
+            uri="https://example.com/image.jpg",
+            isAiGenerated=False,
+        )
+
+        events = image.GetEvents()
+        assert len(events) == 1
+        assert isinstance(events[0], ImageMetadataRegisteredEvent)
+        assert events[0].aggregateId == 1
+        assert events[0].imageMetadataId == 1
+        assert events[0].ToKafkaMessage()["payload"]["id"] is not None
+        assert events[0].data == {
+            "ownerId": str(owner_id),
+            "title": "Test Image",
+            "subtitle": "Test Subtitle",
+            "description": None,
+            "width": 1920,
+            "height": 1080,
+            "repositoryType": ImageRepositoryType.S3,
+            "uri": "https://example.com/image.jpg",
+            "thumbnailUri": None,
+            "isAiGenerated": False,
+            "generationMetadata": None,
+            "vectorId": None,
+        }
+
     def test_IsAiGeneratedWithMetadataWithGenerationData_ShouldReturnTrue(self):
         """Test that IsAiGeneratedWithMetadata returns true when AI-generated with metadata."""
         generation_metadata = GenerationMetadata(
@@ -348,6 +435,18 @@ class TestImageMetadata:
         assert image.description == new_description
         assert image.updatedAt == mock_now
 
+    def test_UpdateEmitsEvent_ShouldCarryOnlyChangedFields(self):
+        """Test that Update emits an updated event whose old and new data hold only the changed fields."""
+        image = self._create_minimal_image_metadata(title="Old Title")
+
+        image.Update(title="New Title", subtitle=image.subtitle, description=image.description)
+
+        events = image.GetEvents()
+        assert len(events) == 1
+        assert isinstance(events[0], ImageMetadataUpdatedEvent)
+        assert events[0].oldData == {"title": "Old Title"}
+        assert events[0].newData == {"title": "New Title"}
+
     def test_UpdateWithNoChanges_ShouldNotUpdateTimestamp(self):
         """Test that Update method with no changes does not update timestamp."""
         image = self._create_minimal_image_metadata()
@@ -5,6 +5,24 @@ from MiravejaCore.Gallery.Domain.Models import Size
 from MiravejaCore.Gallery.Domain.Exceptions import MalformedImageSizeStringException
 
 
+@pytest.fixture(scope="module")
+def hd_size():
+    """Landscape 1920x1080 size shared across the module."""
+    return Size(width=1920, height=1080)
+
+
+@pytest.fixture(scope="module")
+def hd_portrait():
+    """Portrait 1080x1920 size shared across the module."""
+    return Size(width=1080, height=1920)
+
+
+@pytest.fixture(scope="module")
+def square_size():
+    """Square 1080x1080 size shared across the module."""
+    return Size(width=1080, height=1080)
+
+
 class TestSize:
     """Test cases for Size domain model."""
 
@@ -18,39 +36,21 @@ class TestSize:
         assert size.width == width
         assert size.height == height
 
-    def test_InitializeWithZeroWidth_ShouldRaiseValidationError(self):
-        """Test that Size raises validation error with zero width."""
-        with pytest.raises(ValidationError) as exc_info:
-            Size(width=0, height=1080)
-
-        assert "greater than 0" in str(exc_info.value)
-
-    def test_InitializeWithZeroHeight_ShouldRaiseValidationError(self):
-        """Test that Size raises validation error with zero height."""
-        with pytest.raises(ValidationError) as exc_info:
-            Size(width=1920, height=0)
-
-        assert "greater than 0" in str(exc_info.value)
-
-    def test_InitializeWithNegativeWidth_ShouldRaiseValidationError(self):
-        """Test that Size raises validation error with negative width."""
-        with pytest.raises(ValidationError) as exc_info:
-            Size(width=-100, height=1080)
-
-        assert "greater than 0" in str(exc_info.value)
-
-    def test_InitializeWithNegativeHeight_ShouldRaiseValidationError(self):
-        """Test that Size raises validation error with negative height."""
+    @pytest.mark.parametrize(
+        "width,height",
+        [(0, 1080), (1920, 0), (-100, 1080), (1920, -100)],
+        ids=["ZeroWidth", "ZeroHeight", "NegativeWidth", "NegativeHeight"],
+    )
+    def test_InitializeWithNonPositiveDimension_ShouldRaiseValidationError(self, width, height):
+        """Test that Size raises validation error when width or height is not positive."""
         with pytest.raises(ValidationError) as exc_info:
-            Size(width=1920, height=-100)
+            Size(width=width, height=height)
 
         assert "greater than 0" in str(exc_info.value)
 
-    def test_StrMethod_ShouldReturnCorrectFormat(self):
+    def test_StrMethod_ShouldReturnCorrectFormat(self, hd_size):
         """Test that __str__ method returns correct format."""
-        size = Size(width=1920, height=1080)
-
-        result = str(size)
+        result = str(hd_size)
 
         assert result == "1920x1080"
 
@@ -72,28 +72,13 @@ class TestSize:
         assert size.width == 1920
         assert size.height == 1080
 
-    def test_CreateFromStringWithInvalidFormat_ShouldRaiseMalformedException(self):
-        """Test that CreateFromString raises exception with invalid format."""
-        invalid_string = "1920-1080"
-
-        with pytest.raises(MalformedImageSizeStringException) as exc_info:
-            Size.CreateFromString(invalid_string)
-
-        assert invalid_string in str(exc_info.value)
-
-    def test_CreateFromStringWithNonNumericValues_ShouldRaiseMalformedException(self):
-        """Test that CreateFromString raises exception with non-numeric values."""
-        invalid_string = "widthxheight"
-
-        with pytest.raises(MalformedImageSizeStringException) as exc_info:
-            Size.CreateFromString(invalid_string)
-
-        assert invalid_string in str(exc_info.value)
-
-    def test_CreateFromStringWithEmptyString_ShouldRaiseMalformedException(self):
-        """Test that CreateFromString raises exception with empty string."""
-        invalid_string = ""
-
+    @pytest.mark.parametrize(
+        "invalid_string",
+        ["1920-1080", "widthxheight", ""],
+        ids=["InvalidFormat", "NonNumericValues", "EmptyString"],
+    )
+    def test_CreateFromStringWithInvalidInput_ShouldRaiseMalformedException(self, invalid_string):
+        """Test that CreateFromString raises exception for malformed size strings."""
         with pytest.raises(MalformedImageSizeStringException) as exc_info:
             Size.CreateFromString(invalid_string)
 
@@ -125,90 +110,33 @@ class TestSize:
         assert size.width == 800
         assert size.height == 600
 
-    def test_AspectRatioProperty_ShouldCalculateCorrectRatio(self):
+    def test_AspectRatioProperty_ShouldCalculateCorrectRatio(self, hd_size):
         """Test that aspectRatio property calculates correct ratio."""
-        size = Size(width=1920, height=1080)
-
-        aspect_ratio = size.aspectRatio
+        aspect_ratio = hd_size.aspectRatio
 
         assert aspect_ratio == pytest.approx(1.777, rel=1e-3)
 
-    def test_MegaPixelsProperty_ShouldCalculateCorrectMegaPixels(self):
+    def test_MegaPixelsProperty_ShouldCalculateCorrectMegaPixels(self, hd_size):
         """Test that megaPixels property calculates correct megapixels."""
-        size = Size(width=1920, height=1080)
-
-        mega_pixels = size.megaPixels
+        mega_pixels = hd_size.megaPixels
 
         assert mega_pixels == pytest.approx(2.0736, rel=1e-4)
 
-    def test_IsLandscapeWithLandscapeSize_ShouldReturnTrue(self):
-        """Test that IsLandscape returns true for landscape orientation."""
-        size = Size(width=1920, height=1080)
-
-        result = size.IsLandscape()
-
-        assert result is True
-
-    def test_IsLandscapeWithPortraitSize_ShouldReturnFalse(self):
-        """Test that IsLandscape returns false for portrait orientation."""
-        size = Size(width=1080, height=1920)
-
-        result = size.IsLandscape()
-
-        assert result is False
-
-    def test_IsLandscapeWithSquareSize_ShouldReturnFalse(self):
-        """Test that IsLandscape returns false for square size."""
-        size = Size(width=1080, height=1080)
-
-        result = size.IsLandscape()
-
-        assert result is False
-
-    def test_IsPortraitWithPortraitSize_ShouldReturnTrue(self):
-        """Test that IsPortrait returns true for portrait orientation."""
-        size = Size(width=1080, height=1920)
-
-        result = size.IsPortrait()
-
-        assert result is True
-
-    def test_IsPortraitWithLandscapeSize_ShouldReturnFalse(self):
-        """Test that IsPortrait returns false for landscape orientation."""
-        size = Size(width=1920, height=1080)
-
-        result = size.IsPortrait()
-
-        assert result is False
-
-    def test_IsPortraitWithSquareSize_ShouldReturnFalse(self):
-        """Test that IsPortrait returns false for square size."""
-        size = Size(width=1080, height=1080)
-
-        result = size.IsPortrait()
-
-        assert result is False
-
-    def test_IsSquareWithSquareSize_ShouldReturnTrue(self):
-        """Test that IsSquare returns true for square size."""
-        size = Size(width=1080, height=1080)
-
-        result = size.IsSquare()
-
-        assert result is True
-
-    def test_IsSquareWithLandscapeSize_ShouldReturnFalse(self):
-        """Test that IsSquare returns false for landscape size."""
-        size = Size(width=1920, height=1080)
-
-        result = size.IsSquare()
-
-        assert result is False
-
-    def test_IsSquareWithPortraitSize_ShouldReturnFalse(self):
-        """Test that IsSquare returns false for portrait size."""
-        size = Size(width=1080, height=1920)
-
-        result = size.IsSquare()
-
-        assert result is False
+    @pytest.mark.parametrize(
+        "size_fixture,is_landscape,is_portrait,is_square",
+        [
+            ("hd_size", True, False, False),
+            ("hd_portrait", False, True, False),
+            ("square_size", False, False, True),
+        ],
+        ids=["Landscape", "Portrait", "Square"],
+    )
+    def test_OrientationPredicates_ShouldMatchDimensions(
+        self, request, size_fixture, is_landscape, is_portrait, is_square
+    ):
+        """Test that IsLandscape, IsPortrait and IsSquare agree with the size orientation."""
+        size = request.getfixturevalue(size_fixture)
+
+        assert size.IsLandscape() is is_landscape
+        assert size.IsPortrait() is is_portrait
+        assert size.IsSquare() is is_square
@@ -45,7 +45,7 @@ class TestMinIoImageContentRepository:
         # Assert
         mockBoto3Client.list_buckets.assert_called_once()
         mockBoto3Client.create_bucket.assert_not_called()
-        mockLogger.Info.assert_called_with("Bucket test-bucket already exists")
+        mockLogger.Info.assert_called_with("Bucket %s already exists", "test-bucket")
 
     def test_InitializeWithNonExistingBucket_ShouldCreateBucket(self):
         """Test initialization when bucket doesn't exist."""
@@ -61,7 +61,7 @@ class TestMinIoImageContentRepository:
         # Assert
         mockBoto3Client.list_buckets.assert_called_once()
         mockBoto3Client.create_bucket.assert_called_once_with(Bucket="test-bucket", ObjectLockEnabledForBucket=True)
-        mockLogger.Info.assert_any_call("Creating bucket test-bucket")
+        mockLogger.Info.assert_any_call("Creating bucket %s", "test-bucket")
 
     def test_GetImageKey_ShouldExtractKeyFromUri(self):
         """Test that GetImageKey correctly extracts the key from an image URI."""
@@ -98,7 +98,7 @@ class TestMinIoImageContentRepository:
         mockBoto3Client.generate_presigned_url.assert_called_once_with(
             "get_object", Params={"Bucket": "test-bucket", "Key": "images/test.png"}, ExpiresIn=3600
         )
-        mockLogger.Info.assert_any_call("Generating presigned GET URL for images/test.png")
+        mockLogger.Info.assert_any_call("Generating presigned GET URL for %s", "images/test.png")
 
     @pytest.mark.asyncio
     async def test_GetPresignedGetUrlWithException_ShouldLogErrorAndReraise(self):
@@ -117,7 +117,7 @@ class TestMinIoImageContentRepository:
             await repository.GetPresignedGetUrl("images/test.png")
 
         assert exc_info.value == testError
-        mockLogger.Error.assert_called_once_with(f"Error generating presigned GET URL: {testError}")
+        mockLogger.Error.assert_called_once_with("Error generating presigned GET URL: %s", testError)
 
     @pytest.mark.asyncio
     async def test_GetPresignedPostUrl_ShouldGenerateValidPostData(self):
@@ -146,7 +146,7 @@ class TestMinIoImageContentRepository:
         assert call_args[1]["Key"] == "images/test.png"
         assert call_args[1]["Fields"]["x-amz-meta-owner-id"] == str(testOwnerId.id)
         assert call_args[1]["ExpiresIn"] == 3600
-        mockLogger.Info.assert_any_call("Generating presigned POST URL for images/test.png")
+        mockLogger.Info.assert_any_call("Generating presigned POST URL for %s", "images/test.png")
 
     @pytest.mark.asyncio
     async def test_GetPresignedPostUrlWithException_ShouldLogErrorAndReraise(self):
@@ -166,7 +166,7 @@ class TestMinIoImageContentRepository:
             await repository.GetPresignedPostUrl("images/test.png", testOwnerId)
 
         assert exc_info.value == testError
-        mockLogger.Error.assert_called_once_with(f"Error generating presigned POST URL: {testError}")
+        mockLogger.Error.assert_called_once_with("Error generating presigned POST URL: %s", testError)
 
     @pytest.mark.asyncio
     async def test_GetMetadata_ShouldReturnMetadataDict(self):
@@ -186,17 +186,17 @@ class TestMinIoImageContentRepository:
         # Assert
         assert metadata == {"owner-id": "user123", "content-type": "image/png"}
         mockBoto3Client.head_object.assert_called_once_with(Bucket="test-bucket", Key="images/test.png")
-        mockLogger.Info.assert_any_call("Fetching metadata for images/test.png")
+        mockLogger.Info.assert_any_call("Fetching metadata for %s", "images/test.png")
 
     @pytest.mark.asyncio
-    async def test_GetMetadataWithNoSuchKey_ShouldReturnEmptyDict(self):
-        """Test that GetMetadata returns empty dict when object doesn't exist."""
+    async def test_GetMetadataWhenObjectNotFound_ShouldReturnEmptyDict(self):
+        """Test that GetMetadata returns empty dict when HEAD reports a 404."""
         # Arrange
         mockBoto3Client = self.CreateMockBoto3Client()
         mockBoto3Client.list_buckets.return_value = {"Buckets": [{"Name": "test-bucket"}]}
-        # Create mock NoSuchKey exception
-        mockBoto3Client.exceptions.NoSuchKey = type("NoSuchKey", (Exception,), {})
-        mockBoto3Client.head_object.side_effect = mockBoto3Client.exceptions.NoSuchKey()
+        mockBoto3Client.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
+        )
         mockLogger = self.CreateMockLogger()
         testConfig = self.CreateTestMinIoConfig()
         repository = MinIoImageContentRepository(mockBoto3Client, testConfig, mockLogger)
@@ -207,18 +207,38 @@ class TestMinIoImageContentRepository:
 
         # Assert
         assert metadata == {}
-        mockLogger.Warning.assert_called_once_with("Object images/missing.png not found in bucket test-bucket")
+        mockLogger.Warning.assert_called_once_with(
+            "Object %s not found in bucket %s", "images/missing.png", "test-bucket"
+        )
+        mockLogger.Error.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_GetMetadataWithException_ShouldLogErrorAndReraise(self):
-        """Test that GetMetadata handles general exceptions correctly that are NOT NoSuchKey."""
+    async def test_GetMetadataWithForbiddenClientError_ShouldLogErrorAndReraise(self):
+        """Test that GetMetadata re-raises client errors other than a 404."""
         # Arrange
         mockBoto3Client = self.CreateMockBoto3Client()
         mockBoto3Client.list_buckets.return_value = {"Buckets": [{"Name": "test-bucket"}]}
-        # Setup NoSuchKey exception type
-        mockBoto3Client.exceptions = MagicMock()
-        mockBoto3Client.exceptions.NoSuchKey = type("NoSuchKey", (Exception,), {})
+        testError = ClientError({"Error": {"Code": "403", "Message": "Forbidden"}}, "HeadObject")
+        mockBoto3Client.head_object.side_effect = testError
+        mockLogger = self.CreateMockLogger()
+        testConfig = self.CreateTestMinIoConfig()
+        repository = MinIoImageContentRepository(mockBoto3Client, testConfig, mockLogger)
+        imageUri = "http://minio.local:9000/test-bucket/images/test.png"
+
+        # Act & Assert
+        with pytest.raises(ClientError) as exc_info:
+            await repository.GetMetadata(imageUri)
+
+        assert exc_info.value == testError
+        mockLogger.Warning.assert_not_called()
+        mockLogger.Error.assert_called_once_with("Error fetching metadata for %s: %s", "images/test.png", testError)
 
+    @pytest.mark.asyncio
+    async def test_GetMetadataWithException_ShouldLogErrorAndReraise(self):
+        """Test that GetMetadata handles exceptions that are not client errors."""
+        # Arrange
+        mockBoto3Client = self.CreateMockBoto3Client()
+        mockBoto3Client.list_buckets.return_value = {"Buckets": [{"Name": "test-bucket"}]}
         testError = RuntimeError("S3 connection error")
         mockBoto3Client.head_object.side_effect = testError
         mockLogger = self.CreateMockLogger()
@@ -231,7 +251,7 @@ class TestMinIoImageContentRepository:
             await repository.GetMetadata(imageUri)
 
         assert exc_info.value == testError
-        mockLogger.Error.assert_called_once_with(f"Error fetching metadata for images/test.png: {testError}")
+        mockLogger.Error.assert_called_once_with("Error fetching metadata for %s: %s", "images/test.png", testError)
 
     @pytest.mark.asyncio
     async def test_Delete_ShouldCallDeleteObject(self):
@@ -249,8 +269,8 @@ class TestMinIoImageContentRepository:
 
         # Assert
         mockBoto3Client.delete_object.assert_called_once_with(Bucket="test-bucket", Key="images/test.png")
-        mockLogger.Info.assert_any_call("Deleting object images/test.png from bucket test-bucket")
-        mockLogger.Info.assert_any_call("Successfully deleted images/test.png")
+        mockLogger.Info.assert_any_call("Deleting object %s from bucket %s", "images/test.png", "test-bucket")
+        mockLogger.Info.assert_any_call("Successfully deleted %s", "images/test.png")
 
     @pytest.mark.asyncio
     async def test_DeleteWithException_ShouldLogErrorAndReraise(self):
@@ -270,7 +290,7 @@ class TestMinIoImageContentRepository:
             await repository.Delete(imageUri)
 
         assert exc_info.value == testError
-        mockLogger.Error.assert_called_once_with(f"Error deleting object images/test.png: {testError}")
+        mockLogger.Error.assert_called_once_with("Error deleting object %s: %s", "images/test.png", testError)
 
     @pytest.mark.asyncio
     async def test_ExistsWhenObjectExists_ShouldReturnTrue(self):
@@ -290,7 +310,7 @@ class TestMinIoImageContentRepository:
         # Assert
         assert exists is True
         mockBoto3Client.head_object.assert_called_once_with(Bucket="test-bucket", Key="images/test.png")
-        mockLogger.Info.assert_any_call("Object images/test.png exists")
+        mockLogger.Info.assert_any_call("Object %s exists", "images/test.png")
 
     @pytest.mark.asyncio
     async def test_ExistsWhenObjectNotFound_ShouldReturnFalse(self):
@@ -298,7 +318,9 @@ class TestMinIoImageContentRepository:
         # Arrange
         mockBoto3Client = self.CreateMockBoto3Client()
         mockBoto3Client.list_buckets.return_value = {"Buckets": [{"Name": "test-bucket"}]}
-        mockBoto3Client.head_object.side_effect = Exception("404 Not Found")
+        mockBoto3Client.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
+        )
         mockLogger = self.CreateMockLogger()
         testConfig = self.CreateTestMinIoConfig()
         repository = MinIoImageContentRepository(mockBoto3Client, testConfig, mockLogger)
@@ -310,7 +332,7 @@ class TestMinIoImageContentRepository:
         # Assert
         assert exists is False
         mockLogger.Error.assert_called_once()
-        mockLogger.Info.assert_any_call("Object images/missing.png does not exist")
+        mockLogger.Info.assert_any_call("Object %s does not exist", "images/missing.png")
 
     @pytest.mark.asyncio
     async def test_ExistsWithOtherException_ShouldReraise(self):
@@ -331,6 +353,25 @@ class TestMinIoImageContentRepository:
 
         assert exc_info.value == testError
 
+    @pytest.mark.asyncio
+    async def test_ExistsWithForbiddenClientError_ShouldReraise(self):
+        """Test that Exists only treats a 404 client error as a missing object."""
+        # Arrange
+        mockBoto3Client = self.CreateMockBoto3Client()
+        mockBoto3Client.list_buckets.return_value = {"Buckets": [{"Name": "test-bucket"}]}
+        testError = ClientError({"Error": {"Code": "403", "Message": "Forbidden"}}, "HeadObject")
+        mockBoto3Client.head_object.side_effect = testError
+        mockLogger = self.CreateMockLogger()
+        testConfig = self.CreateTestMinIoConfig()
+        repository = MinIoImageContentRepository(mockBoto3Client, testConfig, mockLogger)
+        imageUri = "http://minio.local:9000/test-bucket/images/test.png"
+
+        # Act & Assert
+        with pytest.raises(ClientError) as exc_info:
+            await repository.Exists(imageUri)
+
+        assert exc_info.value == testError
+
     @pytest.mark.asyncio
     async def test_IsOwnedByWhenOwned_ShouldReturnTrue(self):
         """Test that IsOwnedBy returns True when object is owned by the member."""
@@ -349,7 +390,7 @@ class TestMinIoImageContentRepository:
 
         # Assert
         assert isOwned is True
-        mockLogger.Info.assert_any_call(f"Object {imageUri} is owned by member ID {testOwnerId.id}")
+        mockLogger.Info.assert_any_call("Object %s is owned by member ID %s", imageUri, testOwnerId.id)
 
     @pytest.mark.asyncio
     async def test_IsOwnedByWhenNotOwned_ShouldReturnFalse(self):
@@ -370,7 +411,7 @@ class TestMinIoImageContentRepository:
 
         # Assert
         assert isOwned is False
-        mockLogger.Warning.assert_called_once_with(f"Object {imageUri} is not owned by member ID {testOwnerId.id}")
+        mockLogger.Warning.assert_called_once_with("Object %s is not owned by member ID %s", imageUri, testOwnerId.id)
 
     @pytest.mark.asyncio
     async def test_IsOwnedByWithException_ShouldLogErrorAndReraise(self):
@@ -378,10 +419,6 @@ class TestMinIoImageContentRepository:
         # Arrange
         mockBoto3Client = self.CreateMockBoto3Client()
         mockBoto3Client.list_buckets.return_value = {"Buckets": [{"Name": "test-bucket"}]}
-        # Setup NoSuchKey exception type
-        mockBoto3Client.exceptions = MagicMock()
-        mockBoto3Client.exceptions.NoSuchKey = type("NoSuchKey", (Exception,), {})
-
         testError = RuntimeError("Metadata fetch failed")
         mockBoto3Client.head_object.side_effect = testError
         mockLogger = self.CreateMockLogger()
@@ -397,5 +434,91 @@ class TestMinIoImageContentRepository:
         assert exc_info.value == testError
         # IsOwnedBy calls GetMetadata which logs its own error, then IsOwnedBy logs another
         assert mockLogger.Error.call_count == 2
-        mockLogger.Error.assert_any_call(f"Error fetching metadata for images/test.png: {testError}")
-        mockLogger.Error.assert_any_call(f"Error checking ownership of object {imageUri}: {testError}")
+        mockLogger.Error.assert_any_call("Error fetching metadata for %s: %s", "images/test.png", testError)
+        mockLogger.Error.assert_any_call("Error checking ownership of object %s: %s", imageUri, testError)
+
+    @pytest.mark.asyncio
+    async def test_ExistsAndIsOwnedByWhenOwned_ShouldReturnTrueTrueWithSingleHead(self):
+        """Test that ExistsAndIsOwnedBy answers both checks from one head_object call."""
+        # Arrange
+        mockBoto3Client = self.CreateMockBoto3Client()
+        mockBoto3Client.list_buckets.return_value = {"Buckets": [{"Name": "test-bucket"}]}
+        testOwnerId = MemberId(id="12345678-1234-1234-1234-123456789012")
+        mockBoto3Client.head_object.return_value = {"Metadata": {"owner-id": str(testOwnerId.id)}}
+        mockLogger = self.CreateMockLogger()
+        testConfig = self.CreateTestMinIoConfig()
+        repository = MinIoImageContentRepository(mockBoto3Client, testConfig, mockLogger)
+        imageUri = "http://minio.local:9000/test-bucket/images/test.png"
+
+        # Act
+        result = await repository.ExistsAndIsOwnedBy(imageUri, testOwnerId)
+
+        # Assert
+        assert result == (True, True)
+        mockBoto3Client.head_object.assert_called_once_with(Bucket="test-bucket", Key="images/test.png")
+
+    @pytest.mark.asyncio
+    async def test_ExistsAndIsOwnedByWhenNotOwned_ShouldReturnTrueFalse(self):
+        """Test that ExistsAndIsOwnedBy reports an existing object owned by another member."""
+        # Arrange
+        mockBoto3Client = self.CreateMockBoto3Client()
+        mockBoto3Client.list_buckets.return_value = {"Buckets": [{"Name": "test-bucket"}]}
+        testOwnerId = MemberId(id="12345678-1234-1234-1234-123456789012")
+        differentOwnerId = MemberId(id="87654321-4321-4321-4321-210987654321")
+        mockBoto3Client.head_object.return_value = {"Metadata": {"owner-id": str(differentOwnerId.id)}}
+        mockLogger = self.CreateMockLogger()
+        testConfig = self.CreateTestMinIoConfig()
+        repository = MinIoImageContentRepository(mockBoto3Client, testConfig, mockLogger)
+        imageUri = "http://minio.local:9000/test-bucket/images/test.png"
+
+        # Act
+        result = await repository.ExistsAndIsOwnedBy(imageUri, testOwnerId)
+
+        # Assert
+        assert result == (True, False)
+        mockLogger.Warning.assert_called_once_with("Object %s is not owned by member ID %s", imageUri, testOwnerId.id)
+
+    @pytest.mark.asyncio
+    async def test_ExistsAndIsOwnedByWhenObjectNotFound_ShouldReturnFalseFalse(self):
+        """Test that ExistsAndIsOwnedBy reports a missing object as neither existing nor owned."""
+        # Arrange
+        mockBoto3Client = self.CreateMockBoto3Client()
+        mockBoto3Client.list_buckets.return_value = {"Buckets": [{"Name": "test-bucket"}]}
+        mockBoto3Client.head_object.side_effect = ClientError(
+            {"Error": {"Code": "404", "Message": "Not Found"}}, "HeadObject"
+        )
+        mockLogger = self.CreateMockLogger()
+        testConfig = self.CreateTestMinIoConfig()
+        repository = MinIoImageContentRepository(mockBoto3Client, testConfig, mockLogger)
+        testOwnerId = MemberId(id="12345678-1234-1234-1234-123456789012")
+        imageUri = "http://minio.local:9000/test-bucket/images/missing.png"
+
+        # Act
+        result = await repository.ExistsAndIsOwnedBy(imageUri, testOwnerId)
+
+        # Assert
+        assert result == (False, False)
+        mockLogger.Info.assert_any_call("Object %s does not exist", "images/missing.png")
+
+    @pytest.mark.asyncio
+    async def test_ExistsAndIsOwnedByWithOtherException_ShouldLogErrorAndReraise(self):
+        """Test that ExistsAndIsOwnedBy reraises errors other than a missing object."""
+        # Arrange
+        mockBoto3Client = self.CreateMockBoto3Client()
+        mockBoto3Client.list_buckets.return_value = {"Buckets": [{"Name": "test-bucket"}]}
+        testError = RuntimeError("Connection error")
+        mockBoto3Client.head_object.side_effect = testError
+        mockLogger = self.CreateMockLogger()
+        testConfig = self.CreateTestMinIoConfig()
+        repository = MinIoImageContentRepository(mockBoto3Client, testConfig, mockLogger)
+        testOwnerId = MemberId(id="12345678-1234-1234-1234-123456789012")
+        imageUri = "http://minio.local:9000/test-bucket/images/test.png"
+
+        # Act & Assert
+        with pytest.raises(RuntimeError) as exc_info:
+            await repository.ExistsAndIsOwnedBy(imageUri, testOwnerId)
+
+        assert exc_info.value == testError
+        mockLogger.Error.assert_called_once_with(
+            "Error checking existence and ownership of object %s: %s", "images/test.png", testError
+        )
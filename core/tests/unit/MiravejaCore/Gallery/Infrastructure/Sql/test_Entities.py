@@ -9,7 +9,9 @@ from MiravejaCore.Gallery.Infrastructure.Sql.Entities import (
     GenerationMetadataEntity,
     ImageMetadataEntity,
 )
-from MiravejaCore.Gallery.Domain.Enums import SamplerType, SchedulerType
+from MiravejaCore.Gallery.Domain.Enums import SamplerType, SchedulerType, TechniqueType
+from MiravejaCore.Gallery.Domain.Models import GenerationMetadata, ImageMetadata, Size
+from MiravejaCore.Shared.Identifiers.Models import GenerationMetadataId, ImageMetadataId
 
 
 class TestLoraMetaToGenerationMetaEntity:
@@ -169,7 +171,7 @@ class TestGenerationMetadataEntity:
         entity.steps = 30
         entity.cfgScale = 7.5
         entity.size = "512x768"
-        entity.techniques = "txt2img,hires_fix"
+        entity.techniques = ["txt2img", "hires_fix"]
 
         # Assert
         assert entity.id == 2
@@ -183,7 +185,7 @@ class TestGenerationMetadataEntity:
         assert entity.steps == 30
         assert entity.cfgScale == 7.5
         assert entity.size == "512x768"
-        assert entity.techniques == "txt2img,hires_fix"
+        assert entity.techniques == ["txt2img", "hires_fix"]
 
     def test_ToDictWithMinimalData_ShouldReturnCorrectDictionary(self):
         """Test that ToDict returns correct dictionary with minimal data."""
@@ -236,7 +238,7 @@ class TestGenerationMetadataEntity:
         entity.steps = 50
         entity.cfgScale = 9.0
         entity.size = "1024x1024"
-        entity.techniques = "txt2img,adetailer,hires_fix"
+        entity.techniques = ["txt2img", "adetailer", "hires_fix"]
 
         # Mock LoRA entities
         mockLora1 = MagicMock()
@@ -265,14 +267,14 @@ class TestGenerationMetadataEntity:
         assert result["loras"][1]["id"] == 20
         assert result["techniques"] == ["txt2img", "adetailer", "hires_fix"]
 
-    def test_ToDictWithTechniquesString_ShouldSplitIntoList(self):
-        """Test that ToDict splits techniques string into list."""
+    def test_ToDictWithTechniquesArray_ShouldReturnList(self):
+        """Test that ToDict returns the stored techniques array as a list."""
         # Arrange
         entity = GenerationMetadataEntity()
         entity.id = 5
         entity.imageId = 500
         entity.prompt = "Test"
-        entity.techniques = "txt2img,img2img,inpainting"
+        entity.techniques = ["txt2img", "img2img", "inpainting"]
         entity.loras = []
 
         # Act
@@ -297,14 +299,14 @@ class TestGenerationMetadataEntity:
         # Assert
         assert result["techniques"] is None
 
-    def test_ToDictWithEmptyTechniquesString_ShouldReturnNone(self):
-        """Test that ToDict returns None for empty techniques string."""
+    def test_ToDictWithEmptyTechniquesArray_ShouldReturnNone(self):
+        """Test that ToDict returns None for an empty techniques array."""
         # Arrange
         entity = GenerationMetadataEntity()
         entity.id = 7
         entity.imageId = 700
         entity.prompt = "Test"
-        entity.techniques = ""  # Empty string is falsy, so should return None
+        entity.techniques = []  # Empty array is falsy, so should return None
         entity.loras = []
 
         # Act
@@ -313,6 +315,22 @@ class TestGenerationMetadataEntity:
         # Assert
         assert result["techniques"] is None
 
+    def test_FromDomainWithTechniques_ShouldStoreTechniqueValuesAsArray(self):
+        """Test that FromDomain stores techniques as a list of their string values."""
+        # Arrange
+        generationMetadata = GenerationMetadata.Register(
+            id=GenerationMetadataId(id=9),
+            imageId=ImageMetadataId(id=900),
+            prompt="Test",
+            techniques=[TechniqueType.TEXT_TO_IMAGE, TechniqueType.HIRES_FIX],
+        )
+
+        # Act
+        entity = GenerationMetadataEntity.FromDomain(generationMetadata)
+
+        # Assert
+        assert entity.techniques == ["txt2img", "hires_fix"]
+
     def test_ToDictWithEmptyLorasList_ShouldReturnEmptyList(self):
         """Test that ToDict handles empty loras list."""
         # Arrange
@@ -526,3 +544,45 @@ class TestImageMetadataEntity:
 
         # Assert
         assert result["generationMetadata"] is None
+
+    def test_ToDomainWithGenerationMetadata_ShouldRebuildNestedDomainModels(self):
+        """Test that ToDomain rebuilds the image, its generation metadata and LoRAs straight from the entities."""
+        # Arrange
+        now = datetime.now(timezone.utc)
+        loraEntity = LoraMetadataEntity(id=30, hash="lora_hash", name="LoRA")
+        generationEntity = GenerationMetadataEntity(
+            id=20,
+            imageId=10,
+            prompt="Stored prompt",
+            sampler=SamplerType.EULER_A,
+            size="640x480",
+            techniques=["txt2img"],
+            loras=[loraEntity],
+        )
+        entity = ImageMetadataEntity(
+            id=10,
+            ownerId="550e8400-e29b-41d4-a716-446655440000",
+            title="Stored Image",
+            subtitle="Stored Subtitle",
+            width=640,
+            height=480,
+            repositoryType="S3",
+            uri="s3://bucket/stored.jpg",
+            isAiGenerated=True,
+            uploadedAt=now,
+            updatedAt=now,
+            generationMetadata=generationEntity,
+        )
+
+        # Act
+        result = entity.ToDomain()
+
+        # Assert
+        assert isinstance(result, ImageMetadata)
+        assert result.id == ImageMetadataId(id=10)
+        assert result.size == Size(width=640, height=480)
+        assert result.generationMetadata.id == GenerationMetadataId(id=20)
+        assert result.generationMetadata.sampler == SamplerType.EULER_A
+        assert result.generationMetadata.techniques == [TechniqueType.TEXT_TO_IMAGE]
+        assert result.generationMetadata.loras[0].hash == "lora_hash"
+        assert result.generationMetadata.loras[0].generationMetadatas == [GenerationMetadataId(id=20)]
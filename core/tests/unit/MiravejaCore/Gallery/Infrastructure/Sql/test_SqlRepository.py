@@ -1,9 +1,13 @@
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 from typing import Iterator
 
+from sqlalchemy.dialects import postgresql
+
 from MiravejaCore.Gallery.Infrastructure.Sql.Repository import (
+    LOAD_GENERATION_METADATA,
+    LOAD_LORAS,
     SqlImageMetadataRepository,
     SqlGenerationMetadataRepository,
     SqlLoraMetadataRepository,
@@ -12,6 +16,7 @@ from MiravejaCore.Gallery.Infrastructure.Sql.Entities import (
     ImageMetadataEntity,
     GenerationMetadataEntity,
     LoraMetadataEntity,
+    LoraMetaToGenerationMetaEntity,
 )
 from MiravejaCore.Gallery.Domain.Models import ImageMetadata, GenerationMetadata, LoraMetadata, Size
 from MiravejaCore.Gallery.Domain.Enums import ImageRepositoryType, SamplerType, SchedulerType
@@ -20,6 +25,7 @@ from MiravejaCore.Shared.Identifiers.Models import (
     GenerationMetadataId,
     LoraMetadataId,
     MemberId,
+    VectorId,
 )
 from MiravejaCore.Shared.Utils.Repository.Queries import ListAllQuery
 from MiravejaCore.Shared.Utils.Repository.Enums import SortOrder
@@ -49,28 +55,29 @@ class TestSqlImageMetadataRepository:
     def test_ListAllWithDefaultQuery_ShouldReturnIteratorOfImageMetadata(self, repository, mock_db_session):
         """Test that ListAll returns iterator with default query parameters."""
         # Arrange
-        mockEntity = MagicMock(spec=ImageMetadataEntity)
-        mockEntity.ToDict.return_value = {
-            "id": 1,
-            "ownerId": "550e8400-e29b-41d4-a716-446655440001",
-            "title": "Test Image",
-            "subtitle": "Subtitle",
-            "description": None,
-            "size": {"width": 512, "height": 512},
-            "repositoryType": ImageRepositoryType.S3.value,
-            "uri": "s3://bucket/image.jpg",
-            "isAiGenerated": False,
-            "generationMetadata": None,
-            "vectorId": None,
-            "uploadedAt": datetime.now(timezone.utc),
-            "updatedAt": datetime.now(timezone.utc),
-        }
+        storedEntity = ImageMetadataEntity(
+            id=1,
+            ownerId="550e8400-e29b-41d4-a716-446655440001",
+            title="Test Image",
+            subtitle="Subtitle",
+            description=None,
+            width=512,
+            height=512,
+            repositoryType=ImageRepositoryType.S3.value,
+            uri="s3://bucket/image.jpg",
+            thumbnailUri=None,
+            isAiGenerated=False,
+            vectorId=None,
+            uploadedAt=datetime.now(timezone.utc),
+            updatedAt=datetime.now(timezone.utc),
+        )
 
         mockQuery = MagicMock()
+        mockQuery.options.return_value = mockQuery
         mockQuery.order_by.return_value = mockQuery
         mockQuery.offset.return_value = mockQuery
         mockQuery.limit.return_value = mockQuery
-        mockQuery.yield_per.return_value = [mockEntity]
+        mockQuery.yield_per.return_value = [storedEntity]
 
         mock_db_session.query.return_value = mockQuery
 
@@ -84,6 +91,7 @@ class TestSqlImageMetadataRepository:
         assert isinstance(imageMetadataList[0], ImageMetadata)
         assert imageMetadataList[0].id.id == 1
         mock_db_session.query.assert_called_once_with(ImageMetadataEntity)
+        mockQuery.options.assert_called_once_with(LOAD_GENERATION_METADATA)
 
     def test_ListAllWithCustomQuery_ShouldApplySortingAndPagination(self, repository, mock_db_session):
         """Test that ListAll applies custom sorting and pagination."""
@@ -91,6 +99,7 @@ class TestSqlImageMetadataRepository:
         query = ListAllQuery(sortBy="uploadedAt", sortOrder=SortOrder.DESC, limit=50, offset=10)
 
         mockQuery = MagicMock()
+        mockQuery.options.return_value = mockQuery
         mockQuery.order_by.return_value = mockQuery
         mockQuery.offset.return_value = mockQuery
         mockQuery.limit.return_value = mockQuery
@@ -109,45 +118,46 @@ class TestSqlImageMetadataRepository:
     def test_ListAllWithFilterFunction_ShouldApplyInMemoryFiltering(self, repository, mock_db_session):
         """Test that ListAll applies filter function to results."""
         # Arrange
-        mockEntity1 = MagicMock(spec=ImageMetadataEntity)
-        mockEntity1.ToDict.return_value = {
-            "id": 1,
-            "ownerId": "550e8400-e29b-41d4-a716-446655440002",
-            "title": "Keep This",
-            "subtitle": "Subtitle",
-            "description": None,
-            "size": {"width": 512, "height": 512},
-            "repositoryType": ImageRepositoryType.S3.value,
-            "uri": "s3://bucket/image1.jpg",
-            "isAiGenerated": True,
-            "generationMetadata": None,
-            "vectorId": None,
-            "uploadedAt": datetime.now(timezone.utc),
-            "updatedAt": datetime.now(timezone.utc),
-        }
-
-        mockEntity2 = MagicMock(spec=ImageMetadataEntity)
-        mockEntity2.ToDict.return_value = {
-            "id": 2,
-            "ownerId": "550e8400-e29b-41d4-a716-446655440003",
-            "title": "Filter This",
-            "subtitle": "Subtitle",
-            "description": None,
-            "size": {"width": 512, "height": 512},
-            "repositoryType": ImageRepositoryType.S3.value,
-            "uri": "s3://bucket/image2.jpg",
-            "isAiGenerated": False,
-            "generationMetadata": None,
-            "vectorId": None,
-            "uploadedAt": datetime.now(timezone.utc),
-            "updatedAt": datetime.now(timezone.utc),
-        }
+        storedEntity1 = ImageMetadataEntity(
+            id=1,
+            ownerId="550e8400-e29b-41d4-a716-446655440002",
+            title="Keep This",
+            subtitle="Subtitle",
+            description=None,
+            width=512,
+            height=512,
+            repositoryType=ImageRepositoryType.S3.value,
+            uri="s3://bucket/image1.jpg",
+            thumbnailUri=None,
+            isAiGenerated=True,
+            vectorId=None,
+            uploadedAt=datetime.now(timezone.utc),
+            updatedAt=datetime.now(timezone.utc),
+        )
+
+        storedEntity2 = ImageMetadataEntity(
+            id=2,
+            ownerId="550e8400-e29b-41d4-a716-446655440003",
+            title="Filter This",
+            subtitle="Subtitle",
+            description=None,
+            width=512,
+            height=512,
+            repositoryType=ImageRepositoryType.S3.value,
+            uri="s3://bucket/image2.jpg",
+            thumbnailUri=None,
+            isAiGenerated=False,
+            vectorId=None,
+            uploadedAt=datetime.now(timezone.utc),
+            updatedAt=datetime.now(timezone.utc),
+        )
 
         mockQuery = MagicMock()
+        mockQuery.options.return_value = mockQuery
         mockQuery.order_by.return_value = mockQuery
         mockQuery.offset.return_value = mockQuery
         mockQuery.limit.return_value = mockQuery
-        mockQuery.yield_per.return_value = [mockEntity1, mockEntity2]
+        mockQuery.yield_per.return_value = [storedEntity1, storedEntity2]
 
         mock_db_session.query.return_value = mockQuery
 
@@ -161,6 +171,28 @@ class TestSqlImageMetadataRepository:
         assert len(result) == 1
         assert result[0].isAiGenerated is True
 
+    def test_ListAllWithFilterCriteria_ShouldFilterInQueryBeforePagination(self, repository, mock_db_session):
+        """Test that ListAll applies column criteria in the query instead of in memory."""
+        # Arrange
+        mockQuery = MagicMock()
+        mockQuery.options.return_value = mockQuery
+        mockQuery.filter_by.return_value = mockQuery
+        mockQuery.order_by.return_value = mockQuery
+        mockQuery.offset.return_value = mockQuery
+        mockQuery.limit.return_value = mockQuery
+        mockQuery.yield_per.return_value = []
+
+        mock_db_session.query.return_value = mockQuery
+
+        # Act
+        list(repository.ListAll(filterFunction={"isAiGenerated": True}))
+
+        # Assert
+        mockQuery.filter_by.assert_called_once_with(isAiGenerated=True)
+        assert mockQuery.method_calls.index(call.filter_by(isAiGenerated=True)) < mockQuery.method_calls.index(
+            call.offset(0)
+        )
+
     def test_CountWithNoRecords_ShouldReturnZero(self, repository, mock_db_session):
         """Test that Count returns zero when no records exist."""
         # Arrange
@@ -192,24 +224,24 @@ class TestSqlImageMetadataRepository:
         """Test that FindById returns ImageMetadata when image exists."""
         # Arrange
         imageId = ImageMetadataId(id=10)
-        mockEntity = MagicMock(spec=ImageMetadataEntity)
-        mockEntity.ToDict.return_value = {
-            "id": 10,
-            "ownerId": "550e8400-e29b-41d4-a716-446655440004",
-            "title": "Found Image",
-            "subtitle": "Found Subtitle",
-            "description": "Description",
-            "size": {"width": 1024, "height": 768},
-            "repositoryType": ImageRepositoryType.DISK.value,
-            "uri": "disk://images/found.jpg",
-            "isAiGenerated": True,
-            "generationMetadata": None,
-            "vectorId": 123,
-            "uploadedAt": datetime.now(timezone.utc),
-            "updatedAt": datetime.now(timezone.utc),
-        }
+        storedEntity = ImageMetadataEntity(
+            id=10,
+            ownerId="550e8400-e29b-41d4-a716-446655440004",
+            title="Found Image",
+            subtitle="Found Subtitle",
+            description="Description",
+            width=1024,
+            height=768,
+            repositoryType=ImageRepositoryType.DISK.value,
+            uri="disk://images/found.jpg",
+            thumbnailUri=None,
+            isAiGenerated=True,
+            vectorId=123,
+            uploadedAt=datetime.now(timezone.utc),
+            updatedAt=datetime.now(timezone.utc),
+        )
 
-        mock_db_session.get.return_value = mockEntity
+        mock_db_session.get.return_value = storedEntity
 
         # Act
         result = repository.FindById(imageId)
@@ -219,7 +251,7 @@ class TestSqlImageMetadataRepository:
         assert isinstance(result, ImageMetadata)
         assert result.id.id == 10
         assert result.title == "Found Image"
-        mock_db_session.get.assert_called_once_with(ImageMetadataEntity, 10)
+        mock_db_session.get.assert_called_once_with(ImageMetadataEntity, 10, options=[LOAD_GENERATION_METADATA])
 
     def test_FindByIdWithNonExistingImage_ShouldReturnNone(self, repository, mock_db_session):
         """Test that FindById returns None when image doesn't exist."""
@@ -232,32 +264,32 @@ class TestSqlImageMetadataRepository:
 
         # Assert
         assert result is None
-        mock_db_session.get.assert_called_once_with(ImageMetadataEntity, 999)
+        mock_db_session.get.assert_called_once_with(ImageMetadataEntity, 999, options=[LOAD_GENERATION_METADATA])
 
     def test_FindByUriWithExistingImage_ShouldReturnImageMetadata(self, repository, mock_db_session):
         """Test that FindByUri returns ImageMetadata when URI exists."""
         # Arrange
         uri = "s3://bucket/unique.jpg"
-        mockEntity = MagicMock(spec=ImageMetadataEntity)
-        mockEntity.ToDict.return_value = {
-            "id": 20,
-            "ownerId": "550e8400-e29b-41d4-a716-446655440005",
-            "title": "URI Found Image",
-            "subtitle": "URI Subtitle",
-            "description": None,
-            "size": {"width": 512, "height": 512},
-            "repositoryType": ImageRepositoryType.S3.value,
-            "uri": uri,
-            "isAiGenerated": False,
-            "generationMetadata": None,
-            "vectorId": None,
-            "uploadedAt": datetime.now(timezone.utc),
-            "updatedAt": datetime.now(timezone.utc),
-        }
+        storedEntity = ImageMetadataEntity(
+            id=20,
+            ownerId="550e8400-e29b-41d4-a716-446655440005",
+            title="URI Found Image",
+            subtitle="URI Subtitle",
+            description=None,
+            width=512,
+            height=512,
+            repositoryType=ImageRepositoryType.S3.value,
+            uri=uri,
+            thumbnailUri=None,
+            isAiGenerated=False,
+            vectorId=None,
+            uploadedAt=datetime.now(timezone.utc),
+            updatedAt=datetime.now(timezone.utc),
+        )
 
         mockQuery = MagicMock()
         mockQuery.filter.return_value = mockQuery
-        mockQuery.first.return_value = mockEntity
+        mockQuery.first.return_value = storedEntity
 
         mock_db_session.query.return_value = mockQuery
 
@@ -286,6 +318,35 @@ class TestSqlImageMetadataRepository:
         # Assert
         assert result is None
 
+    def test_FindExistingUrisWithSomeRegistered_ShouldReturnOnlyRegisteredUris(self, repository, mock_db_session):
+        """Test that FindExistingUris selects only the URI column and returns the registered subset."""
+        # Arrange
+        uris = {"s3://bucket/taken.jpg", "s3://bucket/free.jpg"}
+        mockRow = MagicMock()
+        mockRow.uri = "s3://bucket/taken.jpg"
+
+        mockQuery = MagicMock()
+        mockQuery.filter.return_value = mockQuery
+        mockQuery.all.return_value = [mockRow]
+
+        mock_db_session.query.return_value = mockQuery
+
+        # Act
+        result = repository.FindExistingUris(uris)
+
+        # Assert
+        assert result == {"s3://bucket/taken.jpg"}
+        mock_db_session.query.assert_called_once_with(ImageMetadataEntity.uri)
+
+    def test_FindExistingUrisWithEmptySet_ShouldNotQuery(self, repository, mock_db_session):
+        """Test that FindExistingUris returns an empty set without querying when given no URIs."""
+        # Act
+        result = repository.FindExistingUris(set())
+
+        # Assert
+        assert result == set()
+        mock_db_session.query.assert_not_called()
+
     def test_ImageMetadataExistsWithExistingImage_ShouldReturnTrue(self, repository, mock_db_session):
         """Test that ImageMetadataExists returns True when image exists."""
         # Arrange
@@ -312,8 +373,8 @@ class TestSqlImageMetadataRepository:
         # Assert
         assert result is False
 
-    def test_SaveWithValidImageMetadata_ShouldMergeEntity(self, repository, mock_db_session):
-        """Test that Save merges ImageMetadata entity."""
+    def test_SaveWithValidImageMetadata_ShouldUpsertWithoutMerge(self, repository, mock_db_session):
+        """Test that Save writes ImageMetadata with a single INSERT ... ON CONFLICT DO UPDATE."""
         # Arrange
         imageMetadata = ImageMetadata(
             id=ImageMetadataId(id=40),
@@ -333,9 +394,89 @@ class TestSqlImageMetadataRepository:
         repository.Save(imageMetadata)
 
         # Assert
-        mock_db_session.merge.assert_called_once()
-        mergedEntity = mock_db_session.merge.call_args[0][0]
-        assert isinstance(mergedEntity, ImageMetadataEntity)
+        mock_db_session.merge.assert_not_called()
+        mock_db_session.execute.assert_called_once()
+        compiledStatement = str(mock_db_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert compiledStatement.startswith("INSERT INTO t_image_metadata")
+        assert "ON CONFLICT (id) DO UPDATE" in compiledStatement
+
+    def test_SaveManyWithImageMetadatas_ShouldAddAllEntitiesWithoutMerge(self, repository, mock_db_session):
+        """Test that SaveMany stages every ImageMetadata entity with a single add_all."""
+        # Arrange
+        imageMetadatas = [
+            ImageMetadata(
+                id=ImageMetadataId(id=imageId),
+                ownerId=MemberId(id="550e8400-e29b-41d4-a716-446655440006"),
+                title="Save Many Test",
+                subtitle="Save Many Subtitle",
+                description=None,
+                size=Size(width=800, height=600),
+                repositoryType=ImageRepositoryType.S3,
+                uri=f"s3://images/save-many-{imageId}.jpg",
+                isAiGenerated=False,
+                generationMetadata=None,
+                vectorId=None,
+            )
+            for imageId in (41, 42)
+        ]
+
+        # Act
+        repository.SaveMany(imageMetadatas)
+
+        # Assert
+        mock_db_session.merge.assert_not_called()
+        mock_db_session.add_all.assert_called_once()
+        addedEntities = mock_db_session.add_all.call_args[0][0]
+        assert [entity.id for entity in addedEntities] == [41, 42]
+        assert all(isinstance(entity, ImageMetadataEntity) for entity in addedEntities)
+
+    def test_UpdateThumbnailUriWithExistingImage_ShouldReturnUpdatedImageMetadata(self, repository, mock_db_session):
+        """Test that UpdateThumbnailUri issues a single UPDATE ... RETURNING and maps the returned row."""
+        # Arrange
+        imageId = ImageMetadataId(id=50)
+        storedEntity = ImageMetadataEntity(
+            id=50,
+            ownerId="550e8400-e29b-41d4-a716-446655440007",
+            title="Thumbnail Image",
+            subtitle="Subtitle",
+            description=None,
+            width=512,
+            height=512,
+            repositoryType=ImageRepositoryType.S3.value,
+            uri="s3://bucket/image.jpg",
+            thumbnailUri="s3://bucket/thumb.jpg",
+            isAiGenerated=False,
+            vectorId=None,
+            uploadedAt=datetime.now(timezone.utc),
+            updatedAt=datetime.now(timezone.utc),
+        )
+        mock_db_session.execute.return_value.scalar_one_or_none.return_value = storedEntity
+
+        # Act
+        result = repository.UpdateThumbnailUri(imageId, "s3://bucket/thumb.jpg")
+
+        # Assert
+        assert isinstance(result, ImageMetadata)
+        assert result.thumbnailUri == "s3://bucket/thumb.jpg"
+        mock_db_session.execute.assert_called_once()
+        statement = mock_db_session.execute.call_args[0][0]
+        assert LOAD_GENERATION_METADATA in statement._with_options
+        mock_db_session.get.assert_not_called()
+        mock_db_session.merge.assert_not_called()
+
+    def test_UpdateVectorIdWithNonExistingImage_ShouldReturnNone(self, repository, mock_db_session):
+        """Test that UpdateVectorId returns None when no row matches the ID."""
+        # Arrange
+        imageId = ImageMetadataId(id=999)
+        vectorId = VectorId(id="7c9e6679-7425-40de-944b-e07fc1f90ae7")
+        mock_db_session.execute.return_value.scalar_one_or_none.return_value = None
+
+        # Act
+        result = repository.UpdateVectorId(imageId, vectorId)
+
+        # Assert
+        assert result is None
+        mock_db_session.execute.assert_called_once()
 
     def test_GenerateNewIdWithValidSequence_ShouldReturnNewImageMetadataId(self, repository, mock_db_session):
         """Test that GenerateNewId returns new ImageMetadataId from sequence."""
@@ -352,6 +493,30 @@ class TestSqlImageMetadataRepository:
         assert result.id == 100
         mock_db_session.execute.assert_called_once()
 
+    def test_GenerateNewIdsWithCount_ShouldReserveAllIdsInOneStatement(self, repository, mock_db_session):
+        """Test that GenerateNewIds reserves every requested ID with a single sequence query."""
+        # Arrange
+        mockResult = MagicMock()
+        mockResult.scalars.return_value = [101, 102, 103]
+        mock_db_session.execute.return_value = mockResult
+
+        # Act
+        result = repository.GenerateNewIds(3)
+
+        # Assert
+        assert result == [ImageMetadataId(id=101), ImageMetadataId(id=102), ImageMetadataId(id=103)]
+        mock_db_session.execute.assert_called_once()
+        assert mock_db_session.execute.call_args[0][1] == {"count": 3}
+
+    def test_GenerateNewIdsWithZeroCount_ShouldNotQuery(self, repository, mock_db_session):
+        """Test that GenerateNewIds skips the database when no IDs are requested."""
+        # Act
+        result = repository.GenerateNewIds(0)
+
+        # Assert
+        assert result == []
+        mock_db_session.execute.assert_not_called()
+
 
 class TestSqlGenerationMetadataRepository:
     """Test cases for SqlGenerationMetadataRepository."""
@@ -374,8 +539,8 @@ class TestSqlGenerationMetadataRepository:
         # Assert
         assert repository._dbSession == mock_db_session
 
-    def test_SaveWithGenerationMetadataNoLoras_ShouldMergeEntity(self, repository, mock_db_session):
-        """Test that Save merges GenerationMetadata without LoRAs."""
+    def test_SaveWithGenerationMetadataNoLoras_ShouldAddEntity(self, repository, mock_db_session):
+        """Test that Save adds GenerationMetadata without LoRAs."""
         # Arrange
         generationMetadata = GenerationMetadata(
             id=GenerationMetadataId(id=50),
@@ -397,13 +562,15 @@ class TestSqlGenerationMetadataRepository:
         repository.Save(generationMetadata)
 
         # Assert
-        mock_db_session.merge.assert_called_once()
-        mergedEntity = mock_db_session.merge.call_args[0][0]
-        assert isinstance(mergedEntity, GenerationMetadataEntity)
-        assert mergedEntity.loras == []
-
-    def test_SaveWithGenerationMetadataWithLoras_ShouldMergeEntityWithLoras(self, repository, mock_db_session):
-        """Test that Save merges GenerationMetadata with LoRAs."""
+        mock_db_session.merge.assert_not_called()
+        mock_db_session.add.assert_called_once()
+        addedEntity = mock_db_session.add.call_args[0][0]
+        assert isinstance(addedEntity, GenerationMetadataEntity)
+        assert addedEntity.loras == []
+        mock_db_session.add_all.assert_called_once_with([])
+
+    def test_SaveWithGenerationMetadataWithLoras_ShouldAddEntityAndLinkRows(self, repository, mock_db_session):
+        """Test that Save adds GenerationMetadata and links its stored LoRAs without re-inserting them."""
         # Arrange
         lora1 = LoraMetadata(id=LoraMetadataId(id=1), hash="lora_hash_1", name="LoRA 1", generationMetadatas=[])
         lora2 = LoraMetadata(id=LoraMetadataId(id=2), hash="lora_hash_2", name="LoRA 2", generationMetadatas=[])
@@ -419,11 +586,13 @@ class TestSqlGenerationMetadataRepository:
         repository.Save(generationMetadata)
 
         # Assert
-        mock_db_session.merge.assert_called_once()
-        mergedEntity = mock_db_session.merge.call_args[0][0]
-        assert isinstance(mergedEntity, GenerationMetadataEntity)
-        assert len(mergedEntity.loras) == 2
-        assert all(isinstance(lora, LoraMetadataEntity) for lora in mergedEntity.loras)
+        mock_db_session.merge.assert_not_called()
+        addedEntity = mock_db_session.add.call_args[0][0]
+        assert isinstance(addedEntity, GenerationMetadataEntity)
+        assert addedEntity.loras == []
+        linkEntities = mock_db_session.add_all.call_args[0][0]
+        assert all(isinstance(link, LoraMetaToGenerationMetaEntity) for link in linkEntities)
+        assert [(link.loraId, link.generationMetadataId) for link in linkEntities] == [(1, 60), (2, 60)]
 
     def test_GenerationMetadataExistsWithExistingMetadata_ShouldReturnTrue(self, repository, mock_db_session):
         """Test that GenerationMetadataExists returns True when metadata exists."""
@@ -455,24 +624,23 @@ class TestSqlGenerationMetadataRepository:
         """Test that FindById returns GenerationMetadata when metadata exists."""
         # Arrange
         generationMetadataId = GenerationMetadataId(id=80)
-        mockEntity = MagicMock(spec=GenerationMetadataEntity)
-        mockEntity.ToDict.return_value = {
-            "id": 80,
-            "imageId": 300,
-            "prompt": "Found prompt",
-            "negativePrompt": None,
-            "seed": None,
-            "model": None,
-            "sampler": None,
-            "scheduler": None,
-            "steps": None,
-            "cfgScale": None,
-            "size": None,
-            "loras": [],
-            "techniques": None,
-        }
+        storedEntity = GenerationMetadataEntity(
+            id=80,
+            imageId=300,
+            prompt="Found prompt",
+            negativePrompt=None,
+            seed=None,
+            model=None,
+            sampler=None,
+            scheduler=None,
+            steps=None,
+            cfgScale=None,
+            size=None,
+            loras=[],
+            techniques=None,
+        )
 
-        mock_db_session.get.return_value = mockEntity
+        mock_db_session.get.return_value = storedEntity
 
         # Act
         result = repository.FindById(generationMetadataId)
@@ -482,7 +650,7 @@ class TestSqlGenerationMetadataRepository:
         assert isinstance(result, GenerationMetadata)
         assert result.id.id == 80
         assert result.prompt == "Found prompt"
-        mock_db_session.get.assert_called_once_with(GenerationMetadataEntity, 80)
+        mock_db_session.get.assert_called_once_with(GenerationMetadataEntity, 80, options=[LOAD_LORAS])
 
     def test_FindByIdWithNonExistingMetadata_ShouldReturnNone(self, repository, mock_db_session):
         """Test that FindById returns None when metadata doesn't exist."""
@@ -533,8 +701,8 @@ class TestSqlLoraMetadataRepository:
         # Assert
         assert repository._dbSession == mock_db_session
 
-    def test_SaveWithValidLoraMetadata_ShouldMergeEntity(self, repository, mock_db_session):
-        """Test that Save merges LoraMetadata entity."""
+    def test_SaveWithValidLoraMetadata_ShouldAddEntity(self, repository, mock_db_session):
+        """Test that Save adds LoraMetadata entity."""
         # Arrange
         loraMetadata = LoraMetadata(
             id=LoraMetadataId(id=90),
@@ -547,25 +715,24 @@ class TestSqlLoraMetadataRepository:
         repository.Save(loraMetadata)
 
         # Assert
-        mock_db_session.merge.assert_called_once()
-        mergedEntity = mock_db_session.merge.call_args[0][0]
-        assert isinstance(mergedEntity, LoraMetadataEntity)
+        mock_db_session.merge.assert_not_called()
+        mock_db_session.add.assert_called_once()
+        addedEntity = mock_db_session.add.call_args[0][0]
+        assert isinstance(addedEntity, LoraMetadataEntity)
 
     def test_FindByHashWithExistingLora_ShouldReturnLoraMetadata(self, repository, mock_db_session):
         """Test that FindByHash returns LoraMetadata when hash exists."""
         # Arrange
         hash_value = "existing_hash_123"
-        mockEntity = MagicMock(spec=LoraMetadataEntity)
-        mockEntity.ToDict.return_value = {
-            "id": 100,
-            "hash": hash_value,
-            "name": "Found LoRA",
-            "generationMetadatas": [],
-        }
+        storedEntity = LoraMetadataEntity(
+            id=100,
+            hash=hash_value,
+            name="Found LoRA",
+        )
 
         mockQuery = MagicMock()
         mockQuery.filter.return_value = mockQuery
-        mockQuery.first.return_value = mockEntity
+        mockQuery.first.return_value = storedEntity
 
         mock_db_session.query.return_value = mockQuery
 
@@ -24,7 +24,7 @@ from MiravejaCore.Gallery.Infrastructure.GalleryDependencies import GalleryDepen
 from MiravejaCore.Gallery.Infrastructure.MinIo.Repository import MinIoImageContentRepository
 from MiravejaCore.Shared.DI.Models import Container
 from MiravejaCore.Shared.DatabaseManager.Infrastructure.Factories import SqlDatabaseManagerFactory
-from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
+from MiravejaCore.Shared.Events.Application.EventDispatcher import BatchingEventDispatcher, EventDispatcher
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
 from MiravejaCore.Shared.Storage.Domain.Configuration import MinIoConfig
 from MiravejaCore.Shared.Storage.Domain.Services import SignedUrlService
@@ -164,7 +164,7 @@ class TestGalleryDependencies:
         }
         container.instances[ILogger.__name__] = mock_logger
         container.instances[SqlDatabaseManagerFactory.__name__] = mock_db_factory
-        container.instances[EventDispatcher.__name__] = mock_event_dispatcher
+        container.instances[BatchingEventDispatcher.__name__] = mock_event_dispatcher
         container.instances[Boto3Session.client.__name__] = MagicMock()
 
         # Register dependencies
@@ -0,0 +1,110 @@
+"""
+Shared fixtures for Member application handler tests.
+
+Spec'd mocks are built once per session as prototypes and each test receives
+its own deep copy, so call history and stubs never leak between tests. The
+database manager is the exception: it is a MagicMock, whose magic methods a
+deep copy would share with the prototype, so make_uow_context builds it fresh.
+"""
+
+import copy
+from unittest.mock import MagicMock, Mock
+
+import pytest
+
+from MiravejaCore.Member.Domain.Interfaces import IMemberRepository
+from MiravejaCore.Member.Domain.Models import Member
+from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManager, IDatabaseManagerFactory
+from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
+from MiravejaCore.Shared.Identifiers.Models import MemberId
+from MiravejaCore.Shared.Logging.Interfaces import ILogger
+
+
+@pytest.fixture(scope="session")
+def database_manager_factory_proto():
+    """IDatabaseManagerFactory prototype mock, built once per session."""
+    return Mock(spec=IDatabaseManagerFactory)
+
+
+@pytest.fixture(scope="session")
+def member_repository_proto():
+    """IMemberRepository prototype mock, built once per session."""
+    return Mock(spec=IMemberRepository)
+
+
+@pytest.fixture(scope="session")
+def event_dispatcher_proto():
+    """EventDispatcher prototype mock, built once per session."""
+    return Mock(spec=EventDispatcher)
+
+
+@pytest.fixture(scope="session")
+def logger_proto():
+    """ILogger prototype mock, built once per session."""
+    return Mock(spec=ILogger)
+
+
+@pytest.fixture
+def mock_database_manager_factory(database_manager_factory_proto):
+    """Fresh IDatabaseManagerFactory mock for a single test."""
+    return copy.deepcopy(database_manager_factory_proto)
+
+
+@pytest.fixture
+def mock_member_repository(member_repository_proto):
+    """Fresh IMemberRepository mock for a single test."""
+    return copy.deepcopy(member_repository_proto)
+
+
+@pytest.fixture
+def mock_event_dispatcher(event_dispatcher_proto):
+    """Fresh EventDispatcher mock for a single test."""
+    return copy.deepcopy(event_dispatcher_proto)
+
+
+@pytest.fixture
+def mock_logger(logger_proto):
+    """Fresh ILogger mock for a single test."""
+    return copy.deepcopy(logger_proto)
+
+
+@pytest.fixture(scope="session")
+def make_uow_context():
+    """Builder for a database manager mock that enters as itself and serves the given repository."""
+
+    def MakeUowContext(repository: Mock) -> MagicMock:
+        databaseManager = MagicMock(spec=IDatabaseManager)
+        databaseManager.__enter__.return_value = databaseManager
+        databaseManager.GetRepository.return_value = repository
+        return databaseManager
+
+    return MakeUowContext
+
+
+@pytest.fixture
+def uow_context(make_uow_context, mock_database_manager_factory, mock_member_repository):
+    """Factory, database manager and member repository wired together as a unit of work."""
+    mockDatabaseManager = make_uow_context(mock_member_repository)
+    mock_database_manager_factory.Create.return_value = mockDatabaseManager
+    return mock_database_manager_factory, mockDatabaseManager, mock_member_repository
+
+
+@pytest.fixture(scope="session")
+def sample_member_id():
+    """Member ID generated once per session for tests that only need a valid ID."""
+    return MemberId.Generate()
+
+
+@pytest.fixture(scope="session")
+def sample_member(sample_member_id):
+    """Member registered once per session; tests must treat it as read-only."""
+    return Member.Register(
+        id=sample_member_id,
+        email="test@example.com",
+        username="testuser",
+        bio="Test bio",
+        avatarId=None,
+        coverId=None,
+        firstName="John",
+        lastName="Doe",
+    )
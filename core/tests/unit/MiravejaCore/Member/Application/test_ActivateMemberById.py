@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock
 from pydantic import ValidationError
 
 from MiravejaCore.Member.Application.ActivateMemberById import ActivateMemberByIdCommand, ActivateMemberByIdHandler
@@ -77,7 +77,6 @@ class TestActivateMemberByIdHandler:
         mockRepositoryType = IMemberRepository
         mockLogger = Mock(spec=ILogger)
         mockEventDispatcher = Mock(spec=EventDispatcher)
-        mockEventDispatcher.DispatchAll = AsyncMock()
 
         handler = ActivateMemberByIdHandler(
             mockDatabaseManagerFactory, mockRepositoryType, mockLogger, mockEventDispatcher
@@ -91,7 +90,7 @@ class TestActivateMemberByIdHandler:
         mockRepository.FindById.assert_called_once_with(memberId)
         mockRepository.Save.assert_called_once()
         mockDatabaseManager.Commit.assert_called_once()
-        mockEventDispatcher.DispatchAll.assert_called_once()
+        mockEventDispatcher.DispatchAllInBackground.assert_called_once()
         assert mockLogger.Info.call_count >= 2
 
     @pytest.mark.asyncio
@@ -155,7 +154,6 @@ class TestActivateMemberByIdHandler:
         mockRepositoryType = IMemberRepository
         mockLogger = Mock(spec=ILogger)
         mockEventDispatcher = Mock(spec=EventDispatcher)
-        mockEventDispatcher.DispatchAll = AsyncMock()
 
         handler = ActivateMemberByIdHandler(
             mockDatabaseManagerFactory, mockRepositoryType, mockLogger, mockEventDispatcher
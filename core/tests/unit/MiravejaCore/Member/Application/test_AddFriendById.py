@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock
 
 from MiravejaCore.Member.Application.AddFriendById import AddFriendByIdCommand, AddFriendByIdHandler
 from MiravejaCore.Member.Domain.Interfaces import IMemberRepository
@@ -78,7 +78,7 @@ class TestAddFriendByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.side_effect = [agent, friend]
+        mockRepository.FindByIds.return_value = {agentId: agent, friendId: friend}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -88,7 +88,6 @@ class TestAddFriendByIdHandler:
         mockRepositoryType = IMemberRepository
         mockLogger = Mock(spec=ILogger)
         mockEventDispatcher = Mock(spec=EventDispatcher)
-        mockEventDispatcher.DispatchAll = AsyncMock()
 
         handler = AddFriendByIdHandler(mockDatabaseManagerFactory, mockRepositoryType, mockLogger, mockEventDispatcher)
         command = AddFriendByIdCommand(agentId=agentId, friendId=friendId)
@@ -97,10 +96,10 @@ class TestAddFriendByIdHandler:
         await handler.Handle(command)
 
         # Assert
-        assert mockRepository.FindById.call_count == 2
+        mockRepository.FindByIds.assert_called_once_with([agentId, friendId])
         mockRepository.Save.assert_called_once()
         mockDatabaseManager.Commit.assert_called_once()
-        mockEventDispatcher.DispatchAll.assert_called_once()
+        mockEventDispatcher.DispatchAllInBackground.assert_called_once()
         assert mockLogger.Info.call_count >= 2
 
     @pytest.mark.asyncio
@@ -112,7 +111,7 @@ class TestAddFriendByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.return_value = None
+        mockRepository.FindByIds.return_value = {}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -154,7 +153,7 @@ class TestAddFriendByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.side_effect = [agent, None]
+        mockRepository.FindByIds.return_value = {agentId: agent}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -172,7 +171,7 @@ class TestAddFriendByIdHandler:
         await handler.Handle(command)
 
         # Assert
-        assert mockRepository.FindById.call_count == 2
+        mockRepository.FindByIds.assert_called_once_with([agentId, friendId])
         mockRepository.Save.assert_not_called()
         mockDatabaseManager.Commit.assert_not_called()
         assert mockLogger.Warning.call_count == 1
@@ -208,7 +207,7 @@ class TestAddFriendByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.side_effect = [agent, friend]
+        mockRepository.FindByIds.return_value = {agentId: agent, friendId: friend}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -218,7 +217,6 @@ class TestAddFriendByIdHandler:
         mockRepositoryType = IMemberRepository
         mockLogger = Mock(spec=ILogger)
         mockEventDispatcher = Mock(spec=EventDispatcher)
-        mockEventDispatcher.DispatchAll = AsyncMock()
 
         handler = AddFriendByIdHandler(mockDatabaseManagerFactory, mockRepositoryType, mockLogger, mockEventDispatcher)
         command = AddFriendByIdCommand(agentId=agentId, friendId=friendId)
@@ -169,4 +169,4 @@ class TestDeactivateMemberByIdHandler:
         # Assert
         assert mockLogger.Info.call_count >= 3
         firstInfoMessage = mockLogger.Info.call_args_list[0][0][0]
-        assert "Activating member by ID with command:" in firstInfoMessage
+        assert "Deactivating member by ID with command:" in firstInfoMessage
@@ -1,13 +1,9 @@
 import pytest
-from unittest.mock import Mock
 
 from MiravejaCore.Member.Application.FindMemberById import FindMemberByIdCommand, FindMemberByIdHandler
 from MiravejaCore.Member.Domain.Exceptions import MemberNotFoundException
 from MiravejaCore.Member.Domain.Interfaces import IMemberRepository
-from MiravejaCore.Member.Domain.Models import Member
 from MiravejaCore.Shared.Identifiers.Models import MemberId
-from MiravejaCore.Shared.Logging.Interfaces import ILogger
-from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManagerFactory, IDatabaseManager
 
 
 class TestFindMemberByIdCommand:
@@ -37,129 +33,59 @@ class TestFindMemberByIdCommand:
         assert command.memberId.id == memberIdStr
 
 
-class TestFindMemberByIdHandler:
-    """Test cases for FindMemberByIdHandler application service."""
-
-    def test_InitializeWithValidDependencies_ShouldSetCorrectProperties(self):
-        """Test that FindMemberByIdHandler initializes with valid dependencies."""
-        # Arrange
-        mockDatabaseManagerFactory = Mock(spec=IDatabaseManagerFactory)
-        mockRepositoryType = IMemberRepository
-        mockLogger = Mock(spec=ILogger)
-
-        # Act
-        handler = FindMemberByIdHandler(mockDatabaseManagerFactory, mockRepositoryType, mockLogger)
-
-        # Assert
-        assert handler._databaseManagerFactory == mockDatabaseManagerFactory
-        assert handler._tMemberRepository == mockRepositoryType
-        assert handler._logger == mockLogger
-
-    @pytest.mark.asyncio
-    async def test_HandleWithExistingMember_ShouldReturnMemberData(self):
-        """Test that Handle returns member data when member exists."""
-        # Arrange
-        memberId = MemberId.Generate()
-        member = Member.Register(
-            id=memberId,
-            email="test@example.com",
-            username="testuser",
-            bio="Test bio",
-            avatarId=None,
-            coverId=None,
-            firstName="John",
-            lastName="Doe",
-        )
-
-        mockDatabaseManager = Mock(spec=IDatabaseManager)
-        mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.return_value = member
-        mockDatabaseManager.GetRepository.return_value = mockRepository
-        mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
-        mockDatabaseManager.__exit__ = Mock(return_value=None)
-
-        mockDatabaseManagerFactory = Mock(spec=IDatabaseManagerFactory)
-        mockDatabaseManagerFactory.Create.return_value = mockDatabaseManager
-        mockRepositoryType = IMemberRepository
-        mockLogger = Mock(spec=ILogger)
-
-        handler = FindMemberByIdHandler(mockDatabaseManagerFactory, mockRepositoryType, mockLogger)
-        command = FindMemberByIdCommand(memberId=memberId)
-
-        # Act
-        result = await handler.Handle(command)
-
-        # Assert
-        assert result is not None
-        assert result["id"] == memberId.id
-        assert result["email"] == "test@example.com"
-        mockRepository.FindById.assert_called_once_with(memberId)
-        assert mockLogger.Info.call_count >= 2
-
-    @pytest.mark.asyncio
-    async def test_HandleWithNonExistingMember_ShouldRaiseMemberNotFoundException(self):
-        """Test that Handle raises exception when member does not exist."""
-        # Arrange
-        memberId = MemberId.Generate()
-
-        mockDatabaseManager = Mock(spec=IDatabaseManager)
-        mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.return_value = None
-        mockDatabaseManager.GetRepository.return_value = mockRepository
-        mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
-        mockDatabaseManager.__exit__ = Mock(return_value=None)
-
-        mockDatabaseManagerFactory = Mock(spec=IDatabaseManagerFactory)
-        mockDatabaseManagerFactory.Create.return_value = mockDatabaseManager
-        mockRepositoryType = IMemberRepository
-        mockLogger = Mock(spec=ILogger)
-
-        handler = FindMemberByIdHandler(mockDatabaseManagerFactory, mockRepositoryType, mockLogger)
-        command = FindMemberByIdCommand(memberId=memberId)
-
-        # Act & Assert
-        with pytest.raises(MemberNotFoundException) as excInfo:
-            await handler.Handle(command)
-
-        assert excInfo.value.message == f"Member with ID '{memberId.id}' was not found."
-        mockRepository.FindById.assert_called_once_with(memberId)
-        mockLogger.Warning.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_HandleWithValidMember_ShouldLogCorrectMessages(self):
-        """Test that Handle logs correct info messages."""
-        # Arrange
-        memberId = MemberId.Generate()
-        member = Member.Register(
-            id=memberId,
-            email="test@example.com",
-            username="testuser",
-            bio="Test bio",
-            avatarId=None,
-            coverId=None,
-            firstName="John",
-            lastName="Doe",
-        )
-
-        mockDatabaseManager = Mock(spec=IDatabaseManager)
-        mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.return_value = member
-        mockDatabaseManager.GetRepository.return_value = mockRepository
-        mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
-        mockDatabaseManager.__exit__ = Mock(return_value=None)
-
-        mockDatabaseManagerFactory = Mock(spec=IDatabaseManagerFactory)
-        mockDatabaseManagerFactory.Create.return_value = mockDatabaseManager
-        mockRepositoryType = IMemberRepository
-        mockLogger = Mock(spec=ILogger)
-
-        handler = FindMemberByIdHandler(mockDatabaseManagerFactory, mockRepositoryType, mockLogger)
-        command = FindMemberByIdCommand(memberId=memberId)
-
-        # Act
-        await handler.Handle(command)
-
-        # Assert
-        assert mockLogger.Info.call_count >= 2
-        firstInfoMessage = mockLogger.Info.call_args_list[0][0][0]
-        assert "Finding member by ID with command:" in firstInfoMessage
+@pytest.fixture
+def handler(uow_context, mock_logger):
+    """FindMemberByIdHandler wired to the shared unit-of-work mocks."""
+    mockFactory, _, _ = uow_context
+    return FindMemberByIdHandler(mockFactory, IMemberRepository, mock_logger)
+
+
+def test_InitializeWithValidDependencies_ShouldSetCorrectProperties(mock_database_manager_factory, mock_logger):
+    """Test that FindMemberByIdHandler initializes with valid dependencies."""
+    # Act
+    handler = FindMemberByIdHandler(mock_database_manager_factory, IMemberRepository, mock_logger)
+
+    # Assert
+    assert handler._databaseManagerFactory == mock_database_manager_factory
+    assert handler._tMemberRepository == IMemberRepository
+    assert handler._logger == mock_logger
+
+
+@pytest.mark.asyncio
+async def test_HandleWithExistingMember_ShouldReturnMemberData(
+    handler, uow_context, sample_member, sample_member_id, mock_logger
+):
+    """Test that Handle returns member data and logs the command when member exists."""
+    # Arrange
+    _, _, mockRepository = uow_context
+    mockRepository.FindById.return_value = sample_member
+
+    # Act
+    result = await handler.Handle(FindMemberByIdCommand(memberId=sample_member_id))
+
+    # Assert
+    assert result is not None
+    assert result["id"] == sample_member_id.id
+    assert result["email"] == "test@example.com"
+    mockRepository.FindById.assert_called_once_with(sample_member_id)
+    infoCalls = mock_logger.Info.call_args_list
+    assert len(infoCalls) >= 2
+    assert "Finding member by ID with command:" in infoCalls[0].args[0]
+
+
+@pytest.mark.asyncio
+async def test_HandleWithNonExistingMember_ShouldRaiseMemberNotFoundException(
+    handler, uow_context, sample_member_id, mock_logger
+):
+    """Test that Handle raises exception when member does not exist."""
+    # Arrange
+    _, _, mockRepository = uow_context
+    mockRepository.FindById.return_value = None
+
+    # Act & Assert
+    with pytest.raises(MemberNotFoundException) as excInfo:
+        await handler.Handle(FindMemberByIdCommand(memberId=sample_member_id))
+
+    assert excInfo.value.message == f"Member with ID '{sample_member_id.id}' was not found."
+    mockRepository.FindById.assert_called_once_with(sample_member_id)
+    mock_logger.Warning.assert_called_once()
@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import Mock
 
 from MiravejaCore.Member.Application.FollowMemberById import FollowMemberByIdCommand, FollowMemberByIdHandler
 from MiravejaCore.Member.Domain.Interfaces import IMemberRepository
@@ -80,7 +80,7 @@ class TestFollowMemberByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.side_effect = [agent, memberToFollow]
+        mockRepository.FindByIds.return_value = {agentId: agent, memberIdToFollow: memberToFollow}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -90,7 +90,6 @@ class TestFollowMemberByIdHandler:
         mockRepositoryType = IMemberRepository
         mockLogger = Mock(spec=ILogger)
         mockEventDispatcher = Mock(spec=EventDispatcher)
-        mockEventDispatcher.DispatchAll = AsyncMock()
 
         handler = FollowMemberByIdHandler(
             mockDatabaseManagerFactory, mockRepositoryType, mockLogger, mockEventDispatcher
@@ -101,10 +100,10 @@ class TestFollowMemberByIdHandler:
         await handler.Handle(command)
 
         # Assert
-        assert mockRepository.FindById.call_count == 2
+        mockRepository.FindByIds.assert_called_once_with([agentId, memberIdToFollow])
         mockRepository.Save.assert_called_once()
         mockDatabaseManager.Commit.assert_called_once()
-        mockEventDispatcher.DispatchAll.assert_called_once()
+        mockEventDispatcher.DispatchAllInBackground.assert_called_once()
         assert mockLogger.Info.call_count >= 2
 
     @pytest.mark.asyncio
@@ -116,7 +115,7 @@ class TestFollowMemberByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.return_value = None
+        mockRepository.FindByIds.return_value = {}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -160,7 +159,7 @@ class TestFollowMemberByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.side_effect = [agent, None]  # Agent exists, member to follow does not
+        mockRepository.FindByIds.return_value = {agentId: agent}  # Agent exists, member to follow does not
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -215,7 +214,7 @@ class TestFollowMemberByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.side_effect = [agent, memberToFollow]
+        mockRepository.FindByIds.return_value = {agentId: agent, memberIdToFollow: memberToFollow}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -225,7 +224,6 @@ class TestFollowMemberByIdHandler:
         mockRepositoryType = IMemberRepository
         mockLogger = Mock(spec=ILogger)
         mockEventDispatcher = Mock(spec=EventDispatcher)
-        mockEventDispatcher.DispatchAll = AsyncMock()
 
         handler = FollowMemberByIdHandler(
             mockDatabaseManagerFactory, mockRepositoryType, mockLogger, mockEventDispatcher
@@ -1,13 +1,9 @@
 import pytest
-from unittest.mock import Mock
 
 from MiravejaCore.Member.Application.ListAllMembers import ListAllMembersCommand, ListAllMembersHandler
 from MiravejaCore.Member.Domain.Interfaces import IMemberRepository
 from MiravejaCore.Member.Domain.Models import Member
 from MiravejaCore.Shared.Identifiers.Models import MemberId
-from MiravejaCore.Shared.Logging.Interfaces import ILogger
-from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManagerFactory, IDatabaseManager
-from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 
 
 class TestListAllMembersCommand:
@@ -22,145 +18,79 @@ class TestListAllMembersCommand:
         assert command is not None
 
 
-class TestListAllMembersHandler:
-    """Test cases for ListAllMembersHandler application service."""
-
-    def test_InitializeWithValidDependencies_ShouldSetCorrectProperties(self):
-        """Test that ListAllMembersHandler initializes with valid dependencies."""
-        # Arrange
-        mockDatabaseManagerFactory = Mock(spec=IDatabaseManagerFactory)
-        mockRepositoryType = IMemberRepository
-        mockLogger = Mock(spec=ILogger)
-        mockEventDispatcher = Mock(spec=EventDispatcher)
-
-        # Act
-        handler = ListAllMembersHandler(mockDatabaseManagerFactory, mockRepositoryType, mockLogger, mockEventDispatcher)
-
-        # Assert
-        assert handler._databaseManagerFactory == mockDatabaseManagerFactory
-        assert handler._tMemberRepository == mockRepositoryType
-        assert handler._logger == mockLogger
-        assert handler._eventDispatcher == mockEventDispatcher
-
-    @pytest.mark.asyncio
-    async def test_HandleWithExistingMembers_ShouldReturnMembersList(self):
-        """Test that Handle returns list of members when members exist."""
-        # Arrange
-        member1Id = MemberId.Generate()
-        member2Id = MemberId.Generate()
-
-        member1 = Member.Register(
-            id=member1Id,
-            email="test1@example.com",
-            username="user1",
-            bio="Test bio 1",
-            avatarId=None,
-            coverId=None,
-            firstName="John",
-            lastName="Doe",
-        )
-
-        member2 = Member.Register(
-            id=member2Id,
-            email="test2@example.com",
-            username="user2",
-            bio="Test bio 2",
-            avatarId=None,
-            coverId=None,
-            firstName="Jane",
-            lastName="Smith",
-        )
-
-        membersList = [member1, member2]
-
-        mockDatabaseManager = Mock(spec=IDatabaseManager)
-        mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.ListAll.return_value = membersList
-        mockRepository.Count.return_value = 2
-        mockDatabaseManager.GetRepository.return_value = mockRepository
-        mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
-        mockDatabaseManager.__exit__ = Mock(return_value=None)
-
-        mockDatabaseManagerFactory = Mock(spec=IDatabaseManagerFactory)
-        mockDatabaseManagerFactory.Create.return_value = mockDatabaseManager
-        mockRepositoryType = IMemberRepository
-        mockLogger = Mock(spec=ILogger)
-        mockEventDispatcher = Mock(spec=EventDispatcher)
-
-        handler = ListAllMembersHandler(mockDatabaseManagerFactory, mockRepositoryType, mockLogger, mockEventDispatcher)
-        command = ListAllMembersCommand()
-
-        # Act
-        result = await handler.Handle(command)
-
-        # Assert
-        assert result is not None
-        assert "items" in result
-        assert "pagination" in result
-        assert len(result["items"]) == 2
-        mockRepository.ListAll.assert_called_once()
-        mockRepository.Count.assert_called_once()
-        mockLogger.Info.assert_called()
-        mockEventDispatcher.Dispatch.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_HandleWithNoMembers_ShouldReturnEmptyResponse(self):
-        """Test that Handle returns empty response when no members exist."""
-        # Arrange
-        mockDatabaseManager = Mock(spec=IDatabaseManager)
-        mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.ListAll.return_value = []
-        mockRepository.Count.return_value = 0
-        mockDatabaseManager.GetRepository.return_value = mockRepository
-        mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
-        mockDatabaseManager.__exit__ = Mock(return_value=None)
-
-        mockDatabaseManagerFactory = Mock(spec=IDatabaseManagerFactory)
-        mockDatabaseManagerFactory.Create.return_value = mockDatabaseManager
-        mockRepositoryType = IMemberRepository
-        mockLogger = Mock(spec=ILogger)
-        mockEventDispatcher = Mock(spec=EventDispatcher)
-
-        handler = ListAllMembersHandler(mockDatabaseManagerFactory, mockRepositoryType, mockLogger, mockEventDispatcher)
-        command = ListAllMembersCommand()
-
-        # Act
-        result = await handler.Handle(command)
-
-        # Assert
-        assert result is not None
-        assert "items" in result
-        assert len(result["items"]) == 0
-        mockRepository.ListAll.assert_called_once()
-        mockRepository.Count.assert_called_once()
-        mockLogger.Info.assert_called()
-        mockEventDispatcher.Dispatch.assert_called_once()
-
-    @pytest.mark.asyncio
-    async def test_HandleWithValidCommand_ShouldLogInfoMessage(self):
-        """Test that Handle logs info message with command details."""
-        # Arrange
-        mockDatabaseManager = Mock(spec=IDatabaseManager)
-        mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.ListAll.return_value = []
-        mockRepository.Count.return_value = 0
-        mockDatabaseManager.GetRepository.return_value = mockRepository
-        mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
-        mockDatabaseManager.__exit__ = Mock(return_value=None)
-
-        mockDatabaseManagerFactory = Mock(spec=IDatabaseManagerFactory)
-        mockDatabaseManagerFactory.Create.return_value = mockDatabaseManager
-        mockRepositoryType = IMemberRepository
-        mockLogger = Mock(spec=ILogger)
-        mockEventDispatcher = Mock(spec=EventDispatcher)
-
-        handler = ListAllMembersHandler(mockDatabaseManagerFactory, mockRepositoryType, mockLogger, mockEventDispatcher)
-        command = ListAllMembersCommand()
-
-        # Act
-        await handler.Handle(command)
-
-        # Assert
-        assert mockLogger.Info.call_count >= 1
-        loggedMessage = mockLogger.Info.call_args_list[0][0][0]
-        assert "Listing all members with command:" in loggedMessage
+@pytest.fixture
+def handler(uow_context, mock_logger, mock_event_dispatcher):
+    """ListAllMembersHandler wired to the shared unit-of-work mocks."""
+    mockFactory, _, _ = uow_context
+    return ListAllMembersHandler(mockFactory, IMemberRepository, mock_logger, mock_event_dispatcher)
+
+
+def test_InitializeWithValidDependencies_ShouldSetCorrectProperties(
+    mock_database_manager_factory, mock_event_dispatcher, mock_logger
+):
+    """Test that ListAllMembersHandler initializes with valid dependencies."""
+    # Act
+    handler = ListAllMembersHandler(
+        mock_database_manager_factory, IMemberRepository, mock_logger, mock_event_dispatcher
+    )
+
+    # Assert
+    assert handler._databaseManagerFactory == mock_database_manager_factory
+    assert handler._tMemberRepository == IMemberRepository
+    assert handler._logger == mock_logger
+    assert handler._eventDispatcher == mock_event_dispatcher
+
+
+@pytest.mark.asyncio
+async def test_HandleWithExistingMembers_ShouldReturnMembersList(
+    handler, uow_context, sample_member, mock_event_dispatcher, mock_logger
+):
+    """Test that Handle returns list of members when members exist."""
+    # Arrange
+    otherMember = Member.Register(
+        id=MemberId.Generate(),
+        email="test2@example.com",
+        username="user2",
+        bio="Test bio 2",
+        avatarId=None,
+        coverId=None,
+        firstName="Jane",
+        lastName="Smith",
+    )
+    _, _, mockRepository = uow_context
+    mockRepository.ListAll.return_value = [sample_member, otherMember]
+    mockRepository.Count.return_value = 2
+
+    # Act
+    result = await handler.Handle(ListAllMembersCommand())
+
+    # Assert
+    assert result is not None
+    assert "items" in result
+    assert "pagination" in result
+    assert len(result["items"]) == 2
+    mockRepository.ListAll.assert_called_once()
+    mockRepository.Count.assert_called_once()
+    mock_logger.Info.assert_called()
+    mock_event_dispatcher.Dispatch.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_HandleWithNoMembers_ShouldReturnEmptyResponse(handler, uow_context, mock_event_dispatcher, mock_logger):
+    """Test that Handle returns empty response and logs the command when no members exist."""
+    # Arrange
+    _, _, mockRepository = uow_context
+    mockRepository.ListAll.return_value = []
+    mockRepository.Count.return_value = 0
+
+    # Act
+    result = await handler.Handle(ListAllMembersCommand())
+
+    # Assert
+    assert result is not None
+    assert "items" in result
+    assert len(result["items"]) == 0
+    mockRepository.ListAll.assert_called_once()
+    mockRepository.Count.assert_called_once()
+    mock_event_dispatcher.Dispatch.assert_called_once()
+    assert "Listing all members with command:" in mock_logger.Info.call_args_list[0].args[0]
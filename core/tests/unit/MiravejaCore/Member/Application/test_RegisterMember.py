@@ -1,15 +1,30 @@
 import pytest
-from unittest.mock import Mock, AsyncMock
+from unittest.mock import AsyncMock
 from datetime import datetime
 from pydantic import ValidationError
 
 from MiravejaCore.Member.Application.RegisterMember import RegisterMemberCommand, RegisterMemberHandler
 from MiravejaCore.Member.Domain.Exceptions import MemberAlreadyExistsException
 from MiravejaCore.Member.Domain.Interfaces import IMemberRepository
-from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Identifiers.Models import MemberId
-from MiravejaCore.Shared.Logging.Interfaces import ILogger
-from MiravejaCore.Shared.DatabaseManager.Domain.Interfaces import IDatabaseManagerFactory, IDatabaseManager
+
+
+@pytest.fixture(scope="session")
+def valid_register_kwargs():
+    """Valid RegisterMemberCommand fields shared by the validation tests."""
+    return {
+        "id": "123e4567-e89b-12d3-a456-426614174000",
+        "email": "test@example.com",
+        "username": "testuser",
+        "firstName": "John",
+        "lastName": "Doe",
+    }
+
+
+@pytest.fixture(scope="session")
+def valid_register_command(valid_register_kwargs):
+    """RegisterMemberCommand validated once per session; use model_copy(update=...) for variants."""
+    return RegisterMemberCommand(**valid_register_kwargs)
 
 
 class TestRegisterMemberCommand:
@@ -76,22 +91,22 @@ class TestRegisterMemberCommand:
         assert command.gender == testGender
         assert command.dateOfBirth == testDateOfBirth
 
-    def test_InitializeWithInvalidEmail_ShouldRaiseValidationError(self):
-        """Test that RegisterMemberCommand raises validation error with invalid email."""
-        # Arrange
-        testId = "123e4567-e89b-12d3-a456-426614174000"
-        invalidEmail = "invalid-email"
-        testUsername = "testuser"
-        testFirstName = "John"
-        testLastName = "Doe"
-
+    @pytest.mark.parametrize(
+        "field, value, expected",
+        [
+            ("email", "invalid-email", "value is not a valid email address"),
+            ("firstName", "", "at least 1 character"),
+            ("lastName", "", "at least 1 character"),
+        ],
+        ids=["invalid-email", "empty-firstName", "empty-lastName"],
+    )
+    def test_InitializeWithInvalidField_ShouldRaiseValidationError(self, valid_register_kwargs, field, value, expected):
+        """Test that RegisterMemberCommand raises validation error when a field is invalid."""
         # Act & Assert
         with pytest.raises(ValidationError) as excInfo:
-            RegisterMemberCommand(
-                id=testId, email=invalidEmail, username=testUsername, firstName=testFirstName, lastName=testLastName
-            )  # type: ignore
+            RegisterMemberCommand(**{**valid_register_kwargs, field: value})
 
-        assert "value is not a valid email address" in str(excInfo.value)
+        assert expected in str(excInfo.value)
 
     def test_InitializeWithShortUsername_ShouldRaiseValidationError(self):
         """Test that RegisterMemberCommand raises validation error with username too short."""
@@ -127,40 +142,6 @@ class TestRegisterMemberCommand:
 
         assert "at most 41 character" in str(excInfo.value)
 
-    def test_InitializeWithEmptyFirstName_ShouldRaiseValidationError(self):
-        """Test that RegisterMemberCommand raises validation error with empty first name."""
-        # Arrange
-        testId = "123e4567-e89b-12d3-a456-426614174000"
-        testEmail = "test@example.com"
-        testUsername = "testuser"
-        emptyFirstName = ""
-        testLastName = "Doe"
-
-        # Act & Assert
-        with pytest.raises(ValidationError) as excInfo:
-            RegisterMemberCommand(
-                id=testId, email=testEmail, username=testUsername, firstName=emptyFirstName, lastName=testLastName
-            )  # type: ignore
-
-        assert "at least 1 character" in str(excInfo.value)
-
-    def test_InitializeWithEmptyLastName_ShouldRaiseValidationError(self):
-        """Test that RegisterMemberCommand raises validation error with empty last name."""
-        # Arrange
-        testId = "123e4567-e89b-12d3-a456-426614174000"
-        testEmail = "test@example.com"
-        testUsername = "testuser"
-        testFirstName = "John"
-        emptyLastName = ""
-
-        # Act & Assert
-        with pytest.raises(ValidationError) as excInfo:
-            RegisterMemberCommand(
-                id=testId, email=testEmail, username=testUsername, firstName=testFirstName, lastName=emptyLastName
-            )  # type: ignore
-
-        assert "at least 1 character" in str(excInfo.value)
-
     def test_InitializeWithLongBio_ShouldRaiseValidationError(self):
         """Test that RegisterMemberCommand raises validation error with bio too long."""
         # Arrange
@@ -185,137 +166,82 @@ class TestRegisterMemberCommand:
         assert "at most 500 character" in str(excInfo.value)
 
 
-class TestRegisterMemberHandler:
-    """Test cases for RegisterMemberHandler application service."""
-
-    def test_InitializeWithValidDependencies_ShouldSetCorrectProperties(self):
-        """Test that RegisterMemberHandler initializes with valid dependencies."""
-        # Arrange
-        mockDatabaseManagerFactory = Mock(spec=IDatabaseManagerFactory)
-        mockRepositoryType = IMemberRepository
-        mockEventDispatcher = Mock(spec=EventDispatcher)
-        mockLogger = Mock(spec=ILogger)
-
-        # Act
-        handler = RegisterMemberHandler(mockDatabaseManagerFactory, mockRepositoryType, mockEventDispatcher, mockLogger)
-
-        # Assert
-        assert handler._databaseManagerFactory == mockDatabaseManagerFactory
-        assert handler._tMemberRepository == mockRepositoryType
-        assert handler._eventDispatcher == mockEventDispatcher
-        assert handler._logger == mockLogger
-
-    @pytest.mark.asyncio
-    async def test_HandleWithValidCommand_ShouldRegisterMemberSuccessfully(self):
-        """Test that Handle registers member successfully with valid command."""
-        # Arrange
-        testId = "123e4567-e89b-12d3-a456-426614174000"
-        testEmail = "test@example.com"
-        testUsername = "testuser"
-        testFirstName = "John"
-        testLastName = "Doe"
-
-        mockDatabaseManager = Mock(spec=IDatabaseManager)
-        mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.MemberExists.return_value = False
-        mockDatabaseManager.GetRepository.return_value = mockRepository
-        mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
-        mockDatabaseManager.__exit__ = Mock(return_value=None)
-
-        mockDatabaseManagerFactory = Mock(spec=IDatabaseManagerFactory)
-        mockDatabaseManagerFactory.Create.return_value = mockDatabaseManager
-        mockRepositoryType = IMemberRepository
-        mockEventDispatcher = Mock(spec=EventDispatcher)
-        mockEventDispatcher.DispatchAll = AsyncMock()
-        mockLogger = Mock(spec=ILogger)
-
-        handler = RegisterMemberHandler(mockDatabaseManagerFactory, mockRepositoryType, mockEventDispatcher, mockLogger)
-        command = RegisterMemberCommand(
-            id=testId, email=testEmail, username=testUsername, firstName=testFirstName, lastName=testLastName
-        )  # type: ignore
-
-        # Act
-        await handler.Handle(command)
-
-        # Assert
-        mockRepository.MemberExists.assert_called_once()
-        mockRepository.Save.assert_called_once()
-        mockDatabaseManager.Commit.assert_called_once()
-        mockEventDispatcher.DispatchAll.assert_called_once()
-        assert mockLogger.Info.call_count >= 2
-
-    @pytest.mark.asyncio
-    async def test_HandleWithExistingMember_ShouldRaiseMemberAlreadyExistsException(self):
-        """Test that Handle raises exception when member already exists."""
-        # Arrange
-        testId = "123e4567-e89b-12d3-a456-426614174000"
-        testEmail = "test@example.com"
-        testUsername = "testuser"
-        testFirstName = "John"
-        testLastName = "Doe"
-
-        mockDatabaseManager = Mock(spec=IDatabaseManager)
-        mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.MemberExists.return_value = True
-        mockDatabaseManager.GetRepository.return_value = mockRepository
-        mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
-        mockDatabaseManager.__exit__ = Mock(return_value=None)
-
-        mockDatabaseManagerFactory = Mock(spec=IDatabaseManagerFactory)
-        mockDatabaseManagerFactory.Create.return_value = mockDatabaseManager
-        mockRepositoryType = IMemberRepository
-        mockEventDispatcher = Mock(spec=EventDispatcher)
-        mockLogger = Mock(spec=ILogger)
-
-        handler = RegisterMemberHandler(mockDatabaseManagerFactory, mockRepositoryType, mockEventDispatcher, mockLogger)
-        command = RegisterMemberCommand(
-            id=testId, email=testEmail, username=testUsername, firstName=testFirstName, lastName=testLastName
-        )  # type: ignore
-
-        # Act & Assert
-        with pytest.raises(MemberAlreadyExistsException) as excInfo:
-            await handler.Handle(command)
-
-        assert excInfo.value.message == f"Member with ID '{testId}' already exists."
-        mockRepository.MemberExists.assert_called_once()
-        mockRepository.Save.assert_not_called()
-        mockDatabaseManager.Commit.assert_not_called()
-
-    @pytest.mark.asyncio
-    async def test_HandleWithValidCommand_ShouldLogCorrectMessages(self):
-        """Test that Handle logs correct info and debug messages."""
-        # Arrange
-        testId = "123e4567-e89b-12d3-a456-426614174000"
-        testEmail = "test@example.com"
-        testUsername = "testuser"
-        testFirstName = "John"
-        testLastName = "Doe"
-
-        mockDatabaseManager = Mock(spec=IDatabaseManager)
-        mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.MemberExists.return_value = False
-        mockDatabaseManager.GetRepository.return_value = mockRepository
-        mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
-        mockDatabaseManager.__exit__ = Mock(return_value=None)
-
-        mockDatabaseManagerFactory = Mock(spec=IDatabaseManagerFactory)
-        mockDatabaseManagerFactory.Create.return_value = mockDatabaseManager
-        mockRepositoryType = IMemberRepository
-        mockEventDispatcher = Mock(spec=EventDispatcher)
-        mockEventDispatcher.DispatchAll = AsyncMock()
-        mockLogger = Mock(spec=ILogger)
-
-        handler = RegisterMemberHandler(mockDatabaseManagerFactory, mockRepositoryType, mockEventDispatcher, mockLogger)
-        command = RegisterMemberCommand(
-            id=testId, email=testEmail, username=testUsername, firstName=testFirstName, lastName=testLastName
-        )  # type: ignore
-
-        # Act
-        await handler.Handle(command)
-
-        # Assert
-        assert mockLogger.Info.call_count >= 2
-        assert mockLogger.Debug.call_count >= 2
-
-        firstInfoMessage = mockLogger.Info.call_args_list[0][0][0]
-        assert "Registering member with command:" in firstInfoMessage
+@pytest.fixture
+def handler(uow_context, mock_event_dispatcher, mock_logger):
+    """RegisterMemberHandler wired to the shared unit-of-work mocks."""
+    mockFactory, _, _ = uow_context
+    mock_event_dispatcher.DispatchAll = AsyncMock()
+    return RegisterMemberHandler(mockFactory, IMemberRepository, mock_event_dispatcher, mock_logger)
+
+
+def test_InitializeWithValidDependencies_ShouldSetCorrectProperties(
+    mock_database_manager_factory, mock_event_dispatcher, mock_logger
+):
+    """Test that RegisterMemberHandler initializes with valid dependencies."""
+    # Act
+    handler = RegisterMemberHandler(
+        mock_database_manager_factory, IMemberRepository, mock_event_dispatcher, mock_logger
+    )
+
+    # Assert
+    assert handler._databaseManagerFactory == mock_database_manager_factory
+    assert handler._tMemberRepository == IMemberRepository
+    assert handler._eventDispatcher == mock_event_dispatcher
+    assert handler._logger == mock_logger
+
+
+@pytest.mark.asyncio
+async def test_HandleWithValidCommand_ShouldRegisterMemberSuccessfully(
+    handler, uow_context, valid_register_command, mock_event_dispatcher, mock_logger
+):
+    """Test that Handle registers member successfully with valid command."""
+    # Arrange
+    _, mockDatabaseManager, mockRepository = uow_context
+    mockRepository.SaveIfAbsent.return_value = True
+
+    # Act
+    await handler.Handle(valid_register_command)
+
+    # Assert
+    mockRepository.SaveIfAbsent.assert_called_once()
+    mockRepository.MemberExists.assert_not_called()
+    mockDatabaseManager.Commit.assert_called_once()
+    mock_event_dispatcher.DispatchAll.assert_called_once()
+    assert mock_logger.Info.call_count >= 2
+
+
+@pytest.mark.asyncio
+async def test_HandleWithExistingMember_ShouldRaiseMemberAlreadyExistsException(
+    handler, uow_context, valid_register_command
+):
+    """Test that Handle raises exception when member already exists."""
+    # Arrange
+    _, mockDatabaseManager, mockRepository = uow_context
+    mockRepository.SaveIfAbsent.return_value = False
+
+    # Act & Assert
+    with pytest.raises(MemberAlreadyExistsException) as excInfo:
+        await handler.Handle(valid_register_command)
+
+    assert excInfo.value.message == f"Member with ID '{valid_register_command.id}' already exists."
+    mockRepository.SaveIfAbsent.assert_called_once()
+    mockDatabaseManager.Commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_HandleWithValidCommand_ShouldLogCorrectMessages(
+    handler, uow_context, valid_register_command, mock_logger
+):
+    """Test that Handle logs correct info and debug messages."""
+    # Arrange
+    _, _, mockRepository = uow_context
+    mockRepository.SaveIfAbsent.return_value = True
+
+    # Act
+    await handler.Handle(valid_register_command)
+
+    # Assert
+    infoCalls = mock_logger.Info.call_args_list
+    assert len(infoCalls) >= 2
+    assert mock_logger.Debug.call_count >= 2
+    assert "Registering member with command:" in infoCalls[0].args[0]
@@ -80,7 +80,7 @@ class TestRemoveFriendByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.side_effect = [agent, friend]
+        mockRepository.FindByIds.return_value = {agentId: agent, friendId: friend}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -101,7 +101,7 @@ class TestRemoveFriendByIdHandler:
         await handler.Handle(command)
 
         # Assert
-        assert mockRepository.FindById.call_count == 2
+        mockRepository.FindByIds.assert_called_once_with([agentId, friendId])
         mockRepository.Save.assert_called_once()
         mockDatabaseManager.Commit.assert_called_once()
         mockEventDispatcher.DispatchAll.assert_called_once()
@@ -116,7 +116,7 @@ class TestRemoveFriendByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.return_value = None
+        mockRepository.FindByIds.return_value = {}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -160,7 +160,7 @@ class TestRemoveFriendByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.side_effect = [agent, None]  # Agent exists, friend does not
+        mockRepository.FindByIds.return_value = {agentId: agent}  # Agent exists, friend does not
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -215,7 +215,7 @@ class TestRemoveFriendByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.side_effect = [agent, friend]
+        mockRepository.FindByIds.return_value = {agentId: agent, friendId: friend}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
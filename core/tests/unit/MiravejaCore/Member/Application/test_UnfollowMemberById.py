@@ -80,7 +80,7 @@ class TestUnfollowMemberByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.side_effect = [agent, memberToUnfollow]
+        mockRepository.FindByIds.return_value = {agentId: agent, memberIdToUnfollow: memberToUnfollow}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -101,7 +101,7 @@ class TestUnfollowMemberByIdHandler:
         await handler.Handle(command)
 
         # Assert
-        assert mockRepository.FindById.call_count == 2
+        mockRepository.FindByIds.assert_called_once_with([agentId, memberIdToUnfollow])
         mockRepository.Save.assert_called_once()
         mockDatabaseManager.Commit.assert_called_once()
         mockEventDispatcher.DispatchAll.assert_called_once()
@@ -116,7 +116,7 @@ class TestUnfollowMemberByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.return_value = None
+        mockRepository.FindByIds.return_value = {}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -160,7 +160,7 @@ class TestUnfollowMemberByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.side_effect = [agent, None]  # Agent exists, member to unfollow does not
+        mockRepository.FindByIds.return_value = {agentId: agent}  # Agent exists, member to unfollow does not
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -215,7 +215,7 @@ class TestUnfollowMemberByIdHandler:
 
         mockDatabaseManager = Mock(spec=IDatabaseManager)
         mockRepository = Mock(spec=IMemberRepository)
-        mockRepository.FindById.side_effect = [agent, memberToUnfollow]
+        mockRepository.FindByIds.return_value = {agentId: agent, memberIdToUnfollow: memberToUnfollow}
         mockDatabaseManager.GetRepository.return_value = mockRepository
         mockDatabaseManager.__enter__ = Mock(return_value=mockDatabaseManager)
         mockDatabaseManager.__exit__ = Mock(return_value=None)
@@ -169,7 +169,7 @@ class TestMemberActivatedEvent:
         assert isinstance(event.activatedAt, str)
 
     def test_FromModel_ShouldSetActivatedAtTimestamp(self):
-        """Test that FromModel sets activatedAt timestamp."""
+        """Test that FromModel sets activatedAt as an ISO timestamp matching occurredAt."""
         # Arrange
         memberId = MemberId.Generate()
         member = Member(
@@ -186,7 +186,8 @@ class TestMemberActivatedEvent:
             event = MemberActivatedEvent.FromModel(member)
 
         # Assert
-        assert event.activatedAt == str(mock_now)
+        assert event.activatedAt == mock_now.isoformat()
+        assert event.occurredAt == mock_now
 
 
 class TestMemberDeactivatedEvent:
@@ -216,7 +217,7 @@ class TestMemberDeactivatedEvent:
         assert isinstance(event.deactivatedAt, str)
 
     def test_FromModel_ShouldSetDeactivatedAtTimestamp(self):
-        """Test that FromModel sets deactivatedAt timestamp."""
+        """Test that FromModel sets deactivatedAt as an ISO timestamp matching occurredAt."""
         # Arrange
         memberId = MemberId.Generate()
         member = Member(
@@ -233,7 +234,8 @@ class TestMemberDeactivatedEvent:
             event = MemberDeactivatedEvent.FromModel(member)
 
         # Assert
-        assert event.deactivatedAt == str(mock_now)
+        assert event.deactivatedAt == mock_now.isoformat()
+        assert event.occurredAt == mock_now
 
 
 class TestMemberProfileUpdatedEvent:
@@ -1,8 +1,10 @@
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 from typing import Iterator
 
+from sqlalchemy.dialects import postgresql
+
 from MiravejaCore.Member.Infrastructure.Sql.Repositories import SqlMemberRepository
 from MiravejaCore.Member.Infrastructure.Sql.Entities import MemberEntity
 from MiravejaCore.Member.Domain.Models import Member, Profile, Identity, Social
@@ -203,6 +205,33 @@ class TestSqlMemberRepository:
         assert result[0].email == "test@example.com"
         assert result[0].isActive is True
 
+    def test_ListAllWithFilterCriteria_ShouldFilterInQueryBeforePagination(
+        self, repository, mock_db_session, sample_member_dict
+    ):
+        """Test that ListAll applies column criteria in the query instead of in memory."""
+        # Arrange
+        mockEntity = MagicMock(spec=MemberEntity)
+        mockEntity.ToDict.return_value = sample_member_dict
+
+        mockQuery = MagicMock()
+        mockQuery.filter_by.return_value = mockQuery
+        mockQuery.order_by.return_value = mockQuery
+        mockQuery.offset.return_value = mockQuery
+        mockQuery.limit.return_value = mockQuery
+        mockQuery.yield_per.return_value = [mockEntity]
+
+        mock_db_session.query.return_value = mockQuery
+
+        # Act
+        result = list(repository.ListAll(filterFunction={"isActive": True}))
+
+        # Assert
+        assert len(result) == 1
+        mockQuery.filter_by.assert_called_once_with(isActive=True)
+        assert mockQuery.method_calls.index(call.filter_by(isActive=True)) < mockQuery.method_calls.index(
+            call.offset(0)
+        )
+
     def test_ListAllWithMultipleEntities_ShouldYieldAllMembers(self, repository, mock_db_session, sample_member_dict):
         """Test that ListAll yields multiple members correctly."""
         # Arrange
@@ -299,6 +328,39 @@ class TestSqlMemberRepository:
         assert result is None
         mock_db_session.get.assert_called_once_with(MemberEntity, str(memberId))
 
+    def test_FindByIdsWithMixedIds_ShouldReturnOnlyStoredMembersKeyedById(
+        self, repository, mock_db_session, sample_member_dict
+    ):
+        """Test that FindByIds loads members in one query and omits IDs with no stored member."""
+        # Arrange
+        storedId = MemberId(id="550e8400-e29b-41d4-a716-446655440001")
+        missingId = MemberId(id="550e8400-e29b-41d4-a716-446655440999")
+
+        mockEntity = MagicMock(spec=MemberEntity)
+        mockEntity.ToDict.return_value = sample_member_dict
+
+        mockQuery = MagicMock()
+        mockQuery.filter.return_value = [mockEntity]
+        mock_db_session.query.return_value = mockQuery
+
+        # Act
+        result = repository.FindByIds([storedId, missingId])
+
+        # Assert
+        assert list(result.keys()) == [storedId]
+        assert result[storedId].email == "test@example.com"
+        mock_db_session.query.assert_called_once_with(MemberEntity)
+        mockQuery.filter.assert_called_once()
+
+    def test_FindByIdsWithEmptyList_ShouldReturnEmptyDictWithoutQuerying(self, repository, mock_db_session):
+        """Test that FindByIds skips the database when no IDs are given."""
+        # Act
+        result = repository.FindByIds([])
+
+        # Assert
+        assert result == {}
+        mock_db_session.query.assert_not_called()
+
     def test_MemberExistsWithExistingMember_ShouldReturnTrue(self, repository, mock_db_session):
         """Test that MemberExists returns True when member exists."""
         # Arrange
@@ -387,3 +449,44 @@ class TestSqlMemberRepository:
         assert isinstance(mergedEntity, MemberEntity)
         assert mergedEntity.email == "updated@example.com"
         mock_db_session.commit.assert_called_once()
+
+    def test_SaveIfAbsentWithNewMember_ShouldInsertOnConflictDoNothingAndReturnTrue(self, repository, mock_db_session):
+        """Test that SaveIfAbsent issues one INSERT ... ON CONFLICT DO NOTHING and reports the inserted row."""
+        # Arrange
+        member = Member(
+            id=MemberId(id="550e8400-e29b-41d4-a716-446655440001"),
+            email="new@example.com",
+            profile=Profile(username="newuser"),
+            identity=Identity(firstName="New", lastName="Member"),
+        )
+        mock_db_session.execute.return_value.rowcount = 1
+
+        # Act
+        result = repository.SaveIfAbsent(member)
+
+        # Assert
+        assert result is True
+        statement = mock_db_session.execute.call_args[0][0]
+        compiled = str(statement.compile(dialect=postgresql.dialect()))
+        assert compiled.startswith("INSERT INTO t_member")
+        assert "ON CONFLICT (id) DO NOTHING" in compiled
+        mock_db_session.merge.assert_not_called()
+        mock_db_session.commit.assert_not_called()
+
+    def test_SaveIfAbsentWithExistingMember_ShouldReturnFalse(self, repository, mock_db_session):
+        """Test that SaveIfAbsent returns False when the conflicting ID leaves no row inserted."""
+        # Arrange
+        member = Member(
+            id=MemberId(id="550e8400-e29b-41d4-a716-446655440001"),
+            email="existing@example.com",
+            profile=Profile(username="existinguser"),
+            identity=Identity(firstName="Existing", lastName="Member"),
+        )
+        mock_db_session.execute.return_value.rowcount = 0
+
+        # Act
+        result = repository.SaveIfAbsent(member)
+
+        # Assert
+        assert result is False
+        mock_db_session.execute.assert_called_once()
@@ -1,6 +1,8 @@
 import pytest
 from unittest.mock import MagicMock
+from sqlalchemy import create_engine
 from sqlalchemy.orm import Session as DatabaseSession
+from sqlalchemy.orm import sessionmaker
 
 from MiravejaCore.Shared.DatabaseManager.Infrastructure.Factories import SqlDatabaseManagerFactory
 from MiravejaCore.Shared.DatabaseManager.Infrastructure.Sql.Models import SqlDatabaseManager
@@ -73,3 +75,20 @@ class TestSqlDatabaseManagerFactory:
         assert result._resourceFactory == customResourceFactory
         # Verify the factory can be called and returns the custom session
         assert result._resourceFactory() == customSession
+
+    def test_CreateWithPooledSessionFactory_ShouldBackEveryManagerWithTheSameEngine(self):
+        """Test that managers created from one sessionmaker-backed factory share a single engine and its pool."""
+        # Arrange
+        engine = create_engine("sqlite://")
+        factory = SqlDatabaseManagerFactory(resourceFactory=sessionmaker(bind=engine))
+
+        # Act
+        with factory.Create() as firstManager, factory.Create() as secondManager:
+            firstBind = firstManager._session.get_bind()
+            secondBind = secondManager._session.get_bind()
+
+        # Assert
+        assert firstBind is engine
+        assert secondBind is engine
+        assert firstBind.pool is secondBind.pool
+        engine.dispose()
@@ -1,239 +1,283 @@
+import asyncio
+import copy
+from dataclasses import dataclass, field
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
-from typing import List, Optional
+from typing import Optional
 
-from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
+from MiravejaCore.Shared.Events.Application.EventDispatcher import BatchingEventDispatcher, EventDispatcher
 from MiravejaCore.Shared.Events.Domain.Interfaces import DomainEvent, IEventProducer
 from MiravejaCore.Shared.Logging.Interfaces import ILogger
 from MiravejaCore.Shared.Identifiers.Models import EventId
 
+# No assertion inspects event IDs, so one generated ID is reused by every stub event.
+_CACHED_EVENT_ID = EventId.Generate()
+
+
+@dataclass
+class _FakeEvent:
+    """Plain stand-in for DomainEvent; the dispatcher only passes events through and formats them."""
+
+    type: str
+    id: EventId = field(default_factory=lambda: _CACHED_EVENT_ID)
+    aggregateId: str = "test-aggregate-id"
+    aggregateType: str = "TestAggregate"
+    version: int = 1
+
+    def __str__(self) -> str:
+        return f"MockEvent({self.type})"
+
+
+@pytest.fixture(scope="session")
+def producer_proto() -> MagicMock:
+    """IEventProducer prototype mock, built once per session."""
+    return MagicMock(spec=IEventProducer, ProduceAll=AsyncMock(), Produce=AsyncMock())
+
+
+@pytest.fixture(scope="session")
+def logger_proto() -> MagicMock:
+    """ILogger prototype mock, built once per session."""
+    return MagicMock(spec=ILogger)
+
+
+@pytest.fixture(scope="session")
+def domain_event() -> DomainEvent:
+    """Read-only domain event shared by every test; the dispatcher never mutates events."""
+    return _FakeEvent(type="test.event")  # type: ignore[return-value]
+
+
+@pytest.fixture
+def mock_producer(producer_proto) -> MagicMock:
+    """Fresh IEventProducer mock for a single test."""
+    return copy.deepcopy(producer_proto)
+
+
+@pytest.fixture
+def mock_logger(logger_proto) -> MagicMock:
+    """Fresh ILogger mock for a single test."""
+    return copy.deepcopy(logger_proto)
+
+
+@pytest.fixture
+def dispatcher(mock_producer, mock_logger) -> EventDispatcher:
+    """EventDispatcher wired to the producer and logger mocks."""
+    return EventDispatcher(mock_producer, mock_logger)
+
+
+def test_InitializeEventDispatcher_ShouldSetProducerAndLogger(mock_producer, mock_logger):
+    """Test that EventDispatcher initializes with producer and logger."""
+    # Act
+    dispatcher = EventDispatcher(mock_producer, mock_logger)
+
+    # Assert (using private attributes to verify initialization)
+    assert dispatcher._eventProducer == mock_producer
+    assert dispatcher._logger == mock_logger
+
+
+async def test_DispatchAllWithValidEvents_ShouldCallProducerAndLogInfo(
+    dispatcher, domain_event, mock_producer, mock_logger
+):
+    """Test that DispatchAll dispatches events and logs appropriately."""
+    # Act
+    await dispatcher.DispatchAll([domain_event] * 2)
+
+    # Assert
+    mock_producer.ProduceAll.assert_called_once()
+    assert len(mock_producer.ProduceAll.call_args.args[0]) == 2
+    mock_logger.Info.assert_any_call("Dispatching 2 events.")
+    mock_logger.Info.assert_any_call("All events dispatched successfully.")
+
+
+async def test_DispatchAllWithEmptyList_ShouldLogInfoAndNotCallProducer(dispatcher, mock_producer, mock_logger):
+    """Test that DispatchAll with empty list logs info and doesn't call producer."""
+    # Act
+    await dispatcher.DispatchAll([])
+
+    # Assert
+    mock_producer.ProduceAll.assert_not_called()
+    mock_logger.Info.assert_called_once_with("No events to dispatch.")
+
+
+async def test_DispatchAllWithProducerException_ShouldLogErrorAndReraise(
+    dispatcher, domain_event, mock_producer, mock_logger
+):
+    """Test that DispatchAll handles producer exceptions correctly."""
+    # Arrange
+    testError = Exception("Producer connection failed")
+    mock_producer.ProduceAll.side_effect = testError
+
+    # Act & Assert
+    with pytest.raises(Exception) as exc_info:
+        await dispatcher.DispatchAll([domain_event])
+
+    assert exc_info.value == testError
+    mock_producer.ProduceAll.assert_called_once()
+    assert len(mock_producer.ProduceAll.call_args.args[0]) == 1
+    mock_logger.Info.assert_any_call("Dispatching 1 events.")
+    mock_logger.Error.assert_called_once_with(f"Failed to dispatch events: {testError}")
+
+
+async def test_DispatchAllInBackgroundWithValidEvents_ShouldProduceAndReleaseTask(
+    dispatcher, domain_event, mock_producer
+):
+    """Test that DispatchAllInBackground produces the events in a tracked task that is released when done."""
+    # Act
+    task = dispatcher.DispatchAllInBackground([domain_event])
+
+    # Assert
+    assert task in EventDispatcher._backgroundDispatches
+    await task
+    mock_producer.ProduceAll.assert_called_once()
+    assert task not in EventDispatcher._backgroundDispatches
+
+
+async def test_DispatchAllInBackgroundWithProducerException_ShouldLogErrorWithoutRaising(
+    dispatcher, domain_event, mock_producer, mock_logger
+):
+    """Test that a failed background dispatch is logged and does not propagate to the caller."""
+    # Arrange
+    testError = Exception("Producer connection failed")
+    mock_producer.ProduceAll.side_effect = testError
 
-class TestEventDispatcher:
-    """Test cases for EventDispatcher service."""
-
-    def CreateMockEventProducer(self) -> MagicMock:
-        """Create a mock event producer for testing."""
-        mockProducer = MagicMock(spec=IEventProducer)
-        mockProducer.ProduceAll = AsyncMock()
-        mockProducer.Produce = AsyncMock()
-        return mockProducer
-
-    def CreateMockLogger(self) -> MagicMock:
-        """Create a mock logger for testing."""
-        mockLogger = MagicMock(spec=ILogger)
-        return mockLogger
-
-    def CreateTestDomainEvent(self, eventType: str = "test.event") -> DomainEvent:
-        """Create a test domain event for testing purposes."""
-        mockEvent = MagicMock(spec=DomainEvent)
-        mockEvent.id = EventId.Generate()
-        mockEvent.type = eventType
-        mockEvent.aggregateId = "test-aggregate-id"
-        mockEvent.aggregateType = "TestAggregate"
-        mockEvent.version = 1
-        # Configure the mock to return a string representation
-        mockEvent.configure_mock(**{"__str__.return_value": f"MockEvent({eventType})"})
-        return mockEvent
-
-    def test_InitializeEventDispatcher_ShouldSetProducerAndLogger(self):
-        """Test that EventDispatcher initializes with producer and logger."""
-        # Arrange
-        mockProducer = self.CreateMockEventProducer()
-        mockLogger = self.CreateMockLogger()
-
-        # Act
-        dispatcher = EventDispatcher(mockProducer, mockLogger)
-
-        # Assert (using private attributes to verify initialization)
-        assert dispatcher._eventProducer == mockProducer
-        assert dispatcher._logger == mockLogger
-
-    @pytest.mark.asyncio
-    async def test_DispatchAllWithValidEvents_ShouldCallProducerAndLogInfo(self):
-        """Test that DispatchAll dispatches events and logs appropriately."""
-        # Arrange
-        mockProducer = self.CreateMockEventProducer()
-        mockLogger = self.CreateMockLogger()
-        dispatcher = EventDispatcher(mockProducer, mockLogger)
-
-        testEvents = [self.CreateTestDomainEvent("first.event"), self.CreateTestDomainEvent("second.event")]
-
-        # Act
-        await dispatcher.DispatchAll(testEvents)
-
-        # Assert
-        mockProducer.ProduceAll.assert_called_once_with(testEvents)
-        mockLogger.Info.assert_any_call("Dispatching 2 events.")
-        mockLogger.Info.assert_any_call("All events dispatched successfully.")
-
-    @pytest.mark.asyncio
-    async def test_DispatchAllWithEmptyList_ShouldLogInfoAndNotCallProducer(self):
-        """Test that DispatchAll with empty list logs info and doesn't call producer."""
-        # Arrange
-        mockProducer = self.CreateMockEventProducer()
-        mockLogger = self.CreateMockLogger()
-        dispatcher = EventDispatcher(mockProducer, mockLogger)
-
-        # Act
-        await dispatcher.DispatchAll([])
-
-        # Assert
-        mockProducer.ProduceAll.assert_not_called()
-        mockLogger.Info.assert_called_once_with("No events to dispatch.")
-
-    @pytest.mark.asyncio
-    async def test_DispatchAllWithFalsyList_ShouldLogInfoAndNotCallProducer(self):
-        """Test that DispatchAll with falsy list logs info and doesn't call producer."""
-        # Arrange
-        mockProducer = self.CreateMockEventProducer()
-        mockLogger = self.CreateMockLogger()
-        dispatcher = EventDispatcher(mockProducer, mockLogger)
-
-        # Act - Test with empty list (which is falsy)
-        await dispatcher.DispatchAll([])
-
-        # Assert
-        mockProducer.ProduceAll.assert_not_called()
-        mockLogger.Info.assert_called_once_with("No events to dispatch.")
-
-    @pytest.mark.asyncio
-    async def test_DispatchAllWithProducerException_ShouldLogErrorAndReraise(self):
-        """Test that DispatchAll handles producer exceptions correctly."""
-        # Arrange
-        mockProducer = self.CreateMockEventProducer()
-        mockLogger = self.CreateMockLogger()
-        dispatcher = EventDispatcher(mockProducer, mockLogger)
-
-        testError = Exception("Producer connection failed")
-        mockProducer.ProduceAll.side_effect = testError
-
-        testEvents = [self.CreateTestDomainEvent("error.event")]
-
-        # Act & Assert
-        with pytest.raises(Exception) as exc_info:
-            await dispatcher.DispatchAll(testEvents)
-
-        assert exc_info.value == testError
-        mockProducer.ProduceAll.assert_called_once_with(testEvents)
-        mockLogger.Info.assert_any_call("Dispatching 1 events.")
-        mockLogger.Error.assert_called_once_with(f"Failed to dispatch events: {testError}")
-
-    @pytest.mark.asyncio
-    async def test_DispatchWithValidEvent_ShouldCallProducerAndLogInfo(self):
-        """Test that Dispatch dispatches single event and logs appropriately."""
-        # Arrange
-        mockProducer = self.CreateMockEventProducer()
-        mockLogger = self.CreateMockLogger()
-        dispatcher = EventDispatcher(mockProducer, mockLogger)
-
-        testEvent = self.CreateTestDomainEvent("single.event")
-
-        # Act
-        await dispatcher.Dispatch(testEvent)
-
-        # Assert
-        mockProducer.Produce.assert_called_once_with(testEvent)
-        mockLogger.Info.assert_any_call(f"Dispatching event: {testEvent}")
-        mockLogger.Info.assert_any_call("Event dispatched successfully.")
-
-    @pytest.mark.asyncio
-    async def test_DispatchWithNoneEvent_ShouldLogWarningAndNotCallProducer(self):
-        """Test that Dispatch with None event logs warning and doesn't call producer."""
-        # Arrange
-        mockProducer = self.CreateMockEventProducer()
-        mockLogger = self.CreateMockLogger()
-        dispatcher = EventDispatcher(mockProducer, mockLogger)
-
-        # Act - Cast None to Optional[DomainEvent] to bypass type checking for test
-        noneEvent: Optional[DomainEvent] = None
-        await dispatcher.Dispatch(noneEvent)  # type: ignore
-
-        # Assert
-        mockProducer.Produce.assert_not_called()
-        mockLogger.Warning.assert_called_once_with("No event to dispatch.")
-
-    @pytest.mark.asyncio
-    async def test_DispatchWithProducerException_ShouldLogErrorAndReraise(self):
-        """Test that Dispatch handles producer exceptions correctly."""
-        # Arrange
-        mockProducer = self.CreateMockEventProducer()
-        mockLogger = self.CreateMockLogger()
-        dispatcher = EventDispatcher(mockProducer, mockLogger)
-
-        testError = RuntimeError("Kafka connection timeout")
-        mockProducer.Produce.side_effect = testError
-
-        testEvent = self.CreateTestDomainEvent("timeout.event")
-
-        # Act & Assert
-        with pytest.raises(RuntimeError) as exc_info:
-            await dispatcher.Dispatch(testEvent)
-
-        assert exc_info.value == testError
-        mockProducer.Produce.assert_called_once_with(testEvent)
-        mockLogger.Info.assert_any_call(f"Dispatching event: {testEvent}")
-        mockLogger.Error.assert_called_once_with(f"Failed to dispatch event: {testError}")
-
-    @pytest.mark.asyncio
-    async def test_DispatchAllWithSingleEvent_ShouldLogCorrectEventCount(self):
-        """Test that DispatchAll with single event logs correct count."""
-        # Arrange
-        mockProducer = self.CreateMockEventProducer()
-        mockLogger = self.CreateMockLogger()
-        dispatcher = EventDispatcher(mockProducer, mockLogger)
-
-        testEvents = [self.CreateTestDomainEvent("single.in.list")]
-
-        # Act
-        await dispatcher.DispatchAll(testEvents)
-
-        # Assert
-        mockProducer.ProduceAll.assert_called_once_with(testEvents)
-        mockLogger.Info.assert_any_call("Dispatching 1 events.")
-        mockLogger.Info.assert_any_call("All events dispatched successfully.")
-
-    @pytest.mark.asyncio
-    async def test_DispatchAllWithMultipleEvents_ShouldLogCorrectEventCount(self):
-        """Test that DispatchAll with multiple events logs correct count."""
-        # Arrange
-        mockProducer = self.CreateMockEventProducer()
-        mockLogger = self.CreateMockLogger()
-        dispatcher = EventDispatcher(mockProducer, mockLogger)
-
-        testEvents = [
-            self.CreateTestDomainEvent("event.one"),
-            self.CreateTestDomainEvent("event.two"),
-            self.CreateTestDomainEvent("event.three"),
-            self.CreateTestDomainEvent("event.four"),
-            self.CreateTestDomainEvent("event.five"),
-        ]
-
-        # Act
-        await dispatcher.DispatchAll(testEvents)
-
-        # Assert
-        mockProducer.ProduceAll.assert_called_once_with(testEvents)
-        mockLogger.Info.assert_any_call("Dispatching 5 events.")
-        mockLogger.Info.assert_any_call("All events dispatched successfully.")
-
-    @pytest.mark.asyncio
-    async def test_DispatchAllThenDispatch_ShouldCallBothMethods(self):
-        """Test that DispatchAll and Dispatch can be called sequentially."""
-        # Arrange
-        mockProducer = self.CreateMockEventProducer()
-        mockLogger = self.CreateMockLogger()
-        dispatcher = EventDispatcher(mockProducer, mockLogger)
-
-        batchEvents = [self.CreateTestDomainEvent("batch.event")]
-        singleEvent = self.CreateTestDomainEvent("single.event")
-
-        # Act
-        await dispatcher.DispatchAll(batchEvents)
-        await dispatcher.Dispatch(singleEvent)
-
-        # Assert
-        mockProducer.ProduceAll.assert_called_once_with(batchEvents)
-        mockProducer.Produce.assert_called_once_with(singleEvent)
-
-        # Verify info logs for both operations
-        assert mockLogger.Info.call_count >= 4  # At least 2 calls for each operation
+    # Act
+    task = dispatcher.DispatchAllInBackground([domain_event])
+    await asyncio.wait([task])
+
+    # Assert
+    assert task.exception() is testError
+    mock_logger.Error.assert_called_once_with(f"Failed to dispatch events: {testError}")
+    assert task not in EventDispatcher._backgroundDispatches
+
+
+async def test_WaitForBackgroundDispatchesWithPendingDispatch_ShouldWaitUntilProduced(
+    dispatcher, domain_event, mock_producer
+):
+    """Test that WaitForBackgroundDispatches returns only after in-flight dispatches have finished."""
+    # Arrange
+    mock_producer.ProduceAll.side_effect = Exception("Producer connection failed")
+    task = dispatcher.DispatchAllInBackground([domain_event])
+
+    # Act
+    await EventDispatcher.WaitForBackgroundDispatches()
+
+    # Assert
+    assert task.done()
+    mock_producer.ProduceAll.assert_called_once()
+
+
+async def test_DispatchWithValidEvent_ShouldCallProducerAndLogInfo(
+    dispatcher, domain_event, mock_producer, mock_logger
+):
+    """Test that Dispatch dispatches single event and logs appropriately."""
+    # Act
+    await dispatcher.Dispatch(domain_event)
+
+    # Assert
+    mock_producer.Produce.assert_called_once_with(domain_event)
+    mock_logger.Info.assert_any_call(f"Dispatching event: {domain_event}")
+    mock_logger.Info.assert_any_call("Event dispatched successfully.")
+
+
+async def test_DispatchWithNoneEvent_ShouldLogWarningAndNotCallProducer(dispatcher, mock_producer, mock_logger):
+    """Test that Dispatch with None event logs warning and doesn't call producer."""
+    # Act - Cast None to Optional[DomainEvent] to bypass type checking for test
+    noneEvent: Optional[DomainEvent] = None
+    await dispatcher.Dispatch(noneEvent)  # type: ignore
+
+    # Assert
+    mock_producer.Produce.assert_not_called()
+    mock_logger.Warning.assert_called_once_with("No event to dispatch.")
+
+
+async def test_DispatchWithProducerException_ShouldLogErrorAndReraise(
+    dispatcher, domain_event, mock_producer, mock_logger
+):
+    """Test that Dispatch handles producer exceptions correctly."""
+    # Arrange
+    testError = RuntimeError("Kafka connection timeout")
+    mock_producer.Produce.side_effect = testError
+
+    # Act & Assert
+    with pytest.raises(RuntimeError) as exc_info:
+        await dispatcher.Dispatch(domain_event)
+
+    assert exc_info.value == testError
+    mock_producer.Produce.assert_called_once_with(domain_event)
+    mock_logger.Info.assert_any_call(f"Dispatching event: {domain_event}")
+    mock_logger.Error.assert_called_once_with(f"Failed to dispatch event: {testError}")
+
+
+async def test_DispatchAllWithSingleEvent_ShouldLogCorrectEventCount(
+    dispatcher, domain_event, mock_producer, mock_logger
+):
+    """Test that DispatchAll with single event logs correct count."""
+    # Act
+    await dispatcher.DispatchAll([domain_event])
+
+    # Assert
+    mock_producer.ProduceAll.assert_called_once()
+    assert len(mock_producer.ProduceAll.call_args.args[0]) == 1
+    mock_logger.Info.assert_any_call("Dispatching 1 events.")
+    mock_logger.Info.assert_any_call("All events dispatched successfully.")
+
+
+async def test_DispatchAllWithMultipleEvents_ShouldLogCorrectEventCount(
+    dispatcher, domain_event, mock_producer, mock_logger
+):
+    """Test that DispatchAll with multiple events logs correct count."""
+    # Act
+    await dispatcher.DispatchAll([domain_event] * 5)
+
+    # Assert
+    mock_producer.ProduceAll.assert_called_once()
+    assert len(mock_producer.ProduceAll.call_args.args[0]) == 5
+    mock_logger.Info.assert_any_call("Dispatching 5 events.")
+    mock_logger.Info.assert_any_call("All events dispatched successfully.")
+
+
+async def test_DispatchAllThenDispatch_ShouldCallBothMethods(dispatcher, domain_event, mock_producer, mock_logger):
+    """Test that DispatchAll and Dispatch can be called sequentially."""
+    # Act
+    await dispatcher.DispatchAll([domain_event])
+    await dispatcher.Dispatch(domain_event)
+
+    # Assert
+    mock_producer.ProduceAll.assert_called_once()
+    assert len(mock_producer.ProduceAll.call_args.args[0]) == 1
+    mock_producer.Produce.assert_called_once_with(domain_event)
+
+    # Verify info logs for both operations
+    assert mock_logger.Info.call_count >= 4  # At least 2 calls for each operation
+
+
+async def test_BatchingDispatchAllInBackgroundWithinSameTick_ShouldProduceMergedBatchOnce(
+    domain_event, mock_producer, mock_logger
+):
+    """Test that background dispatches released in the same loop tick reach the producer as one batch."""
+    # Arrange
+    batchingDispatcher = BatchingEventDispatcher(mock_producer, mock_logger)
+
+    # Act
+    firstTask = batchingDispatcher.DispatchAllInBackground([domain_event])
+    secondTask = batchingDispatcher.DispatchAllInBackground([domain_event] * 2)
+    await firstTask
+
+    # Assert
+    assert firstTask is secondTask
+    mock_producer.ProduceAll.assert_called_once()
+    assert len(mock_producer.ProduceAll.call_args.args[0]) == 3
+
+
+async def test_BatchingDispatchAllInBackgroundAfterFlush_ShouldStartNewBatch(domain_event, mock_producer, mock_logger):
+    """Test that events released after a batch has been flushed go out in a separate batch."""
+    # Arrange
+    batchingDispatcher = BatchingEventDispatcher(mock_producer, mock_logger)
+    await batchingDispatcher.DispatchAllInBackground([domain_event])
+
+    # Act
+    await batchingDispatcher.DispatchAllInBackground([domain_event])
+
+    # Assert
+    assert mock_producer.ProduceAll.call_count == 2
+    assert all(len(call.args[0]) == 1 for call in mock_producer.ProduceAll.call_args_list)
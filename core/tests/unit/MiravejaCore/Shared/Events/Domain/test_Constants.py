@@ -1,3 +1,5 @@
+from itertools import pairwise
+
 import pytest
 
 from MiravejaCore.Shared.Utils.Constants.Time import (
@@ -17,167 +19,118 @@ from MiravejaCore.Shared.Utils.Constants.Binary import (
     SIZE_1_GB,
 )
 
+SIZE_CONSTANTS = [
+    (SIZE_16_MB, 16, 16777216),
+    (SIZE_32_MB, 32, 33554432),
+    (SIZE_64_MB, 64, 67108864),
+    (SIZE_128_MB, 128, 134217728),
+    (SIZE_256_MB, 256, 268435456),
+    (SIZE_512_MB, 512, 536870912),
+    (SIZE_1_GB, 1024, 1073741824),
+]
+SIZE_IDS = ["16MB", "32MB", "64MB", "128MB", "256MB", "512MB", "1GB"]
+
+TIME_CONSTANTS = [
+    (MILLIS_1_SEC, 1),
+    (MILLIS_3_SEC, 3),
+    (MILLIS_5_SEC, 5),
+    (MILLIS_10_SEC, 10),
+    (MILLIS_30_SEC, 30),
+]
+TIME_IDS = ["1Sec", "3Sec", "5Sec", "10Sec", "30Sec"]
+
 
 class TestSizeConstants:
     """Test cases for size-related constants."""
 
-    def test_Size16MB_ShouldHaveCorrectValue(self):
-        """Test that SIZE_16_MB has correct value in bytes."""
-        # Act & Assert
-        assert SIZE_16_MB == 16 * 1024 * 1024
-        assert SIZE_16_MB == 16777216
-
-    def test_Size32MB_ShouldHaveCorrectValue(self):
-        """Test that SIZE_32_MB has correct value in bytes."""
-        # Act & Assert
-        assert SIZE_32_MB == 32 * 1024 * 1024
-        assert SIZE_32_MB == 33554432
-
-    def test_Size64MB_ShouldHaveCorrectValue(self):
-        """Test that SIZE_64_MB has correct value in bytes."""
+    @pytest.mark.parametrize("constant,megabytes,expected", SIZE_CONSTANTS, ids=SIZE_IDS)
+    def test_SizeConstant_ShouldHaveCorrectValue(self, constant, megabytes, expected):
+        """Test that each size constant has the correct integer value in bytes."""
         # Act & Assert
-        assert SIZE_64_MB == 64 * 1024 * 1024
-        assert SIZE_64_MB == 67108864
+        assert isinstance(constant, int)
+        assert constant == megabytes * 1024 * 1024
+        assert constant == expected
 
-    def test_Size128MB_ShouldHaveCorrectValue(self):
-        """Test that SIZE_128_MB has correct value in bytes."""
+    @pytest.mark.parametrize(
+        "smaller,larger",
+        list(pairwise(constant for constant, _, _ in SIZE_CONSTANTS)),
+        ids=[f"{a}-{b}" for a, b in pairwise(SIZE_IDS)],
+    )
+    def test_ConsecutiveSizeConstants_ShouldDouble(self, smaller, larger):
+        """Test that each size constant is double the previous one, and therefore in ascending order."""
         # Act & Assert
-        assert SIZE_128_MB == 128 * 1024 * 1024
-        assert SIZE_128_MB == 134217728
-
-    def test_Size256MB_ShouldHaveCorrectValue(self):
-        """Test that SIZE_256_MB has correct value in bytes."""
-        # Act & Assert
-        assert SIZE_256_MB == 256 * 1024 * 1024
-        assert SIZE_256_MB == 268435456
-
-    def test_Size512MB_ShouldHaveCorrectValue(self):
-        """Test that SIZE_512_MB has correct value in bytes."""
-        # Act & Assert
-        assert SIZE_512_MB == 512 * 1024 * 1024
-        assert SIZE_512_MB == 536870912
-
-    def test_Size1GB_ShouldHaveCorrectValue(self):
-        """Test that SIZE_1_GB has correct value in bytes."""
-        # Act & Assert
-        assert SIZE_1_GB == 1024 * 1024 * 1024
-        assert SIZE_1_GB == 1073741824
-
-    def test_SizeConstants_ShouldBeIntegerType(self):
-        """Test that all size constants are integers."""
-        # Act & Assert
-        assert isinstance(SIZE_16_MB, int)
-        assert isinstance(SIZE_32_MB, int)
-        assert isinstance(SIZE_64_MB, int)
-        assert isinstance(SIZE_128_MB, int)
-        assert isinstance(SIZE_256_MB, int)
-        assert isinstance(SIZE_512_MB, int)
-        assert isinstance(SIZE_1_GB, int)
-
-    def test_SizeConstants_ShouldBeInAscendingOrder(self):
-        """Test that size constants are in ascending order."""
-        # Act & Assert
-        assert SIZE_16_MB < SIZE_32_MB
-        assert SIZE_32_MB < SIZE_64_MB
-        assert SIZE_64_MB < SIZE_128_MB
-        assert SIZE_128_MB < SIZE_256_MB
-        assert SIZE_256_MB < SIZE_512_MB
-        assert SIZE_512_MB < SIZE_1_GB
-
-    def test_SizeDoublingPattern_ShouldBeCorrect(self):
-        """Test that each size constant is double the previous one."""
-        # Act & Assert
-        assert SIZE_32_MB == SIZE_16_MB * 2
-        assert SIZE_64_MB == SIZE_32_MB * 2
-        assert SIZE_128_MB == SIZE_64_MB * 2
-        assert SIZE_256_MB == SIZE_128_MB * 2
-        assert SIZE_512_MB == SIZE_256_MB * 2
-        assert SIZE_1_GB == SIZE_512_MB * 2
+        assert smaller < larger
+        assert larger == smaller * 2
 
 
 class TestTimeConstants:
     """Test cases for time-related constants."""
 
-    def test_Millis1Sec_ShouldHaveCorrectValue(self):
-        """Test that MILLIS_1_SEC has correct value in milliseconds."""
-        # Act & Assert
-        assert MILLIS_1_SEC == 1000
-
-    def test_Millis3Sec_ShouldHaveCorrectValue(self):
-        """Test that MILLIS_3_SEC has correct value in milliseconds."""
-        # Act & Assert
-        assert MILLIS_3_SEC == 3000
-
-    def test_Millis5Sec_ShouldHaveCorrectValue(self):
-        """Test that MILLIS_5_SEC has correct value in milliseconds."""
-        # Act & Assert
-        assert MILLIS_5_SEC == 5000
-
-    def test_Millis10Sec_ShouldHaveCorrectValue(self):
-        """Test that MILLIS_10_SEC has correct value in milliseconds."""
-        # Act & Assert
-        assert MILLIS_10_SEC == 10000
-
-    def test_Millis30Sec_ShouldHaveCorrectValue(self):
-        """Test that MILLIS_30_SEC has correct value in milliseconds."""
-        # Act & Assert
-        assert MILLIS_30_SEC == 30000
-
-    def test_TimeConstants_ShouldBeIntegerType(self):
-        """Test that all time constants are integers."""
-        # Act & Assert
-        assert isinstance(MILLIS_1_SEC, int)
-        assert isinstance(MILLIS_3_SEC, int)
-        assert isinstance(MILLIS_5_SEC, int)
-        assert isinstance(MILLIS_10_SEC, int)
-        assert isinstance(MILLIS_30_SEC, int)
-
-    def test_TimeConstants_ShouldBeInAscendingOrder(self):
+    @pytest.mark.parametrize("constant,seconds", TIME_CONSTANTS, ids=TIME_IDS)
+    def test_TimeConstant_ShouldHaveCorrectValue(self, constant, seconds):
+        """Test that each time constant is an integer number of milliseconds matching its name."""
+        # Act & Assert
+        assert isinstance(constant, int)
+        assert constant == seconds * 1000
+        assert constant == MILLIS_1_SEC * seconds
+        assert constant / 1000 == float(seconds)
+
+    @pytest.mark.parametrize(
+        "shorter,longer",
+        list(pairwise(constant for constant, _ in TIME_CONSTANTS)),
+        ids=[f"{a}-{b}" for a, b in pairwise(TIME_IDS)],
+    )
+    def test_ConsecutiveTimeConstants_ShouldBeInAscendingOrder(self, shorter, longer):
         """Test that time constants are in ascending order."""
         # Act & Assert
-        assert MILLIS_1_SEC < MILLIS_3_SEC
-        assert MILLIS_3_SEC < MILLIS_5_SEC
-        assert MILLIS_5_SEC < MILLIS_10_SEC
-        assert MILLIS_10_SEC < MILLIS_30_SEC
-
-    def test_TimeConstants_ShouldConvertToSecondsCorrectly(self):
-        """Test that time constants convert to seconds correctly."""
-        # Act & Assert
-        assert MILLIS_1_SEC / 1000 == 1.0
-        assert MILLIS_3_SEC / 1000 == 3.0
-        assert MILLIS_5_SEC / 1000 == 5.0
-        assert MILLIS_10_SEC / 1000 == 10.0
-        assert MILLIS_30_SEC / 1000 == 30.0
-
-    def test_TimeConstants_ShouldHaveCorrectMultiples(self):
-        """Test that time constants have correct relationships."""
-        # Act & Assert
-        assert MILLIS_3_SEC == MILLIS_1_SEC * 3
-        assert MILLIS_5_SEC == MILLIS_1_SEC * 5
-        assert MILLIS_10_SEC == MILLIS_1_SEC * 10
-        assert MILLIS_30_SEC == MILLIS_1_SEC * 30
+        assert shorter < longer
+
+
+CONSTANT_INVARIANTS = [
+    (SIZE_32_MB // SIZE_16_MB, 2),
+    (SIZE_1_GB // SIZE_512_MB, 2),
+    (SIZE_1_GB // SIZE_16_MB, 64),
+    (SIZE_16_MB + SIZE_16_MB, SIZE_32_MB),
+    (SIZE_64_MB - SIZE_32_MB, SIZE_32_MB),
+    (MILLIS_1_SEC * 5, MILLIS_5_SEC),
+    (MILLIS_30_SEC // 3, MILLIS_10_SEC),
+    (SIZE_16_MB & (SIZE_16_MB - 1), 0),  # Power of 2
+    (SIZE_1_GB & (1024 * 1024 - 1), 0),  # Divisible by MB
+    (str(SIZE_16_MB), "16777216"),
+    (str(MILLIS_1_SEC), "1000"),
+]
+CONSTANT_INVARIANT_IDS = [
+    "32MB/16MB",
+    "1GB/512MB",
+    "1GB/16MB",
+    "16MB+16MB",
+    "64MB-32MB",
+    "1Sec*5",
+    "30Sec/3",
+    "16MBPowerOf2",
+    "1GBDivisibleByMB",
+    "Str16MB",
+    "Str1Sec",
+]
 
 
 class TestConstantUsagePatterns:
     """Test cases for common constant usage patterns."""
 
-    def test_SizeConstantsInDivision_ShouldWorkCorrectly(self):
-        """Test that size constants work correctly in division operations."""
+    @pytest.mark.parametrize("actual,expected", CONSTANT_INVARIANTS, ids=CONSTANT_INVARIANT_IDS)
+    def test_ConstantExpression_ShouldProduceExpectedResult(self, actual, expected):
+        """Test that arithmetic, bitwise and string expressions over the constants produce the expected results."""
         # Act & Assert
-        assert SIZE_32_MB // SIZE_16_MB == 2
-        assert SIZE_1_GB // SIZE_512_MB == 2
-        assert SIZE_1_GB // SIZE_16_MB == 64
+        assert actual == expected
 
-    def test_TimeConstantsInTimeouts_ShouldBeReasonable(self):
-        """Test that time constants represent reasonable timeout values."""
+    @pytest.mark.parametrize("constant,digits", [(SIZE_1_GB, 10), (MILLIS_30_SEC, 5)], ids=["1GB", "30Sec"])
+    def test_ConstantDigitCount_ShouldBeReadableInLogs(self, constant, digits):
+        """Test that constants print as plain integers with the expected number of digits."""
         # Act & Assert
-        # Verify they're reasonable for typical timeout scenarios
-        assert MILLIS_1_SEC >= 1000  # At least 1 second
-        assert MILLIS_30_SEC <= 30000  # At most 30 seconds
-        assert MILLIS_10_SEC > MILLIS_5_SEC  # Logical ordering
+        assert len(f"{constant:d}") == digits
 
-    def test_ConstantsInComparisons_ShouldWorkCorrectly(self):
-        """Test that constants work correctly in comparison operations."""
+    def test_ConstantsAsConfigurationDefaults_ShouldBeAppropriate(self):
+        """Test that constants are reasonable timeout values and Kafka configuration defaults."""
         # Arrange
         testSizeValue = 25 * 1024 * 1024  # 25MB
         testTimeValue = 7500  # 7.5 seconds
@@ -185,36 +138,8 @@ class TestConstantUsagePatterns:
         # Act & Assert
         assert SIZE_16_MB < testSizeValue < SIZE_32_MB
         assert MILLIS_5_SEC < testTimeValue < MILLIS_10_SEC
-
-    def test_ConstantsAsConfigurationDefaults_ShouldBeAppropriate(self):
-        """Test that constants are appropriate for use as configuration defaults."""
-        # Act & Assert
-        # These should be reasonable defaults for Kafka configuration
+        assert MILLIS_1_SEC >= 1000  # At least 1 second
+        assert MILLIS_30_SEC <= 30000  # At most 30 seconds
         assert SIZE_16_MB > 0  # Positive batch size
         assert SIZE_32_MB > SIZE_16_MB  # Buffer should be larger than batch
-        assert MILLIS_1_SEC > 0  # Positive timeout
         assert MILLIS_10_SEC > MILLIS_1_SEC  # Request timeout should be longer than retry backoff
-
-    def test_ConstantArithmetic_ShouldProduceExpectedResults(self):
-        """Test that arithmetic operations on constants produce expected results."""
-        # Act & Assert
-        assert SIZE_16_MB + SIZE_16_MB == SIZE_32_MB
-        assert SIZE_64_MB - SIZE_32_MB == SIZE_32_MB
-        assert MILLIS_1_SEC * 5 == MILLIS_5_SEC
-        assert MILLIS_30_SEC // 3 == MILLIS_10_SEC
-
-    def test_ConstantsInBitwiseOperations_ShouldBehavePredictably(self):
-        """Test that constants behave predictably in bitwise operations."""
-        # Act & Assert
-        # All size constants should be powers of 2 times base units
-        assert SIZE_16_MB & (SIZE_16_MB - 1) == 0  # Power of 2 check for MB sizes
-        assert SIZE_1_GB & (1024 * 1024 - 1) == 0  # Divisible by MB
-
-    def test_ConstantsAsStringConversion_ShouldBeReadable(self):
-        """Test that constants convert to readable strings."""
-        # Act & Assert
-        assert str(SIZE_16_MB) == "16777216"
-        assert str(MILLIS_1_SEC) == "1000"
-        # These string representations should be meaningful in logs
-        assert len(str(SIZE_1_GB)) == 10  # 1,073,741,824 is 10 digits
-        assert len(str(MILLIS_30_SEC)) == 5  # 30,000 is 5 digits
@@ -1,25 +1,35 @@
+from collections import namedtuple
+from typing import Callable
+
 import pytest
-from unittest.mock import MagicMock
 
 from MiravejaCore.Shared.Events.Domain.Models import EventEmitter
 from MiravejaCore.Shared.Events.Domain.Interfaces import DomainEvent
 from MiravejaCore.Shared.Identifiers.Models import EventId
 
+# EventEmitter only stores and hands back events, so a plain tuple carrying the DomainEvent fields is enough.
+_FakeEvent = namedtuple("_FakeEvent", "id type aggregateId aggregateType version")
+
+
+@pytest.fixture
+def event_emitter() -> EventEmitter:
+    """Fresh EventEmitter for a single test."""
+    return EventEmitter()
+
+
+@pytest.fixture(scope="session")
+def make_event() -> Callable[[str], DomainEvent]:
+    """Builder for test domain events of a given type."""
+
+    def MakeEvent(eventType: str = "test.event") -> DomainEvent:
+        return _FakeEvent(EventId.Generate(), eventType, "test-aggregate-id", "TestAggregate", 1)  # type: ignore[return-value]
+
+    return MakeEvent
+
 
 class TestEventEmitter:
     """Test cases for EventEmitter model."""
 
-    def CreateTestDomainEvent(self, eventType: str = "test.event") -> DomainEvent:
-        """Create a test domain event for testing purposes."""
-        # Create a mock DomainEvent since it's abstract
-        mockEvent = MagicMock(spec=DomainEvent)
-        mockEvent.id = EventId.Generate()
-        mockEvent.type = eventType
-        mockEvent.aggregateId = "test-aggregate-id"
-        mockEvent.aggregateType = "TestAggregate"
-        mockEvent.version = 1
-        return mockEvent
-
     def test_InitializeEventEmitter_ShouldHaveEmptyEventsList(self):
         """Test that EventEmitter initializes with an empty events list."""
         # Arrange & Act
@@ -29,50 +39,47 @@ class TestEventEmitter:
         assert eventEmitter.events == []
         assert len(eventEmitter.GetEvents()) == 0
 
-    def test_EmitEventWithValidEvent_ShouldAddEventToList(self):
+    def test_EmitEventWithValidEvent_ShouldAddEventToList(self, event_emitter, make_event):
         """Test that EmitEvent adds a valid event to the events list."""
         # Arrange
-        eventEmitter = EventEmitter()
-        testEvent = self.CreateTestDomainEvent("test.event.created")
+        testEvent = make_event("test.event.created")
 
         # Act
-        eventEmitter.EmitEvent(testEvent)
+        event_emitter.EmitEvent(testEvent)
 
         # Assert
-        events = eventEmitter.GetEvents()
+        events = event_emitter.GetEvents()
         assert len(events) == 1
         assert events[0] == testEvent
 
-    def test_EmitMultipleEvents_ShouldAddAllEventsToList(self):
+    def test_EmitMultipleEvents_ShouldAddAllEventsToList(self, event_emitter, make_event):
         """Test that multiple EmitEvent calls add all events to the list."""
         # Arrange
-        eventEmitter = EventEmitter()
-        firstEvent = self.CreateTestDomainEvent("first.event")
-        secondEvent = self.CreateTestDomainEvent("second.event")
-        thirdEvent = self.CreateTestDomainEvent("third.event")
+        firstEvent = make_event("first.event")
+        secondEvent = make_event("second.event")
+        thirdEvent = make_event("third.event")
 
         # Act
-        eventEmitter.EmitEvent(firstEvent)
-        eventEmitter.EmitEvent(secondEvent)
-        eventEmitter.EmitEvent(thirdEvent)
+        event_emitter.EmitEvent(firstEvent)
+        event_emitter.EmitEvent(secondEvent)
+        event_emitter.EmitEvent(thirdEvent)
 
         # Assert
-        events = eventEmitter.GetEvents()
+        events = event_emitter.GetEvents()
         assert len(events) == 3
         assert events[0] == firstEvent
         assert events[1] == secondEvent
         assert events[2] == thirdEvent
 
-    def test_GetEventsAfterEmittingEvents_ShouldReturnAllEventsWithoutClearing(self):
+    def test_GetEventsAfterEmittingEvents_ShouldReturnAllEventsWithoutClearing(self, event_emitter, make_event):
         """Test that GetEvents returns all events without clearing the internal list."""
         # Arrange
-        eventEmitter = EventEmitter()
-        testEvent = self.CreateTestDomainEvent("persistent.event")
-        eventEmitter.EmitEvent(testEvent)
+        testEvent = make_event("persistent.event")
+        event_emitter.EmitEvent(testEvent)
 
         # Act
-        firstRetrieval = eventEmitter.GetEvents()
-        secondRetrieval = eventEmitter.GetEvents()
+        firstRetrieval = event_emitter.GetEvents()
+        secondRetrieval = event_emitter.GetEvents()
 
         # Assert
         assert len(firstRetrieval) == 1
@@ -80,100 +87,104 @@ class TestEventEmitter:
         assert firstRetrieval[0] == testEvent
         assert secondRetrieval[0] == testEvent
         # Verify internal list is not cleared
-        assert len(eventEmitter.events) == 1
+        assert len(event_emitter.events) == 1
 
-    def test_ReleaseEventsWithEmittedEvents_ShouldReturnEventsAndClearList(self):
+    def test_ReleaseEventsWithEmittedEvents_ShouldReturnEventsAndClearList(self, event_emitter, make_event):
         """Test that ReleaseEvents returns all events and clears the internal list."""
         # Arrange
-        eventEmitter = EventEmitter()
-        firstEvent = self.CreateTestDomainEvent("release.event.first")
-        secondEvent = self.CreateTestDomainEvent("release.event.second")
-        eventEmitter.EmitEvent(firstEvent)
-        eventEmitter.EmitEvent(secondEvent)
+        firstEvent = make_event("release.event.first")
+        secondEvent = make_event("release.event.second")
+        event_emitter.EmitEvent(firstEvent)
+        event_emitter.EmitEvent(secondEvent)
 
         # Act
-        releasedEvents = eventEmitter.ReleaseEvents()
+        releasedEvents = event_emitter.ReleaseEvents()
 
         # Assert
         assert len(releasedEvents) == 2
         assert releasedEvents[0] == firstEvent
         assert releasedEvents[1] == secondEvent
         # Verify internal list is cleared
-        assert len(eventEmitter.events) == 0
-        assert len(eventEmitter.GetEvents()) == 0
+        assert len(event_emitter.events) == 0
+        assert len(event_emitter.GetEvents()) == 0
 
-    def test_ReleaseEventsWithNoEvents_ShouldReturnEmptyListAndRemainEmpty(self):
+    def test_ReleaseEventsWithNoEvents_ShouldReturnEmptyListAndRemainEmpty(self, event_emitter):
         """Test that ReleaseEvents returns empty list when no events are emitted."""
+        # Act
+        releasedEvents = event_emitter.ReleaseEvents()
+
+        # Assert
+        assert releasedEvents == []
+        assert len(event_emitter.events) == 0
+
+    def test_EmitEventAfterReleaseEvents_ShouldNotModifyReleasedEvents(self, event_emitter, make_event):
+        """Test that events emitted after ReleaseEvents do not leak into the released list."""
         # Arrange
-        eventEmitter = EventEmitter()
+        firstEvent = make_event("released.event")
+        event_emitter.EmitEvent(firstEvent)
+        releasedEvents = event_emitter.ReleaseEvents()
 
         # Act
-        releasedEvents = eventEmitter.ReleaseEvents()
+        event_emitter.EmitEvent(make_event("later.event"))
 
         # Assert
-        assert releasedEvents == []
-        assert len(eventEmitter.events) == 0
+        assert releasedEvents == [firstEvent]
+        assert len(event_emitter.events) == 1
 
-    def test_ClearEventsWithEmittedEvents_ShouldClearListWithoutReturning(self):
+    def test_ClearEventsWithEmittedEvents_ShouldClearListWithoutReturning(self, event_emitter, make_event):
         """Test that ClearEvents clears the events list without returning them."""
         # Arrange
-        eventEmitter = EventEmitter()
-        testEvent = self.CreateTestDomainEvent("clear.event")
-        eventEmitter.EmitEvent(testEvent)
+        testEvent = make_event("clear.event")
+        event_emitter.EmitEvent(testEvent)
 
         # Verify event was added
-        assert len(eventEmitter.GetEvents()) == 1
+        assert len(event_emitter.GetEvents()) == 1
 
         # Act
-        result = eventEmitter.ClearEvents()
+        result = event_emitter.ClearEvents()
 
         # Assert
         assert result is None
-        assert len(eventEmitter.events) == 0
-        assert len(eventEmitter.GetEvents()) == 0
+        assert len(event_emitter.events) == 0
+        assert len(event_emitter.GetEvents()) == 0
 
-    def test_ClearEventsWithNoEvents_ShouldRemainEmptyWithoutReturning(self):
+    def test_ClearEventsWithNoEvents_ShouldRemainEmptyWithoutReturning(self, event_emitter):
         """Test that ClearEvents on empty list remains empty without returning anything."""
-        # Arrange
-        eventEmitter = EventEmitter()
-
         # Act
-        result = eventEmitter.ClearEvents()
+        result = event_emitter.ClearEvents()
 
         # Assert
         assert result is None
-        assert len(eventEmitter.events) == 0
+        assert len(event_emitter.events) == 0
 
-    def test_ReleaseEventsAfterClearEvents_ShouldReturnEmptyList(self):
+    def test_ReleaseEventsAfterClearEvents_ShouldReturnEmptyList(self, event_emitter, make_event):
         """Test that ReleaseEvents after ClearEvents returns empty list."""
         # Arrange
-        eventEmitter = EventEmitter()
-        testEvent = self.CreateTestDomainEvent("clear.then.release")
-        eventEmitter.EmitEvent(testEvent)
-        eventEmitter.ClearEvents()
+        testEvent = make_event("clear.then.release")
+        event_emitter.EmitEvent(testEvent)
+        event_emitter.ClearEvents()
 
         # Act
-        releasedEvents = eventEmitter.ReleaseEvents()
+        releasedEvents = event_emitter.ReleaseEvents()
 
         # Assert
         assert releasedEvents == []
-        assert len(eventEmitter.events) == 0
+        assert len(event_emitter.events) == 0
 
-    def test_EmitEventAfterReleaseEvents_ShouldStartFreshEventsList(self):
+    def test_EmitEventAfterReleaseEvents_ShouldStartFreshEventsList(self, event_emitter, make_event):
         """Test that EmitEvent after ReleaseEvents starts a fresh events list."""
         # Arrange
-        eventEmitter = EventEmitter()
-        firstEvent = self.CreateTestDomainEvent("first.batch")
-        eventEmitter.EmitEvent(firstEvent)
-        eventEmitter.ReleaseEvents()
+        firstEvent = make_event("first.batch")
+        event_emitter.EmitEvent(firstEvent)
+        event_emitter.ReleaseEvents()
 
-        secondEvent = self.CreateTestDomainEvent("second.batch")
+        secondEvent = make_event("second.batch")
 
         # Act
-        eventEmitter.EmitEvent(secondEvent)
+        event_emitter.EmitEvent(secondEvent)
 
         # Assert
-        events = eventEmitter.GetEvents()
+        events = event_emitter.GetEvents()
         assert len(events) == 1
         assert events[0] == secondEvent
         assert events[0] != firstEvent
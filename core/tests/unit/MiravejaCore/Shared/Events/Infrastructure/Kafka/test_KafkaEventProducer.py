@@ -246,7 +246,8 @@ class TestKafkaEventProducer:
 
         # Assert
         assert mockProducerInstance.send_and_wait.call_count == 3
-        mockProducerInstance.flush.assert_called_once()
+        # Each send already waits for delivery; flushing would cut short batching of concurrent dispatches
+        mockProducerInstance.flush.assert_not_called()
         mockLogger.Info.assert_any_call("Producing 3 events to Kafka.")
         mockLogger.Info.assert_any_call("Successfully produced 3 events to Kafka.")
 
@@ -427,39 +428,10 @@ class TestKafkaEventProducer:
         await producer.ProduceAll(testEvents)
 
         # Assert
-        mockProducerInstance.flush.assert_called_once()
+        mockProducerInstance.flush.assert_not_called()
         # Should log the error
         mockLogger.Error.assert_any_call("Kafka produce error for event batch: Kafka connection error")
 
-    @patch("MiravejaCore.Shared.Events.Infrastructure.Kafka.Services.AIOKafkaProducer")
-    @pytest.mark.asyncio
-    async def test_ProduceAllWithCompleteFailure_ShouldRaiseException(self, mock_aiokafka_producer):
-        """Test that ProduceAll raises exception on complete failure."""
-        # Arrange
-        mockLogger = self.CreateMockLogger()
-        testConfig = self.CreateTestKafkaConfig()
-
-        # Create mock producer with async methods
-        mockProducerInstance = AsyncMock()
-        mockProducerInstance.start = AsyncMock()
-        mockProducerInstance.flush = AsyncMock(side_effect=Exception("Flush failed"))
-        mock_aiokafka_producer.return_value = mockProducerInstance
-
-        producer = KafkaEventProducer(testConfig, mockLogger)
-        await producer._InitializeKafkaProducer()
-
-        # Mock Produce to succeed
-        producer.Produce = AsyncMock()
-
-        testEvents: List[DomainEvent] = [EventFirstEvent(aggregateId="agg-1")]
-
-        # Act & Assert
-        with pytest.raises(Exception) as exc_info:
-            await producer.ProduceAll(testEvents)
-
-        assert "Flush failed" in str(exc_info.value)
-        mockLogger.Error.assert_any_call("Failed to produce events to Kafka: Flush failed")
-
     @patch("MiravejaCore.Shared.Events.Infrastructure.Kafka.Services.AIOKafkaProducer")
     @pytest.mark.asyncio
     async def test_CloseWithException_ShouldLogErrorAndReraise(self, mock_aiokafka_producer):
@@ -3,7 +3,7 @@ from unittest.mock import patch, MagicMock
 from logging import Logger as PythonLogger
 import logging
 
-from MiravejaCore.Shared.Logging.Models import Logger
+from MiravejaCore.Shared.Logging.Models import LazyJson, Logger
 
 
 class TestLogger:
@@ -221,3 +221,56 @@ class TestLogger:
         assert callable(logger.Warning)
         assert callable(logger.Error)
         assert callable(logger.Critical)
+
+
+class TestLazyJson:
+    """Test cases for LazyJson deferred log argument."""
+
+    def test_CreateLazyJson_ShouldNotDumpModel(self):
+        """Test that wrapping a model does not serialize it."""
+        # Arrange
+        model = MagicMock()
+
+        # Act
+        LazyJson(model)
+
+        # Assert
+        model.model_dump_json.assert_not_called()
+
+    def test_StrLazyJson_ShouldDumpModelAsCompactJson(self):
+        """Test that formatting the wrapper dumps the model as compact JSON by default."""
+        # Arrange
+        model = MagicMock()
+        model.model_dump_json.return_value = "{}"
+
+        # Act
+        result = str(LazyJson(model))
+
+        # Assert
+        assert result == "{}"
+        model.model_dump_json.assert_called_once_with(indent=None)
+
+    def test_StrLazyJsonWithIndent_ShouldDumpModelWithIndent(self):
+        """Test that an explicit indent is passed through to the JSON dump."""
+        # Arrange
+        model = MagicMock()
+        model.model_dump_json.return_value = "{}"
+
+        # Act
+        str(LazyJson(model, indent=4))
+
+        # Assert
+        model.model_dump_json.assert_called_once_with(indent=4)
+
+    def test_InfoWithLazyJsonBelowThreshold_ShouldNotDumpModel(self):
+        """Test that a LazyJson argument is never serialized when the logger drops the record."""
+        # Arrange
+        logger = Logger("lazy-json-logger")
+        logger._logger.setLevel(logging.WARNING)  # type: ignore
+        model = MagicMock()
+
+        # Act
+        logger.Info("Payload: %s", LazyJson(model))
+
+        # Assert
+        model.model_dump_json.assert_not_called()
@@ -87,6 +87,13 @@ class WorkerDependencies:
                     str(databaseConfig.connectionUrl),
                     pool_size=databaseConfig.maxConnections,
                     max_overflow=databaseConfig.maxConnections // 2,
+                    pool_pre_ping=True,
+                ),
+                # Session factory bound to the pooled engine, built once
+                sessionmaker.__name__: lambda container: sessionmaker(bind=container.Get(DatabaseEngine.__name__)),
+                # Unit of Work Factory - stateless, every manager it creates draws from the engine's pool
+                SqlDatabaseManagerFactory.__name__: lambda container: SqlDatabaseManagerFactory(
+                    resourceFactory=lambda: container.Get(DatabaseSession.__name__),
                 ),
                 # Boto3 S3 Client for MinIO/S3 operations
                 Boto3Session.client.__name__: lambda container: Boto3Session().client(
@@ -111,10 +118,6 @@ class WorkerDependencies:
         container.RegisterFactories(
             {
                 # Database Session - new session per operation
-                DatabaseSession.__name__: lambda container: sessionmaker(bind=container.Get(DatabaseEngine.__name__))(),
-                # Unit of Work Factory for transactional operations
-                SqlDatabaseManagerFactory.__name__: lambda container: SqlDatabaseManagerFactory(
-                    resourceFactory=lambda: container.Get(DatabaseSession.__name__),
-                ),
+                DatabaseSession.__name__: lambda container: container.Get(sessionmaker.__name__)(),
             }
         )
@@ -4,6 +4,7 @@ from dotenv import load_dotenv
 from MiravejaCore.Gallery.Domain.Events import DomainEvent
 from MiravejaCore.Shared.Configuration import AppConfig
 from MiravejaCore.Shared.DI.Models import Container
+from MiravejaCore.Shared.Events.Application.EventDispatcher import EventDispatcher
 from MiravejaCore.Shared.Events.Infrastructure.EventsDependencies import EventsDependencies
 from MiravejaCore.Shared.Events.Infrastructure.Kafka.Services import IEventSubscriber, KafkaEventConsumer
 from MiravejaCore.Shared.Logging.Factories import LoggerFactory
@@ -74,6 +75,9 @@ async def Main():
         logger.Critical(f"Worker encountered a critical error: {str(e)}")
         await eventConsumer.Stop()
         raise
+    finally:
+        # Let events dispatched in the background finish publishing before the worker exits
+        await EventDispatcher.WaitForBackgroundDispatches()
 
 
 if __name__ == "__main__":